@@ -14,17 +14,24 @@ from alembic import context
 # Add src directory to path so we can import veriqko package
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
 
-from veriqko.config import get_settings
-
 # Import all models to ensure they are registered with Base
+from veriqko.archive.models import ArchivedJob  # noqa: F401
+from veriqko.config import get_settings
 from veriqko.db.base import Base
 from veriqko.devices.models import Device  # noqa: F401
 from veriqko.evidence.models import Evidence  # noqa: F401
 from veriqko.jobs.models import Job, JobHistory, TestResult, TestStep  # noqa: F401
+from veriqko.outbox.models import OutboxEvent  # noqa: F401
 from veriqko.printing.models import LabelTemplate, Printer  # noqa: F401
 from veriqko.reports.models import Report  # noqa: F401
 from veriqko.settings.models import SystemSetting  # noqa: F401
 from veriqko.stations.models import Station  # noqa: F401
+from veriqko.stats.models import (  # noqa: F401
+    DefectRollup,
+    JobStatusCounter,
+    RollupWatermark,
+    TechnicianStageRollup,
+)
 from veriqko.users.models import User  # noqa: F401
 
 config = context.config
@@ -0,0 +1,24 @@
+"""Add Job keyset pagination index
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '016'
+down_revision: str | None = '015'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_jobs_created_at_id', 'jobs', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_jobs_created_at_id', table_name='jobs')
@@ -0,0 +1,37 @@
+"""Add trigram search indexes on jobs
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-10-17 09:30:00.000000
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '017'
+down_revision: str | None = '016'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+TRGM_COLUMNS = ['serial_number', 'batch_id', 'customer_reference']
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for column in TRGM_COLUMNS:
+        op.create_index(
+            f'ix_jobs_{column}_trgm',
+            'jobs',
+            [column],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={column: 'gin_trgm_ops'},
+        )
+
+
+def downgrade() -> None:
+    for column in reversed(TRGM_COLUMNS):
+        op.drop_index(f'ix_jobs_{column}_trgm', table_name='jobs')
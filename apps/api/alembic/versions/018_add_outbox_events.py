@@ -0,0 +1,71 @@
+"""Add transactional outbox table
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '018'
+down_revision: str | None = '017'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "DO $$ BEGIN "
+        "CREATE TYPE outbox_status AS ENUM ('pending', 'processing', 'done', 'failed'); "
+        "EXCEPTION WHEN duplicate_object THEN null; END $$;"
+    )
+
+    op.create_table('outbox_events',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('effect', sa.String(length=100), nullable=False),
+        sa.Column('payload', sa.JSON(), nullable=False),
+        sa.Column(
+            'status',
+            postgresql.ENUM(
+                'pending', 'processing', 'done', 'failed', name='outbox_status', create_type=False
+            ),
+            nullable=False,
+            server_default='pending',
+        ),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('next_attempt_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('locked_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('processed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column(
+            'created_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=False,
+        ),
+        sa.Column(
+            'updated_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'ix_outbox_events_status_next_attempt_at',
+        'outbox_events',
+        ['status', 'next_attempt_at'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_outbox_events_status_next_attempt_at', table_name='outbox_events')
+    op.drop_table('outbox_events')
+    op.execute("DROP TYPE IF EXISTS outbox_status")
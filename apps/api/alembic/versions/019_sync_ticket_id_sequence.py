@@ -0,0 +1,32 @@
+"""Sync the ticket_id identity sequence with existing tickets
+
+Ticket IDs used to be assigned as max(ticket_id) + 1 in the application,
+which never advanced the identity sequence. Move it past the highest
+ticket so nextval() can take over.
+
+Revision ID: 019
+Revises: 018
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '019'
+down_revision: str | None = '018'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "SELECT setval(pg_get_serial_sequence('jobs', 'ticket_id'), "
+        "GREATEST((SELECT max(ticket_id) FROM jobs), 10000))"
+    )
+
+
+def downgrade() -> None:
+    # Sequence position is not restored; max() allocation ignores it anyway
+    pass
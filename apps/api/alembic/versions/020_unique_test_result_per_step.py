@@ -0,0 +1,49 @@
+"""Unique test result per job and step
+
+Collapses duplicate results (keeping the most recent, with its siblings'
+evidence re-pointed to it) before adding the constraint that batch
+submission upserts against.
+
+Revision ID: 020
+Revises: 019
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '020'
+down_revision: str | None = '019'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+RANKED = """
+    WITH ranked AS (
+        SELECT id, first_value(id) OVER (
+            PARTITION BY job_id, test_step_id ORDER BY performed_at DESC, id DESC
+        ) AS keep_id
+        FROM test_results
+    )
+"""
+
+
+def upgrade() -> None:
+    op.execute(
+        RANKED
+        + "UPDATE evidence e SET test_result_id = r.keep_id FROM ranked r "
+        "WHERE e.test_result_id = r.id AND r.id <> r.keep_id"
+    )
+    op.execute(
+        RANKED
+        + "DELETE FROM test_results t USING ranked r "
+        "WHERE t.id = r.id AND r.id <> r.keep_id"
+    )
+    op.create_unique_constraint(
+        'uq_test_results_job_step', 'test_results', ['job_id', 'test_step_id']
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_test_results_job_step', 'test_results', type_='unique')
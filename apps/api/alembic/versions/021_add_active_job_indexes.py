@@ -0,0 +1,43 @@
+"""Add partial indexes over active jobs
+
+Revision ID: 021
+Revises: 020
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '021'
+down_revision: str | None = '020'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Must stay identical to veriqko.jobs.models.ACTIVE_JOB_PREDICATE
+ACTIVE_JOB_PREDICATE = "status NOT IN ('completed', 'failed') AND deleted_at IS NULL"
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_jobs_active_station_updated_at',
+        'jobs',
+        ['current_station_id', 'updated_at'],
+        unique=False,
+        postgresql_where=sa.text(ACTIVE_JOB_PREDICATE),
+    )
+    op.create_index(
+        'ix_jobs_active_sla_due_at',
+        'jobs',
+        ['sla_due_at'],
+        unique=False,
+        postgresql_where=sa.text(ACTIVE_JOB_PREDICATE),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_jobs_active_sla_due_at', table_name='jobs')
+    op.drop_index('ix_jobs_active_station_updated_at', table_name='jobs')
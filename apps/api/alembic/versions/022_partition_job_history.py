@@ -0,0 +1,121 @@
+"""Partition job_history by month on changed_at
+
+Rebuilds job_history as a RANGE-partitioned table with one partition per
+month (plus a default partition as a safety net), copies the existing
+rows over, and adds a BRIN index on changed_at. Later partitions are
+created by veriqko.cron.history_partitions.
+
+Revision ID: 022
+Revises: 021
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from collections.abc import Sequence
+from datetime import UTC, date, datetime
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '022'
+down_revision: str | None = '021'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+MONTHS_AHEAD = 3
+
+COLUMNS = (
+    "id, job_id, from_status, to_status, changed_by_id, changed_at, station_id, notes, "
+    "transition_data"
+)
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE job_history RENAME TO job_history_unpartitioned")
+    op.execute(
+        "ALTER TABLE job_history_unpartitioned "
+        "RENAME CONSTRAINT job_history_pkey TO job_history_unpartitioned_pkey"
+    )
+    op.execute("DROP INDEX IF EXISTS idx_job_history_job")
+    op.execute("DROP INDEX IF EXISTS idx_job_history_changed_at")
+
+    op.execute("""
+        CREATE TABLE job_history (
+            id UUID NOT NULL,
+            job_id UUID NOT NULL REFERENCES jobs (id) ON DELETE CASCADE,
+            from_status job_status,
+            to_status job_status NOT NULL,
+            changed_by_id UUID NOT NULL REFERENCES users (id),
+            changed_at TIMESTAMP WITH TIME ZONE NOT NULL,
+            station_id UUID REFERENCES stations (id),
+            notes TEXT,
+            transition_data JSONB,
+            PRIMARY KEY (id, changed_at)
+        ) PARTITION BY RANGE (changed_at)
+    """)
+    op.execute("CREATE TABLE job_history_default PARTITION OF job_history DEFAULT")
+
+    oldest = op.get_bind().execute(
+        sa.text("SELECT min(changed_at) FROM job_history_unpartitioned")
+    ).scalar()
+    this_month = datetime.now(UTC).date().replace(day=1)
+    month = oldest.date().replace(day=1) if oldest else this_month
+    last = _add_months(this_month, MONTHS_AHEAD)
+    while month <= last:
+        op.execute(
+            f"CREATE TABLE job_history_{month.year:04d}_{month.month:02d} "
+            f"PARTITION OF job_history FOR VALUES FROM ('{month.isoformat()} 00:00+00') "
+            f"TO ('{_add_months(month, 1).isoformat()} 00:00+00')"
+        )
+        month = _add_months(month, 1)
+
+    op.execute(
+        f"INSERT INTO job_history ({COLUMNS}) SELECT {COLUMNS} FROM job_history_unpartitioned"
+    )
+    op.execute("DROP TABLE job_history_unpartitioned")
+
+    op.create_index(
+        'ix_job_history_job_id_changed_at',
+        'job_history',
+        ['job_id', 'changed_at', 'id'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_job_history_changed_at_brin',
+        'job_history',
+        ['changed_at'],
+        unique=False,
+        postgresql_using='brin',
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE job_history RENAME TO job_history_partitioned")
+    op.execute(
+        "ALTER TABLE job_history_partitioned "
+        "RENAME CONSTRAINT job_history_pkey TO job_history_partitioned_pkey"
+    )
+    op.execute("""
+        CREATE TABLE job_history (
+            id UUID NOT NULL PRIMARY KEY,
+            job_id UUID NOT NULL REFERENCES jobs (id) ON DELETE CASCADE,
+            from_status job_status,
+            to_status job_status NOT NULL,
+            changed_by_id UUID NOT NULL REFERENCES users (id),
+            changed_at TIMESTAMP WITH TIME ZONE NOT NULL,
+            station_id UUID REFERENCES stations (id),
+            notes TEXT,
+            transition_data JSONB
+        )
+    """)
+    op.execute(f"INSERT INTO job_history ({COLUMNS}) SELECT {COLUMNS} FROM job_history_partitioned")
+    # Drops every attached partition with it
+    op.execute("DROP TABLE job_history_partitioned")
+    op.create_index('idx_job_history_job', 'job_history', ['job_id'], unique=False)
+    op.create_index('idx_job_history_changed_at', 'job_history', ['changed_at'], unique=False)
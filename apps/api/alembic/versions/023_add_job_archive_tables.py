@@ -0,0 +1,54 @@
+"""Add cold archive tables for finished jobs
+
+Each archive table copies its hot table's columns (no foreign keys) and
+adds archived_at. See veriqko.archive.models.
+
+Revision ID: 023
+Revises: 022
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '023'
+down_revision: str | None = '022'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# hot table -> (primary key, indexed column groups)
+ARCHIVES = {
+    'jobs': (['id'], [['serial_number'], ['completed_at']]),
+    'test_results': (['id'], [['job_id']]),
+    'evidence': (['id'], [['job_id']]),
+    'job_history': (['id', 'changed_at'], [['job_id']]),
+    'reports': (['id'], [['job_id'], ['access_token']]),
+}
+
+
+def upgrade() -> None:
+    for source, (primary_key, indexes) in ARCHIVES.items():
+        archive = f'{source}_archive'
+        # LIKE copies columns, types, NOT NULL and defaults; not identity, keys or FKs
+        op.execute(f'CREATE TABLE {archive} (LIKE {source} INCLUDING DEFAULTS)')
+        op.add_column(
+            archive,
+            sa.Column(
+                'archived_at',
+                sa.DateTime(timezone=True),
+                server_default=sa.text('now()'),
+                nullable=False,
+            ),
+        )
+        op.create_primary_key(f'{archive}_pkey', archive, primary_key)
+        for columns in indexes:
+            op.create_index(f"ix_{archive}_{'_'.join(columns)}", archive, columns, unique=False)
+
+
+def downgrade() -> None:
+    for source in reversed(ARCHIVES):
+        op.drop_table(f'{source}_archive')
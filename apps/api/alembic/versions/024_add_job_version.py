@@ -0,0 +1,31 @@
+"""Add optimistic concurrency version to jobs
+
+Revision ID: 024
+Revises: 023
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '024'
+down_revision: str | None = '023'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Constant default: no table rewrite, existing rows start at version 1
+    op.add_column('jobs', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+    op.add_column(
+        'jobs_archive', sa.Column('version', sa.Integer(), server_default='1', nullable=False)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('jobs_archive', 'version')
+    op.drop_column('jobs', 'version')
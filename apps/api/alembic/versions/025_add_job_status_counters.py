@@ -0,0 +1,48 @@
+"""Add job_status_counters rollup for the dashboard
+
+Revision ID: 025
+Revises: 024
+Create Date: 2026-10-17 19:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '025'
+down_revision: str | None = '024'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'job_status_counters',
+        sa.Column('bucket', sa.String(length=10), nullable=False),
+        sa.Column('status', postgresql.ENUM(name='job_status', create_type=False), nullable=False),
+        sa.Column('job_count', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.PrimaryKeyConstraint('bucket', 'status'),
+    )
+
+    # Seed: live jobs per status, and status entries per UTC day from history
+    op.execute("""
+        INSERT INTO job_status_counters (bucket, status, job_count)
+        SELECT 'total', status, count(*)
+        FROM jobs
+        WHERE deleted_at IS NULL
+        GROUP BY status
+    """)
+    op.execute("""
+        INSERT INTO job_status_counters (bucket, status, job_count)
+        SELECT to_char(changed_at AT TIME ZONE 'UTC', 'YYYY-MM-DD'), to_status, count(*)
+        FROM job_history
+        GROUP BY 1, 2
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('job_status_counters')
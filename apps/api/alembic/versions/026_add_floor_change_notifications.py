@@ -0,0 +1,44 @@
+"""Notify floor_changed on job and station writes
+
+Statement-level triggers: one notification per statement, and Postgres
+folds identical notifications within a transaction into one at commit.
+
+Revision ID: 026
+Revises: 025
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '026'
+down_revision: str | None = '025'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLES = ('jobs', 'stations')
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE FUNCTION notify_floor_changed() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('floor_changed', '');
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for table in TABLES:
+        op.execute(f"""
+            CREATE TRIGGER {table}_floor_changed
+            AFTER INSERT OR UPDATE OR DELETE ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION notify_floor_changed()
+        """)
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_floor_changed ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS notify_floor_changed()")
@@ -0,0 +1,67 @@
+"""Add defect_rollup for the defect heatmap
+
+The rollup starts empty: the first refresh finds no watermark and builds
+it from all hot and archived test results.
+
+Revision ID: 027
+Revises: 026
+Create Date: 2026-10-17 21:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '027'
+down_revision: str | None = '026'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'defect_rollup',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('device_model', sa.String(length=100), nullable=False),
+        sa.Column('test_step', sa.String(length=255), nullable=False),
+        sa.Column('failures', sa.Integer(), nullable=False),
+        sa.Column('total', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('day', 'device_model', 'test_step'),
+    )
+    op.create_index(
+        'ix_defect_rollup_device_model_day', 'defect_rollup', ['device_model', 'day'], unique=False
+    )
+
+    op.create_table(
+        'rollup_watermarks',
+        sa.Column('name', sa.String(length=100), nullable=False),
+        sa.Column('value', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('name'),
+    )
+
+    # Refresh: results written since the watermark, and the days they fall on
+    op.create_index('ix_test_results_created_at', 'test_results', ['created_at'], unique=False)
+    op.create_index('ix_test_results_updated_at', 'test_results', ['updated_at'], unique=False)
+    op.create_index(
+        'ix_test_results_archive_created_at', 'test_results_archive', ['created_at'], unique=False
+    )
+    op.create_index(
+        'ix_jobs_deleted_at',
+        'jobs',
+        ['deleted_at'],
+        unique=False,
+        postgresql_where=sa.text('deleted_at IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_jobs_deleted_at', table_name='jobs')
+    op.drop_index('ix_test_results_archive_created_at', table_name='test_results_archive')
+    op.drop_index('ix_test_results_updated_at', table_name='test_results')
+    op.drop_index('ix_test_results_created_at', table_name='test_results')
+    op.drop_table('rollup_watermarks')
+    op.drop_index('ix_defect_rollup_device_model_day', table_name='defect_rollup')
+    op.drop_table('defect_rollup')
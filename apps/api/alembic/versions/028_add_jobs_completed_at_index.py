@@ -0,0 +1,46 @@
+"""Add covering completed_at index for throughput series
+
+Revision ID: 028
+Revises: 027
+Create Date: 2026-10-17 22:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '028'
+down_revision: str | None = '027'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Must stay identical to veriqko.jobs.models.STAGE_TIMESTAMP_COLUMNS
+STAGE_TIMESTAMP_COLUMNS = [
+    'created_at',
+    'intake_started_at',
+    'intake_completed_at',
+    'reset_started_at',
+    'reset_completed_at',
+    'functional_started_at',
+    'functional_completed_at',
+    'qc_started_at',
+    'qc_completed_at',
+]
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_jobs_completed_at_stages',
+        'jobs',
+        ['completed_at'],
+        unique=False,
+        postgresql_where=sa.text('completed_at IS NOT NULL AND deleted_at IS NULL'),
+        postgresql_include=STAGE_TIMESTAMP_COLUMNS,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_jobs_completed_at_stages', table_name='jobs')
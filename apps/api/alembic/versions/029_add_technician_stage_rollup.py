@@ -0,0 +1,40 @@
+"""Add technician_stage_rollup for the leaderboard
+
+The rollup starts empty: the first refresh finds no watermark and builds
+it from all hot and archived job history.
+
+Revision ID: 029
+Revises: 028
+Create Date: 2026-10-17 23:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '029'
+down_revision: str | None = '028'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'technician_stage_rollup',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('user_id', postgresql.UUID(as_uuid=False), nullable=False),
+        sa.Column('stage', postgresql.ENUM(name='job_status', create_type=False), nullable=False),
+        sa.Column('jobs', sa.Integer(), nullable=False),
+        sa.Column('total_seconds', sa.Float(), nullable=False),
+        sa.Column('median_seconds', sa.Float(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('day', 'user_id', 'stage'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('technician_stage_rollup')
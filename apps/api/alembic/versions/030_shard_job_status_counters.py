@@ -0,0 +1,50 @@
+"""Shard job_status_counters rows
+
+Existing counters become shard 0 of their counter.
+
+Revision ID: 030
+Revises: 029
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '030'
+down_revision: str | None = '029'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'job_status_counters',
+        sa.Column('shard', sa.SmallInteger(), nullable=False, server_default='0'),
+    )
+    op.drop_constraint('job_status_counters_pkey', 'job_status_counters', type_='primary')
+    op.create_primary_key(
+        'job_status_counters_pkey', 'job_status_counters', ['bucket', 'status', 'shard']
+    )
+
+
+def downgrade() -> None:
+    # Fold the shards back into one row per counter
+    op.execute("""
+        CREATE TEMPORARY TABLE job_status_counter_sums AS
+        SELECT bucket, status, sum(job_count) AS job_count
+        FROM job_status_counters
+        GROUP BY bucket, status
+    """)
+    op.execute("DELETE FROM job_status_counters")
+    op.drop_constraint('job_status_counters_pkey', 'job_status_counters', type_='primary')
+    op.drop_column('job_status_counters', 'shard')
+    op.execute("""
+        INSERT INTO job_status_counters (bucket, status, job_count)
+        SELECT bucket, status, job_count FROM job_status_counter_sums
+    """)
+    op.execute("DROP TABLE job_status_counter_sums")
+    op.create_primary_key('job_status_counters_pkey', 'job_status_counters', ['bucket', 'status'])
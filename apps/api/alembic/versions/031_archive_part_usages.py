@@ -0,0 +1,53 @@
+"""Archive part usages and index the archive cutoff
+
+Jobs that used parts can now be archived: their part_usages rows move to
+part_usages_archive. The partial expression index lets the archiver find
+the oldest finished jobs without scanning jobs.
+
+Revision ID: 031
+Revises: 030
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '031'
+down_revision: str | None = '030'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Same shape as the archive tables of migration 023
+    op.execute('CREATE TABLE part_usages_archive (LIKE part_usages INCLUDING DEFAULTS)')
+    op.add_column(
+        'part_usages_archive',
+        sa.Column(
+            'archived_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=False,
+        ),
+    )
+    op.create_primary_key('part_usages_archive_pkey', 'part_usages_archive', ['id'])
+    op.create_index(
+        'ix_part_usages_archive_job_id', 'part_usages_archive', ['job_id'], unique=False
+    )
+
+    op.create_index(
+        'ix_jobs_finished_archive_cutoff',
+        'jobs',
+        [sa.text('coalesce(completed_at, updated_at)')],
+        unique=False,
+        postgresql_where=sa.text("status IN ('completed', 'failed')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_jobs_finished_archive_cutoff', table_name='jobs')
+    op.drop_table('part_usages_archive')
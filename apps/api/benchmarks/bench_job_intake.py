@@ -0,0 +1,77 @@
+"""
+Benchmark pallet intake: JobService.create_batch vs JobService.bulk_intake.
+
+Intakes a pallet of IMEI-like serials both ways and reports jobs/second.
+Each run is rolled back, so the database is left unchanged. GSMA lookups
+are simulated with a fixed latency (BENCH_GSMA_LATENCY_MS) to stand in for
+the real API round trip.
+
+Needs a database with at least one user:
+    DATABASE_URL=postgresql+asyncpg://.../veriqko_bench python benchmarks/bench_job_intake.py
+"""
+
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from sqlalchemy import select
+
+import veriqko.models  # noqa: F401
+from veriqko.db.base import async_session_factory
+from veriqko.integrations.gsma import gsma_client
+from veriqko.jobs.schemas import JobBatchCreate
+from veriqko.jobs.service import JobService
+from veriqko.users.models import User
+
+PALLET_SIZE = int(os.environ.get("BENCH_PALLET_SIZE", 2000))
+GSMA_LATENCY_MS = float(os.environ.get("BENCH_GSMA_LATENCY_MS", 20))
+
+
+async def fake_blacklist_check(imei: str) -> bool:
+    await asyncio.sleep(GSMA_LATENCY_MS / 1000)
+    return imei.endswith("666")
+
+
+async def measure(name: str, user_id: str) -> float:
+    """Jobs per second for one intake method."""
+    data = JobBatchCreate(
+        serial_numbers=[f"35{i:012d}1" for i in range(PALLET_SIZE)],
+        batch_id=f"BENCH-{name}",
+    )
+
+    async with async_session_factory() as session:
+        service = JobService(session)
+        started = time.perf_counter()
+        await getattr(service, name)(data, user_id)
+        elapsed = time.perf_counter() - started
+        await session.rollback()
+
+    return PALLET_SIZE / elapsed
+
+
+async def bench() -> None:
+    async with async_session_factory() as session:
+        user_id = await session.scalar(select(User.id).limit(1))
+    if user_id is None:
+        raise SystemExit("No users found; seed the database first")
+
+    gsma_client.check_imei_blacklist = fake_blacklist_check
+
+    results = {}
+    for name in ("create_batch", "bulk_intake"):
+        results[name] = await measure(name, user_id)
+        print(
+            f"{name:<13} {results[name]:10.0f} jobs/s  "
+            f"(pallet={PALLET_SIZE}, gsma={GSMA_LATENCY_MS}ms)"
+        )
+
+    print(f"bulk_intake speedup: {results['bulk_intake'] / results['create_batch']:.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(bench())
@@ -0,0 +1,80 @@
+"""
+Benchmark the job list query: ORM hydration vs column projection.
+
+Compares JobRepository.list (ORM objects + eager-loaded relations) with
+JobRepository.list_rows (flat column projection) at page sizes 100 and
+1000, reporting rows/second and peak Python memory per page.
+
+Needs a database with at least 1000 jobs (see bench_job_search.py to seed):
+    DATABASE_URL=postgresql+asyncpg://.../veriqko_bench python benchmarks/bench_job_list.py
+"""
+
+import asyncio
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+import veriqko.models  # noqa: F401
+from veriqko.db.base import async_session_factory
+from veriqko.jobs.service import JobRepository
+
+PAGE_SIZES = (100, 1000)
+ITERATIONS = int(os.environ.get("BENCH_ITERATIONS", 20))
+
+
+async def measure_rate(method, page_size: int) -> float:
+    """Rows per second for one list method."""
+    total_rows = 0
+    started = time.perf_counter()
+
+    for _ in range(ITERATIONS):
+        # Fresh session per page so the identity map does not carry over
+        async with async_session_factory() as session:
+            rows = await method(JobRepository(session))(limit=page_size)
+            total_rows += len(rows)
+
+    return total_rows / (time.perf_counter() - started)
+
+
+async def measure_peak(method, page_size: int) -> int:
+    """Peak Python memory allocated while fetching one page."""
+    async with async_session_factory() as session:
+        tracemalloc.start()
+        await method(JobRepository(session))(limit=page_size)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return peak
+
+
+async def bench() -> None:
+    methods = {
+        "orm": lambda repo: repo.list,
+        "projection": lambda repo: repo.list_rows,
+    }
+
+    for page_size in PAGE_SIZES:
+        results = {}
+        for name, method in methods.items():
+            # Warm up connection pool and statement cache
+            await measure_rate(method, page_size)
+            results[name] = (
+                await measure_rate(method, page_size),
+                await measure_peak(method, page_size),
+            )
+
+        for name, (rate, peak) in results.items():
+            print(
+                f"page={page_size:<5} {name:<11} {rate:10.0f} rows/s  "
+                f"peak={peak / 1024:8.1f} KiB"
+            )
+        speedup = results["projection"][0] / results["orm"][0]
+        print(f"page={page_size:<5} projection speedup: {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(bench())
@@ -0,0 +1,95 @@
+"""
+Benchmark job search latency against a large jobs table.
+
+Seeds synthetic jobs (default 5M) into the database pointed to by
+DATABASE_URL if it holds fewer rows, then times JobRepository.list searches
+for each query shape the search planner distinguishes.
+
+Run against a scratch database only:
+    DATABASE_URL=postgresql+asyncpg://.../veriqko_bench python benchmarks/bench_job_search.py
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from sqlalchemy import func, select, text
+
+import veriqko.models  # noqa: F401
+from veriqko.db.base import async_session_factory
+from veriqko.jobs.models import Job
+from veriqko.jobs.service import JobRepository
+
+TARGET_ROWS = int(os.environ.get("BENCH_ROWS", 5_000_000))
+ITERATIONS = int(os.environ.get("BENCH_ITERATIONS", 50))
+BUDGET_MS = 20.0
+
+SEARCHES = {
+    "imei": "356938035643809",
+    "ticket_id": "2500000",
+    "serial substring": "N-0042",
+    "batch substring": "BATCH-17",
+    "short term": "SN",
+}
+
+
+async def seed(session) -> None:
+    count = await session.scalar(select(func.count(Job.id)))
+    if count >= TARGET_ROWS:
+        return
+
+    print(f"Seeding {TARGET_ROWS - count} jobs...")
+    await session.execute(text(
+        """
+        INSERT INTO jobs (id, serial_number, imei, batch_id, customer_reference, status,
+                          picea_mdm_locked, picea_erase_confirmed, is_fully_tested,
+                          created_at, updated_at)
+        SELECT gen_random_uuid(),
+               'SN-' || lpad(n::text, 8, '0'),
+               '35693803' || lpad(n::text, 7, '0'),
+               'BATCH-' || (n / 500),
+               'customer' || (n % 1000) || '@example.com',
+               'completed',
+               false, false, true,
+               now() - (n || ' seconds')::interval,
+               now()
+        FROM generate_series(:start, :stop) AS n
+        """
+    ), {"start": count + 1, "stop": TARGET_ROWS})
+    await session.commit()
+    await session.execute(text("ANALYZE jobs"))
+
+
+async def bench() -> None:
+    async with async_session_factory() as session:
+        await seed(session)
+        repo = JobRepository(session)
+
+        failed = False
+        for name, term in SEARCHES.items():
+            # Warm up caches once before measuring
+            await repo.list(search=term, limit=50)
+
+            timings = []
+            for _ in range(ITERATIONS):
+                started = time.perf_counter()
+                await repo.list(search=term, limit=50)
+                timings.append((time.perf_counter() - started) * 1000)
+
+            p50 = statistics.median(timings)
+            p95 = statistics.quantiles(timings, n=20)[-1]
+            status = "OK" if p95 < BUDGET_MS else "SLOW"
+            failed = failed or p95 >= BUDGET_MS
+            print(f"{name:<18} p50={p50:7.2f} ms  p95={p95:7.2f} ms  [{status}]")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    asyncio.run(bench())
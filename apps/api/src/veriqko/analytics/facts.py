@@ -0,0 +1,325 @@
+"""
+Incremental export of job and test result facts as partitioned Parquet.
+
+Layout in the storage backend (Hive-style, one partition per UTC day a
+job finished, as COMPLETED or FAILED):
+
+    {prefix}/job_facts/finished_date=YYYY-MM-DD/part-0.parquet
+    {prefix}/test_result_facts/finished_date=YYYY-MM-DD/part-0.parquet
+
+Each run rewrites the partitions of the days that changed since the last
+run, so files can be read at any time and never hold duplicates.
+"""
+
+import asyncio
+from datetime import UTC, date, datetime, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+
+import sqlalchemy as sa
+from sqlalchemy import extract, func, select, text, true, union
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from veriqko.archive.models import job_history_archive, jobs_archive, test_results_archive
+from veriqko.devices.models import Brand, Device, GadgetType
+from veriqko.evidence.storage import Storage
+from veriqko.jobs.models import (
+    INACTIVE_JOB_STATUSES,
+    Job,
+    JobHistory,
+    JobStatus,
+    TestResult,
+    TestResultStatus,
+    TestStep,
+)
+from veriqko.stats.rollups import advance_watermark, read_watermark, utc_day
+from veriqko.stats.throughput import STAGES, TOTAL
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # optional: pip install 'veriqko-api[analytics]'
+    pa = pq = None
+
+WATERMARK = "fact_export"
+PARQUET_MEDIA_TYPE = "application/vnd.apache.parquet"
+# (jobs, test results, history) of the hot and the archive tier
+TIERS = (
+    (Job.__table__, TestResult.__table__, JobHistory.__table__),
+    (jobs_archive, test_results_archive, job_history_archive),
+)
+
+# (column, Arrow type) in file order
+JOB_FACT_COLUMNS = [
+    ("job_id", "string"),
+    ("ticket_id", "int64"),
+    ("serial_number", "string"),
+    ("imei", "string"),
+    ("status", "string"),
+    ("brand", "string"),
+    ("device_type", "string"),
+    ("device_model", "string"),
+    ("customer_reference", "string"),
+    ("batch_id", "string"),
+    ("assigned_technician_id", "string"),
+    ("qc_technician_id", "string"),
+    ("is_fully_tested", "bool"),
+    ("created_at", "timestamp"),
+    ("completed_at", "timestamp"),
+    ("finished_at", "timestamp"),
+    *((f"{name.lower()}_seconds", "float64") for name in STAGES),
+    ("total_seconds", "float64"),
+    ("tests_passed", "int64"),
+    ("tests_failed", "int64"),
+    ("tests_skipped", "int64"),
+]
+TEST_RESULT_FACT_COLUMNS = [
+    ("result_id", "string"),
+    ("job_id", "string"),
+    ("serial_number", "string"),
+    ("job_status", "string"),
+    ("brand", "string"),
+    ("device_model", "string"),
+    ("test_step_id", "string"),
+    ("test_step", "string"),
+    ("stage", "string"),
+    ("status", "string"),
+    ("performed_by_id", "string"),
+    ("performed_at", "timestamp"),
+    ("created_at", "timestamp"),
+    ("finished_at", "timestamp"),
+]
+
+
+def _failed_at(jobs: sa.Table, history: sa.Table) -> sa.ScalarSelect:
+    # FAILED is terminal, so its history entry never moves
+    return (
+        select(func.max(history.c.changed_at))
+        .where(history.c.job_id == jobs.c.id, history.c.to_status == JobStatus.FAILED)
+        .scalar_subquery()
+    )
+
+
+def finished_at(jobs: sa.Table, history: sa.Table) -> sa.ColumnElement:
+    """When a finished job finished: completed_at, or its FAILED transition."""
+    return func.coalesce(jobs.c.completed_at, _failed_at(jobs, history))
+
+
+def _finished_on(jobs: sa.Table, history: sa.Table, day: date) -> list[sa.ColumnElement]:
+    start = datetime.combine(day, time.min, UTC)
+    end = datetime.combine(day + timedelta(days=1), time.min, UTC)
+    failed = select(history.c.job_id).where(
+        history.c.to_status == JobStatus.FAILED,
+        history.c.changed_at >= start,
+        history.c.changed_at < end,
+    )
+    # Range predicates rather than finished_at, so completed_at's index and
+    # history partition pruning apply
+    return [
+        jobs.c.status.in_(INACTIVE_JOB_STATUSES),
+        jobs.c.deleted_at.is_(None),
+        sa.or_(
+            sa.and_(jobs.c.completed_at >= start, jobs.c.completed_at < end),
+            sa.and_(jobs.c.completed_at.is_(None), jobs.c.id.in_(failed)),
+        ),
+    ]
+
+
+def job_facts_query(
+    jobs: sa.Table, results: sa.Table, history: sa.Table, day: date
+) -> sa.Select:
+    """One row per job finished on `day`, with device, stage durations and test outcomes."""
+    outcomes = (
+        select(
+            func.count().filter(results.c.status == TestResultStatus.PASS).label("tests_passed"),
+            func.count().filter(results.c.status == TestResultStatus.FAIL).label("tests_failed"),
+            func.count().filter(results.c.status == TestResultStatus.SKIP).label("tests_skipped"),
+        )
+        .where(results.c.job_id == jobs.c.id)
+        .lateral("outcomes")
+    )
+    durations = [
+        extract("epoch", jobs.c[completed] - jobs.c[started]).label(f"{name.lower()}_seconds")
+        for name, (started, completed) in {**STAGES, "total": TOTAL}.items()
+    ]
+    return (
+        select(
+            jobs.c.id.label("job_id"),
+            jobs.c.ticket_id,
+            jobs.c.serial_number,
+            jobs.c.imei,
+            jobs.c.status,
+            Brand.name.label("brand"),
+            GadgetType.name.label("device_type"),
+            Device.model.label("device_model"),
+            jobs.c.customer_reference,
+            jobs.c.batch_id,
+            jobs.c.assigned_technician_id,
+            jobs.c.qc_technician_id,
+            jobs.c.is_fully_tested,
+            jobs.c.created_at,
+            jobs.c.completed_at,
+            finished_at(jobs, history).label("finished_at"),
+            *durations,
+            outcomes.c.tests_passed,
+            outcomes.c.tests_failed,
+            outcomes.c.tests_skipped,
+        )
+        .select_from(jobs)
+        .outerjoin(Device, jobs.c.device_id == Device.id)
+        .outerjoin(Brand, Device.brand_id == Brand.id)
+        .outerjoin(GadgetType, Device.type_id == GadgetType.id)
+        .outerjoin(outcomes, true())
+        .where(*_finished_on(jobs, history, day))
+        .order_by(jobs.c.id)
+    )
+
+
+def result_facts_query(
+    jobs: sa.Table, results: sa.Table, history: sa.Table, day: date
+) -> sa.Select:
+    """One row per test result of the jobs finished on `day`."""
+    return (
+        select(
+            results.c.id.label("result_id"),
+            results.c.job_id,
+            jobs.c.serial_number,
+            jobs.c.status.label("job_status"),
+            Brand.name.label("brand"),
+            Device.model.label("device_model"),
+            results.c.test_step_id,
+            TestStep.name.label("test_step"),
+            TestStep.station_type.label("stage"),
+            results.c.status,
+            results.c.performed_by_id,
+            results.c.performed_at,
+            results.c.created_at,
+            finished_at(jobs, history).label("finished_at"),
+        )
+        .select_from(results)
+        .join(jobs, jobs.c.id == results.c.job_id)
+        .join(TestStep, TestStep.id == results.c.test_step_id)
+        .outerjoin(Device, jobs.c.device_id == Device.id)
+        .outerjoin(Brand, Device.brand_id == Brand.id)
+        .where(*_finished_on(jobs, history, day))
+        .order_by(results.c.job_id, TestStep.sequence_order)
+    )
+
+
+def to_parquet(rows: list[Row], columns: list[tuple[str, str]]) -> bytes:
+    """Rows as a zstd-compressed Parquet file with a fixed schema, even when empty."""
+    types = {
+        "string": pa.string(),
+        "int64": pa.int64(),
+        "float64": pa.float64(),
+        "bool": pa.bool_(),
+        "timestamp": pa.timestamp("us", tz="UTC"),
+    }
+    schema = pa.schema([(name, types[kind]) for name, kind in columns])
+    data = {name: [_plain(getattr(row, name)) for row in rows] for name, _ in columns}
+    sink = pa.BufferOutputStream()
+    pq.write_table(pa.Table.from_pydict(data, schema=schema), sink, compression="zstd")
+    return sink.getvalue().to_pybytes()
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, Decimal):  # EXTRACT(EPOCH ...) is numeric
+        return float(value)
+    return value
+
+
+class FactExportService:
+    """
+    Writes job and test result facts for changed finish days.
+
+    Facts are read through `read_db` (the read replica when configured);
+    the watermark lives on the primary `db`. A replica lagging less than the
+    watermark's safety margin therefore misses nothing.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        storage: Storage,
+        prefix: str,
+        read_db: AsyncSession | None = None,
+    ):
+        if pq is None:
+            raise RuntimeError("Fact export needs pyarrow: pip install 'veriqko-api[analytics]'")
+        self.db = db
+        self.read_db = read_db or db
+        self.storage = storage
+        self.prefix = prefix
+
+    async def run(self, now: datetime | None = None) -> list[date] | None:
+        """
+        Export every finish day with new, changed or deleted facts since
+        the last run; without a watermark, every day. Returns the days
+        written, or None when another process holds the export.
+        """
+        now = now or datetime.now(UTC)
+        # One exporter at a time across processes; released at commit
+        lock = text("SELECT pg_try_advisory_xact_lock(hashtext(:name))")
+        if not await self.db.scalar(lock, {"name": WATERMARK}):
+            return None
+
+        since = await read_watermark(self.db, WATERMARK)
+        days = await self._all_days() if since is None else await self._touched_days(since)
+        for day in days:
+            await self.export_day(day)
+
+        await advance_watermark(self.db, WATERMARK, now)
+        return days
+
+    async def export_day(self, day: date) -> int:
+        """Rewrite both fact partitions of one finish day. Returns the job count."""
+        partitions = (
+            ("job_facts", job_facts_query, JOB_FACT_COLUMNS),
+            ("test_result_facts", result_facts_query, TEST_RESULT_FACT_COLUMNS),
+        )
+        jobs = 0
+        for name, query, columns in partitions:
+            rows = []
+            for tier in TIERS:
+                result = await self.read_db.execute(query(*tier, day))
+                rows.extend(result.all())
+            if name == "job_facts":
+                jobs = len(rows)
+
+            content = await asyncio.to_thread(to_parquet, rows, columns)
+            path = f"{self.prefix}/{name}/finished_date={day.isoformat()}/part-0.parquet"
+            await self.storage.put(path, content, PARQUET_MEDIA_TYPE)
+        return jobs
+
+    async def _all_days(self) -> list[date]:
+        stmt = union(
+            *(
+                select(utc_day(finished_at(jobs, history))).where(
+                    jobs.c.status.in_(INACTIVE_JOB_STATUSES), jobs.c.deleted_at.is_(None)
+                )
+                for jobs, _, history in TIERS
+            )
+        )
+        return sorted(day for day in (await self.read_db.scalars(stmt)).all() if day)
+
+    async def _touched_days(self, since: datetime) -> list[date]:
+        # Jobs completed or failed since, finished jobs deleted since, and
+        # finished jobs whose test results changed since
+        jobs, history = Job.__table__, JobHistory.__table__
+        day = utc_day(finished_at(jobs, history))
+        finished = jobs.c.status.in_(INACTIVE_JOB_STATUSES)
+        stmt = union(
+            select(utc_day(jobs.c.completed_at)).where(jobs.c.completed_at >= since),
+            select(utc_day(history.c.changed_at)).where(
+                history.c.to_status == JobStatus.FAILED, history.c.changed_at >= since
+            ),
+            select(day).where(finished, jobs.c.deleted_at >= since),
+            select(day)
+            .join(TestResult, TestResult.job_id == jobs.c.id)
+            .where(finished, TestResult.updated_at >= since),
+        )
+        return sorted(day for day in (await self.read_db.scalars(stmt)).all() if day)
@@ -0,0 +1,100 @@
+"""Cold archive tables for finished jobs."""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from sqlalchemy import DateTime, func
+from sqlalchemy.orm import relationship
+
+from veriqko.db.base import Base
+from veriqko.evidence.models import Evidence
+from veriqko.jobs.models import Job, JobHistory, TestResult
+from veriqko.parts.models import PartUsage
+from veriqko.reports.models import Report
+
+
+def _archive_table(source: sa.Table, *indexes: tuple[str, ...]) -> sa.Table:
+    """
+    Copy of `source`'s columns and primary key, plus `archived_at`.
+
+    Archive tables carry no foreign keys: rows are immutable once moved, and
+    the jobs they point at live in the archive too. A column added to a hot
+    table must be added to its archive table in the same migration.
+    """
+    name = f"{source.name}_archive"
+    columns = [
+        sa.Column(
+            column.name,
+            column.type,
+            key=column.key,
+            primary_key=column.primary_key,
+            nullable=column.nullable,
+        )
+        for column in source.columns
+    ]
+    return sa.Table(
+        name,
+        Base.metadata,
+        *columns,
+        sa.Column(
+            "archived_at", DateTime(timezone=True), nullable=False, server_default=func.now()
+        ),
+        *(sa.Index(f"ix_{name}_{'_'.join(cols)}", *cols) for cols in indexes),
+    )
+
+
+jobs_archive = _archive_table(Job.__table__, ("serial_number",), ("completed_at",))
+test_results_archive = _archive_table(TestResult.__table__, ("job_id",), ("created_at",))
+evidence_archive = _archive_table(Evidence.__table__, ("job_id",))
+job_history_archive = _archive_table(JobHistory.__table__, ("job_id",))
+reports_archive = _archive_table(Report.__table__, ("job_id",), ("access_token",))
+part_usages_archive = _archive_table(PartUsage.__table__, ("job_id",))
+
+# Hot table -> archive table, in the order rows are copied
+ARCHIVE_TABLES: dict[sa.Table, sa.Table] = {
+    Job.__table__: jobs_archive,
+    TestResult.__table__: test_results_archive,
+    Evidence.__table__: evidence_archive,
+    JobHistory.__table__: job_history_archive,
+    Report.__table__: reports_archive,
+    PartUsage.__table__: part_usages_archive,
+}
+
+
+class ArchivedJob(Base):
+    """Read-only view of an archived job, shaped like Job for the read endpoints."""
+
+    __table__ = jobs_archive
+
+    device = relationship(
+        "Device", primaryjoin="foreign(ArchivedJob.device_id) == Device.id", viewonly=True
+    )
+    current_station = relationship(
+        "Station",
+        primaryjoin="foreign(ArchivedJob.current_station_id) == Station.id",
+        viewonly=True,
+    )
+    assigned_technician = relationship(
+        "User", primaryjoin="foreign(ArchivedJob.assigned_technician_id) == User.id", viewonly=True
+    )
+    qc_technician = relationship(
+        "User", primaryjoin="foreign(ArchivedJob.qc_technician_id) == User.id", viewonly=True
+    )
+
+    def __repr__(self) -> str:
+        return f"<ArchivedJob {self.serial_number} ({self.status})>"
+
+
+class ArchivedReport(Base):
+    """Read-only view of an archived report, for public report links."""
+
+    __table__ = reports_archive
+
+    job = relationship(
+        "ArchivedJob",
+        primaryjoin="foreign(ArchivedReport.job_id) == ArchivedJob.id",
+        viewonly=True,
+    )
+
+    def __repr__(self) -> str:
+        return f"<ArchivedReport {self.scope} for job {self.job_id}>"
@@ -0,0 +1,106 @@
+"""Move finished jobs to the archive tier, and read them back."""
+
+from collections import Counter
+from datetime import UTC, datetime
+
+import structlog
+from sqlalchemy import delete, func, insert, literal, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+from veriqko.archive.models import ARCHIVE_TABLES, ArchivedJob, ArchivedReport
+from veriqko.devices.models import Device
+from veriqko.jobs.models import INACTIVE_JOB_STATUSES, Job
+from veriqko.parts.models import PartUsage
+from veriqko.stats.service import StatusCounterService
+
+logger = structlog.get_logger(__name__)
+
+
+class ArchiveService:
+    """Archive pipeline and archive lookups."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def archive_batch(self, finished_before: datetime, batch_size: int) -> int:
+        """
+        Move up to `batch_size` jobs finished before the cutoff, with their
+        results, evidence, history, reports and part usages, into the
+        archive tables, oldest first.
+
+        Runs in the caller's transaction. Returns the number of jobs moved.
+        """
+        finished_at = func.coalesce(Job.completed_at, Job.updated_at)
+        stmt = (
+            select(Job.id)
+            .where(
+                # Inlined to match the partial index (see active_job_criteria)
+                Job.status.in_([literal_column(f"'{s.value}'") for s in INACTIVE_JOB_STATUSES]),
+                finished_at < finished_before,
+            )
+            .order_by(finished_at)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        job_ids = list((await self.db.scalars(stmt)).all())
+        if not job_ids:
+            return 0
+
+        now = datetime.now(UTC)
+        for source, archive in ARCHIVE_TABLES.items():
+            key = source.c.id if source is Job.__table__ else source.c.job_id
+            columns = [c.name for c in source.columns]
+            await self.db.execute(
+                insert(archive).from_select(
+                    [*columns, "archived_at"],
+                    select(*source.columns, literal(now)).where(key.in_(job_ids)),
+                )
+            )
+
+        # Part usages reference jobs without a cascade
+        await self.db.execute(
+            delete(PartUsage)
+            .where(PartUsage.job_id.in_(job_ids))
+            .execution_options(synchronize_session=False)
+        )
+        # Results, evidence, history and reports go with it (ON DELETE CASCADE)
+        removed = await self.db.execute(
+            delete(Job)
+            .where(Job.id.in_(job_ids))
+            .returning(Job.status, Job.deleted_at)
+            .execution_options(synchronize_session=False)
+        )
+        # Archived jobs no longer count towards the live totals
+        await StatusCounterService(self.db).record(
+            left=Counter(status for status, deleted_at in removed.all() if deleted_at is None)
+        )
+        return len(job_ids)
+
+    async def get_job(self, job_id: str) -> ArchivedJob | None:
+        """
+        Archived job with the relations the job detail response needs.
+
+        Jobs soft-deleted before archiving stay hidden, as they are when hot.
+        """
+        stmt = (
+            select(ArchivedJob)
+            .options(
+                joinedload(ArchivedJob.device).joinedload(Device.brand),
+                joinedload(ArchivedJob.device).joinedload(Device.gadget_type),
+                joinedload(ArchivedJob.assigned_technician),
+                joinedload(ArchivedJob.current_station),
+                joinedload(ArchivedJob.qc_technician),
+            )
+            .where(ArchivedJob.id == job_id, ArchivedJob.deleted_at.is_(None))
+        )
+        return (await self.db.execute(stmt)).scalar_one_or_none()
+
+    async def get_report_by_token(self, token: str) -> ArchivedReport | None:
+        """Archived report for a public access token."""
+        stmt = (
+            select(ArchivedReport)
+            .options(joinedload(ArchivedReport.job))
+            .where(ArchivedReport.access_token == token)
+        )
+        return (await self.db.execute(stmt)).scalar_one_or_none()
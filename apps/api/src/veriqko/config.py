@@ -36,6 +36,14 @@ class Settings(BaseSettings):
     )
     database_pool_size: int = 5
     database_max_overflow: int = 10
+    # Pooled connections all job workspace loads in a process may hold at once
+    # for their concurrent sub-queries, on top of each request's own session
+    workspace_max_connections: int = 4
+    # Optional read replica for analytics and exports; reads fall back to the
+    # primary while it is unreachable or more than max_lag behind
+    database_read_url: str | None = None
+    database_read_max_lag_seconds: float = 30
+    database_read_check_seconds: float = 5
 
     # Authentication
     jwt_secret_key: str = Field(default="change-me-in-production-min-32-chars!")
@@ -62,6 +70,50 @@ class Settings(BaseSettings):
     miradore_api_key: str | None = None
     miradore_site_url: str | None = None
 
+    # Bulk intake
+    intake_gsma_concurrency: int = 20
+
+    # Job history partitions (monthly)
+    job_history_partitions_ahead: int = 3
+    job_history_retention_months: int | None = None
+
+    # Cold archive (completed/failed jobs); None disables archiving
+    archive_after_days: int | None = 90
+    archive_batch_size: int = 500
+
+    # Station step templates
+    step_template_cache_ttl_seconds: int = 300
+
+    # Dashboard counters (job_status_counters); reconciliation repairs drift
+    status_counter_reconcile_minutes: int = 60
+    status_counter_reconcile_days: int = 7
+
+    # Defect heatmap rollup (defect_rollup), refreshed from new test results
+    defect_rollup_refresh_minutes: int = 15
+
+    # Technician leaderboard rollup (technician_stage_rollup), refreshed from job history
+    technician_rollup_refresh_minutes: int = 15
+
+    # Analytics fact export (Parquet in the storage backend; needs the `analytics` extra)
+    fact_export_enabled: bool = False
+    fact_export_interval_minutes: int = 60
+    fact_export_prefix: str = "analytics"
+
+    # Live floor stream (one LISTEN/NOTIFY broadcaster per process)
+    floor_stream_debounce_seconds: float = 0.5
+    floor_stream_heartbeat_seconds: int = 15
+    floor_stream_resync_seconds: int = 300
+    floor_stream_replay_size: int = 1000
+
+    # Outbox (deferred integration side effects)
+    outbox_worker_enabled: bool = True
+    outbox_poll_seconds: int = 5
+    outbox_batch_size: int = 50
+    outbox_concurrency: int = 5
+    outbox_max_attempts: int = 8
+    outbox_retry_base_seconds: int = 30
+    outbox_lock_timeout_seconds: int = 600
+
     # Branding (white-label)
     brand_name: str = "Veriqko"
     brand_logo_path: Path | None = None
@@ -0,0 +1,40 @@
+"""Job status counter reconciliation task."""
+
+import structlog
+
+from veriqko.config import get_settings
+from veriqko.db.base import async_session_factory
+from veriqko.stats.service import StatusCounterService
+
+logger = structlog.get_logger(__name__)
+
+
+async def reconcile_status_counters() -> int:
+    """
+    Recount the dashboard counters and repair any drift. Returns the number
+    of counters corrected.
+
+    The recount reads one snapshot without locking the counters, so job
+    writes carry on meanwhile; only the correction is written, in its own
+    short transaction.
+    """
+    settings = get_settings()
+    async with async_session_factory() as db:
+        await db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+        drift = await StatusCounterService(db).drift(settings.status_counter_reconcile_days)
+
+    if drift:
+        async with async_session_factory() as db:
+            await StatusCounterService(db).correct(drift)
+            await db.commit()
+    return len(drift)
+
+
+async def run_counter_reconciler():
+    """Runner for the counter reconciliation."""
+    try:
+        corrected = await reconcile_status_counters()
+        if corrected:
+            logger.info("Repaired job status counters", count=corrected)
+    except Exception as e:
+        logger.exception("Error during counter reconciliation", error=str(e))
@@ -0,0 +1,33 @@
+"""Defect heatmap rollup refresh task."""
+
+import structlog
+
+from veriqko.db.base import async_session_factory
+from veriqko.stats.defects import DefectRollupService
+
+logger = structlog.get_logger(__name__)
+
+
+async def refresh_defect_rollup() -> int | None:
+    """
+    Rebuild the defect_rollup days whose test results were recorded,
+    changed or soft-deleted with their job since the last refresh.
+
+    Returns the number of days rebuilt, or None after a full rebuild.
+    """
+    async with async_session_factory() as db:
+        days = await DefectRollupService(db).refresh()
+        await db.commit()
+    return None if days is None else len(days)
+
+
+async def run_defect_rollup():
+    """Runner: keep the defect heatmap's rollup current."""
+    try:
+        days = await refresh_defect_rollup()
+        if days is None:
+            logger.info("Rebuilt defect rollup")
+        elif days:
+            logger.info("Refreshed defect rollup", days=days)
+    except Exception as e:
+        logger.exception("Error during defect rollup refresh", error=str(e))
@@ -0,0 +1,33 @@
+"""Analytics fact export task."""
+
+import structlog
+
+from veriqko.analytics.facts import FactExportService
+from veriqko.config import get_settings
+from veriqko.db.base import async_session_factory
+from veriqko.db.replica import read_session
+from veriqko.evidence.storage import get_storage
+
+logger = structlog.get_logger(__name__)
+
+
+async def export_facts() -> int | None:
+    """Write the fact partitions changed since the last run. Returns the number of days written."""
+    settings = get_settings()
+    async with async_session_factory() as db, read_session() as read_db:
+        service = FactExportService(db, get_storage(), settings.fact_export_prefix, read_db=read_db)
+        days = await service.run()
+        await db.commit()
+    return None if days is None else len(days)
+
+
+async def run_fact_export():
+    """Runner for the fact export."""
+    try:
+        days = await export_facts()
+        if days is None:
+            logger.info("Fact export already running elsewhere; skipped")
+        elif days:
+            logger.info("Exported analytics facts", days=days)
+    except Exception as e:
+        logger.exception("Error during fact export", error=str(e))
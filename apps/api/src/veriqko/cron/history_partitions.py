@@ -0,0 +1,123 @@
+"""Monthly partition maintenance for job_history."""
+
+import re
+from datetime import UTC, date, datetime
+
+import structlog
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from veriqko.config import get_settings
+from veriqko.db.base import async_session_factory
+
+logger = structlog.get_logger(__name__)
+
+PARTITION_NAME = re.compile(r"^job_history_(\d{4})_(\d{2})$")
+# Catches rows outside every monthly partition (created by migration 022)
+DEFAULT_PARTITION = "job_history_default"
+
+
+def add_months(month: date, months: int) -> date:
+    """First day of the month `months` after `month`."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"job_history_{month.year:04d}_{month.month:02d}"
+
+
+async def ensure_history_partitions(db: AsyncSession, months_ahead: int) -> list[str]:
+    """Create monthly partitions from the current month through `months_ahead`. Returns new ones."""
+    this_month = datetime.now(UTC).date().replace(day=1)
+    existing = set(await _partition_names(db))
+    created = []
+
+    for offset in range(months_ahead + 1):
+        month = add_months(this_month, offset)
+        name = partition_name(month)
+        if name in existing:
+            continue
+        await _create_partition(db, name, month)
+        created.append(name)
+
+    return created
+
+
+async def _create_partition(db: AsyncSession, name: str, month: date) -> None:
+    start = f"{month.isoformat()} 00:00+00"
+    end = f"{add_months(month, 1).isoformat()} 00:00+00"
+    create = text(
+        f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF job_history "
+        f"FOR VALUES FROM ('{start}') TO ('{end}')"
+    )
+    in_month = f"changed_at >= '{start}' AND changed_at < '{end}'"
+
+    # Postgres refuses a new partition while the default one holds rows in its
+    # range, e.g. when maintenance did not run before the month began
+    stranded = await db.scalar(
+        text(f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} WHERE {in_month})")
+    )
+    if not stranded:
+        await db.execute(create)
+        return
+
+    logger.warning("Moving job history out of the default partition", partition=name)
+    await db.execute(text(f"ALTER TABLE job_history DETACH PARTITION {DEFAULT_PARTITION}"))
+    await db.execute(create)
+    await db.execute(text(f"INSERT INTO {name} SELECT * FROM {DEFAULT_PARTITION} WHERE {in_month}"))
+    await db.execute(text(f"DELETE FROM {DEFAULT_PARTITION} WHERE {in_month}"))
+    await db.execute(
+        text(f"ALTER TABLE job_history ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT")
+    )
+
+
+async def detach_history_partitions(db: AsyncSession, before: date) -> list[str]:
+    """
+    Detach monthly partitions that end on or before `before`.
+
+    Detaching only drops the partition from job_history; the table and its
+    rows stay in place to be dumped and dropped by an operator.
+    """
+    detached = []
+    for name in await _partition_names(db):
+        match = PARTITION_NAME.match(name)
+        if not match:
+            continue
+        month = date(int(match.group(1)), int(match.group(2)), 1)
+        if add_months(month, 1) <= before:
+            await db.execute(text(f"ALTER TABLE job_history DETACH PARTITION {name}"))
+            detached.append(name)
+    return detached
+
+
+async def _partition_names(db: AsyncSession) -> list[str]:
+    result = await db.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = 'job_history'::regclass"
+        )
+    )
+    return sorted(result.scalars().all())
+
+
+async def run_history_partition_maintenance():
+    """Runner: keep future partitions ahead of inserts and detach expired ones."""
+    settings = get_settings()
+
+    async with async_session_factory() as db:
+        try:
+            created = await ensure_history_partitions(db, settings.job_history_partitions_ahead)
+            detached = []
+            if settings.job_history_retention_months:
+                this_month = datetime.now(UTC).date().replace(day=1)
+                cutoff = add_months(this_month, -settings.job_history_retention_months)
+                detached = await detach_history_partitions(db, cutoff)
+            await db.commit()
+
+            if created or detached:
+                logger.info("Job history partitions updated", created=created, detached=detached)
+        except Exception as e:
+            await db.rollback()
+            logger.exception("Error during job history partition maintenance", error=str(e))
@@ -0,0 +1,40 @@
+"""Job archive task."""
+
+from datetime import UTC, datetime, timedelta
+
+import structlog
+
+from veriqko.archive.service import ArchiveService
+from veriqko.config import get_settings
+from veriqko.db.base import async_session_factory
+
+logger = structlog.get_logger(__name__)
+
+
+async def archive_finished_jobs() -> int:
+    """
+    Move jobs finished more than `archive_after_days` ago into the archive.
+
+    Each batch is archived in its own transaction.
+    """
+    settings = get_settings()
+    cutoff = datetime.now(UTC) - timedelta(days=settings.archive_after_days)
+    total = 0
+
+    while True:
+        async with async_session_factory() as db:
+            moved = await ArchiveService(db).archive_batch(cutoff, settings.archive_batch_size)
+            await db.commit()
+        total += moved
+        if moved < settings.archive_batch_size:
+            return total
+
+
+async def run_job_archiver():
+    """Runner for the job archiver."""
+    try:
+        moved = await archive_finished_jobs()
+        if moved:
+            logger.info("Archived finished jobs", count=moved)
+    except Exception as e:
+        logger.exception("Error during job archiving", error=str(e))
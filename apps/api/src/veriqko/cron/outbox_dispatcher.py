@@ -0,0 +1,38 @@
+"""Outbox dispatcher task.
+
+Runs in-process from the API scheduler, or as a standalone worker:
+    python -m veriqko.cron.outbox_dispatcher
+(set OUTBOX_WORKER_ENABLED=false on the API processes in that case).
+"""
+
+import asyncio
+
+import structlog
+
+import veriqko.models  # noqa: F401
+from veriqko.config import get_settings
+from veriqko.outbox.service import OutboxDispatcher
+
+logger = structlog.get_logger(__name__)
+
+
+async def run_outbox_dispatcher():
+    """Runner for the outbox dispatcher: drain batches until nothing is due."""
+    dispatcher = OutboxDispatcher()
+    try:
+        while await dispatcher.dispatch_pending():
+            pass
+    except Exception as e:
+        logger.exception("Error during outbox dispatch", error=str(e))
+
+
+async def _run_forever():
+    settings = get_settings()
+    logger.info("Starting outbox worker")
+    while True:
+        await run_outbox_dispatcher()
+        await asyncio.sleep(settings.outbox_poll_seconds)
+
+
+if __name__ == "__main__":
+    asyncio.run(_run_forever())
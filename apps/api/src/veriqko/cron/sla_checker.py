@@ -3,15 +3,33 @@
 from datetime import UTC, datetime, timedelta
 
 import structlog
-from sqlalchemy import select
+from sqlalchemy import Select, or_, select
 from sqlalchemy.orm import selectinload
 
 from veriqko.db.base import async_session_factory
-from veriqko.jobs.models import Job, JobStatus
+from veriqko.jobs.models import Job, active_job_criteria
 from veriqko.integrations.email import email_service
 
 logger = structlog.get_logger(__name__)
 
+# Warn this long before the SLA is due
+SLA_WARNING_WINDOW = timedelta(hours=2)
+
+
+def _sla_candidates_query(now: datetime) -> Select:
+    # Range scan on ix_jobs_active_sla_due_at; jobs due after the warning
+    # window are never read
+    return (
+        select(Job)
+        .options(selectinload(Job.assigned_technician))
+        .where(
+            active_job_criteria(),
+            Job.sla_due_at < now + SLA_WARNING_WINDOW,
+            or_(Job.sla_breach_notified_at.is_(None), Job.sla_warning_notified_at.is_(None)),
+        )
+    )
+
+
 async def check_sla_breaches():
     """
     Check all active jobs for SLA breaches or upcoming breaches.
@@ -23,16 +41,8 @@ async def check_sla_breaches():
         try:
             now = datetime.now(UTC)
 
-            # 1. Find jobs that are active and have an SLA
-            stmt = select(Job).options(
-                selectinload(Job.assigned_technician)
-            ).where(
-                Job.status.not_in([JobStatus.COMPLETED, JobStatus.FAILED]),
-                Job.sla_due_at.is_not(None),
-                Job.deleted_at.is_(None)
-            )
-
-            result = await db.execute(stmt)
+            # 1. Find active jobs due for a warning or breach notification
+            result = await db.execute(_sla_candidates_query(now))
             jobs = result.scalars().all()
 
             for job in jobs:
@@ -46,7 +56,7 @@ async def check_sla_breaches():
                     db.add(job)
 
                 # Check for near breach (within 2 hours)
-                elif job.sla_due_at < now + timedelta(hours=2) and not job.sla_warning_notified_at:
+                elif job.sla_due_at < now + SLA_WARNING_WINDOW and not job.sla_warning_notified_at:
                     logger.info("SLA near breach", job_id=job.id, serial_number=job.serial_number)
                     await email_service.send_sla_alert(job.id, job.serial_number, level="WARNING", assignee_email=assignee_email)
                     job.sla_warning_notified_at = now
@@ -0,0 +1,33 @@
+"""Technician leaderboard rollup refresh task."""
+
+import structlog
+
+from veriqko.db.base import async_session_factory
+from veriqko.stats.technicians import TechnicianRollupService
+
+logger = structlog.get_logger(__name__)
+
+
+async def refresh_technician_rollup() -> int | None:
+    """
+    Credit the stage exits in job history written since the last refresh
+    to technician_stage_rollup, rebuilding each day they fall on.
+
+    Returns the number of days rebuilt, or None after a full rebuild.
+    """
+    async with async_session_factory() as db:
+        days = await TechnicianRollupService(db).refresh()
+        await db.commit()
+    return None if days is None else len(days)
+
+
+async def run_technician_rollup():
+    """Runner: keep the technician leaderboard's rollup current."""
+    try:
+        days = await refresh_technician_rollup()
+        if days is None:
+            logger.info("Rebuilt technician rollup")
+        elif days:
+            logger.info("Refreshed technician rollup", days=days)
+    except Exception as e:
+        logger.exception("Error during technician rollup refresh", error=str(e))
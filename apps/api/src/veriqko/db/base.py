@@ -70,6 +70,25 @@ async_session_factory = async_sessionmaker(
     expire_on_commit=False,
 )
 
+# Read replica (optional); route sessions through veriqko.db.replica
+read_engine = (
+    create_async_engine(
+        settings.database_read_url,
+        pool_size=settings.database_pool_size or 20,
+        max_overflow=settings.database_max_overflow or 40,
+        pool_pre_ping=True,
+        echo=settings.debug,
+    )
+    if settings.database_read_url
+    else None
+)
+
+read_session_factory = (
+    async_sessionmaker(read_engine, class_=AsyncSession, expire_on_commit=False)
+    if read_engine is not None
+    else None
+)
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Dependency for getting database session."""
@@ -0,0 +1,45 @@
+"""Bulk row loading."""
+
+import json
+from enum import Enum
+
+from sqlalchemy import JSON, Table, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def _copy_value(column, value):
+    # COPY bypasses SQLAlchemy's type processing, so encode what asyncpg can't
+    if value is None:
+        return None
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(column.type, JSON):
+        return json.dumps(value)
+    return value
+
+
+async def copy_rows(db: AsyncSession, table: Table, rows: list[dict]) -> None:
+    """
+    Load rows into a table inside the session's transaction.
+
+    Uses COPY on asyncpg and a multi-row INSERT on any other driver. Every
+    row must have the same keys; columns left out get their server default.
+    """
+    if not rows:
+        return
+
+    conn = await db.connection()
+    if conn.dialect.driver != "asyncpg":
+        await conn.execute(insert(table), rows)
+        return
+
+    columns = [table.c[key] for key in rows[0]]
+    records = [tuple(_copy_value(c, row[c.key]) for c in columns) for row in rows]
+
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        table.name,
+        records=records,
+        columns=[c.name for c in columns],
+        schema_name=table.schema,
+    )
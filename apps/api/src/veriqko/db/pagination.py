@@ -0,0 +1,28 @@
+"""Keyset (cursor) pagination helpers."""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from uuid import UUID
+
+
+def encode_cursor(timestamp: datetime, row_id: str) -> str:
+    """Encode a `(timestamp, id)` keyset position as an opaque cursor."""
+    payload = json.dumps([timestamp.isoformat(), str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    Raises ValueError if the cursor is malformed, including an id that is
+    not a UUID (which the database would reject).
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        timestamp, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(timestamp), str(UUID(row_id))
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
@@ -0,0 +1,118 @@
+"""Routing of read-only work to the read replica, with fallback to the primary."""
+
+import asyncio
+import time
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
+from contextlib import asynccontextmanager
+
+import structlog
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from veriqko.config import get_settings
+from veriqko.db.base import async_session_factory, read_session_factory
+
+logger = structlog.get_logger(__name__)
+
+# Seconds a standby is behind; 0 when it has replayed everything it
+# received, and NULL (treated as 0) on a server that is not a standby
+REPLICATION_LAG_SQL = text("""
+    SELECT CASE
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+    END
+""")
+# Give up on an unresponsive replica quickly; requests wait on the check
+CHECK_TIMEOUT_SECONDS = 2
+
+
+class ReadReplica:
+    """
+    Picks the session factory for read-only work.
+
+    The replica is used while it answers and is no more than `max_lag`
+    seconds behind the primary; otherwise reads go to the primary. Its state
+    is checked at most every `check_interval` seconds and shared by all
+    requests in between, so routing adds no query to a request.
+    """
+
+    def __init__(
+        self,
+        replica: async_sessionmaker[AsyncSession] | None,
+        primary: async_sessionmaker[AsyncSession],
+        max_lag: float,
+        check_interval: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.replica = replica
+        self.primary = primary
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.clock = clock
+
+        self.healthy = False
+        self._checked_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    async def session_factory(self) -> async_sessionmaker[AsyncSession]:
+        if self.replica is None:
+            return self.primary
+        if self._due():
+            async with self._lock:
+                # Another request may have checked while we waited
+                if self._due():
+                    self.healthy = await self._check()
+                    self._checked_at = self.clock()
+        return self.replica if self.healthy else self.primary
+
+    def _due(self) -> bool:
+        return self._checked_at is None or self.clock() - self._checked_at >= self.check_interval
+
+    async def _check(self) -> bool:
+        try:
+            async with self.replica() as db:
+                lag = await asyncio.wait_for(db.scalar(REPLICATION_LAG_SQL), CHECK_TIMEOUT_SECONDS)
+        except Exception as e:
+            self._report(False, "Read replica unavailable; reading from the primary", error=str(e))
+            return False
+
+        lag = float(lag or 0)
+        if lag > self.max_lag:
+            self._report(False, "Read replica lagging; reading from the primary", lag_seconds=lag)
+            return False
+        self._report(True, "Reading from the read replica", lag_seconds=lag)
+        return True
+
+    def _report(self, healthy: bool, message: str, **fields) -> None:
+        # Log changes of state only, not every check
+        if healthy != self.healthy or self._checked_at is None:
+            (logger.info if healthy else logger.warning)(message, **fields)
+
+
+settings = get_settings()
+
+read_replica = ReadReplica(
+    read_session_factory,
+    async_session_factory,
+    max_lag=settings.database_read_max_lag_seconds,
+    check_interval=settings.database_read_check_seconds,
+)
+
+
+@asynccontextmanager
+async def read_session() -> AsyncIterator[AsyncSession]:
+    """A session for read-only work, on the replica when it is usable."""
+    factory = await read_replica.session_factory()
+    async with factory() as session:
+        yield session
+
+
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for a read-only database session.
+
+    Nothing is committed. Data may be up to database_read_max_lag_seconds
+    old, so endpoints that must see a write just made should use get_db.
+    """
+    async with read_session() as session:
+        yield session
@@ -54,3 +54,15 @@ class NotFoundError(VeriqkoError):
             error_code="NOT_FOUND",
             details=details,
         )
+
+
+class PreconditionFailedError(VeriqkoError):
+    """Exception raised when a conditional write finds the resource has changed."""
+
+    def __init__(self, message: str, details: dict[str, Any] | None = None):
+        super().__init__(
+            message=message,
+            status_code=412,
+            error_code="PRECONDITION_FAILED",
+            details=details,
+        )
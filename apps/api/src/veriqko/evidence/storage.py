@@ -64,6 +64,11 @@ class Storage(ABC):
         """Save a file and return storage metadata."""
         pass
 
+    @abstractmethod
+    async def put(self, relative_path: str, content: bytes, mime_type: str) -> StoredFile:
+        """Write a file at an exact path, replacing any existing one."""
+        pass
+
     @abstractmethod
     async def get_path(self, relative_path: str) -> Path | str:
         """Get path or URL for a stored file."""
@@ -130,7 +135,9 @@ class AzureBlobStorage(Storage):
             blob_client = container_client.get_blob_client(blob_path)
 
             # Simple upload for now, could be optimized for large files
-            await blob_client.upload_blob(content, overwrite=True, content_settings={"content_type": mime_type})
+            await blob_client.upload_blob(
+                content, overwrite=True, content_settings={"content_type": mime_type}
+            )
 
         return StoredFile(
             stored_filename=stored_filename,
@@ -141,6 +148,24 @@ class AzureBlobStorage(Storage):
             mime_type=mime_type,
         )
 
+    async def put(self, relative_path: str, content: bytes, mime_type: str) -> StoredFile:
+        connection_string = self.config.azure_connection_string
+        async with self.BlobServiceClient.from_connection_string(connection_string) as client:
+            container_client = client.get_container_client(self.container_name)
+            blob_client = container_client.get_blob_client(relative_path)
+            await blob_client.upload_blob(
+                content, overwrite=True, content_settings={"content_type": mime_type}
+            )
+
+        return StoredFile(
+            stored_filename=relative_path.rsplit("/", 1)[-1],
+            relative_path=relative_path,
+            absolute_path=blob_client.url,
+            size_bytes=len(content),
+            sha256_hash=hashlib.sha256(content).hexdigest(),
+            mime_type=mime_type,
+        )
+
     async def get_path(self, relative_path: str) -> str:
         async with self.BlobServiceClient.from_connection_string(self.config.azure_connection_string) as client:
             container_client = client.get_container_client(self.container_name)
@@ -254,6 +279,25 @@ class LocalFileStorage(Storage):
             mime_type=mime_type,
         )
 
+    async def put(self, relative_path: str, content: bytes, mime_type: str) -> StoredFile:
+        """Write a file at an exact path; readers see the old or new file, never a partial one."""
+        absolute_path = self.base_path / relative_path
+        await aiofiles.os.makedirs(absolute_path.parent, exist_ok=True)
+
+        partial_path = absolute_path.with_name(f".{absolute_path.name}.{uuid4().hex}")
+        async with aiofiles.open(partial_path, "wb") as f:
+            await f.write(content)
+        await aiofiles.os.replace(partial_path, absolute_path)
+
+        return StoredFile(
+            stored_filename=absolute_path.name,
+            relative_path=relative_path,
+            absolute_path=absolute_path,
+            size_bytes=len(content),
+            sha256_hash=hashlib.sha256(content).hexdigest(),
+            mime_type=mime_type,
+        )
+
     async def get_path(self, relative_path: str) -> Path:
         """Get absolute path for a stored file."""
         return self.base_path / relative_path
@@ -4,8 +4,10 @@ from uuid import uuid4
 import structlog
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.exc import StaleDataError
 
 from veriqko.config import get_settings
+from veriqko.errors.exceptions import PreconditionFailedError
 from veriqko.integrations.picea.client import PiceaClient
 from veriqko.jobs.models import Job, TestResult, TestResultStatus, TestStep
 
@@ -115,7 +117,16 @@ class PiceaService:
                     serial_number=job.serial_number
                 )
 
-        await self.session.commit()
+        try:
+            await self.session.commit()
+        except StaleDataError:
+            # A technician updated the job while Picea was being queried; the
+            # caller retries (the outbox does so automatically) on fresh data
+            await self.session.rollback()
+            raise PreconditionFailedError(
+                "Job was modified during the Picea sync",
+                details={"job_id": job_id},
+            )
         return True
 
     async def _upsert_test_result(
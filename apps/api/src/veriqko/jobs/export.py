@@ -0,0 +1,112 @@
+"""Streaming job export writers (CSV, NDJSON, XLSX)."""
+
+import asyncio
+import csv
+import io
+import json
+import os
+import tempfile
+from collections.abc import AsyncIterator
+from datetime import datetime
+from enum import Enum
+
+from sqlalchemy.engine import Row
+
+# (header, row attribute) in output order
+EXPORT_COLUMNS = [
+    ("Job ID", "id"),
+    ("Ticket", "ticket_id"),
+    ("Serial Number", "serial_number"),
+    ("IMEI", "imei"),
+    ("Status", "status"),
+    ("Brand", "device_brand"),
+    ("Type", "device_type"),
+    ("Model", "device_model"),
+    ("Customer Reference", "customer_reference"),
+    ("Batch", "batch_id"),
+    ("Technician", "assigned_technician_name"),
+    ("Created At", "created_at"),
+    ("Completed At", "completed_at"),
+    ("Tests Passed", "tests_passed"),
+    ("Tests Failed", "tests_failed"),
+    ("Tests Skipped", "tests_skipped"),
+    ("Failed Steps", "failed_steps"),
+]
+
+MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+# Size of the chunks the finished XLSX file is sent in
+XLSX_CHUNK_SIZE = 64 * 1024
+
+
+def _values(row: Row) -> list:
+    values = []
+    for _, key in EXPORT_COLUMNS:
+        value = getattr(row, key)
+        values.append(value.value if isinstance(value, Enum) else value)
+    return values
+
+
+async def write_csv(batches: AsyncIterator[list[Row]]) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([header for header, _ in EXPORT_COLUMNS])
+
+    async for batch in batches:
+        writer.writerows(_values(row) for row in batch)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+    yield buffer.getvalue()
+
+
+async def write_ndjson(batches: AsyncIterator[list[Row]]) -> AsyncIterator[str]:
+    keys = [key for _, key in EXPORT_COLUMNS]
+    async for batch in batches:
+        yield "".join(
+            json.dumps(dict(zip(keys, _values(row))), default=str) + "\n" for row in batch
+        )
+
+
+async def write_xlsx(batches: AsyncIterator[list[Row]]) -> AsyncIterator[bytes]:
+    """
+    Build the workbook in write-only mode, then stream the file.
+
+    Write-only worksheets flush rows to a temporary file as they are
+    appended, so memory stays flat; the zip container can only be sent once
+    the last row is written.
+    """
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Jobs")
+    sheet.append([header for header, _ in EXPORT_COLUMNS])
+
+    async for batch in batches:
+        for row in batch:
+            # Excel has no timezone-aware datetimes
+            sheet.append(
+                [v.replace(tzinfo=None) if isinstance(v, datetime) else v for v in _values(row)]
+            )
+
+    fd, path = tempfile.mkstemp(suffix=".xlsx")
+    os.close(fd)
+    try:
+        await asyncio.to_thread(workbook.save, path)
+        with open(path, "rb") as f:
+            while chunk := f.read(XLSX_CHUNK_SIZE):
+                yield chunk
+    finally:
+        os.unlink(path)
+
+
+WRITERS = {
+    "csv": write_csv,
+    "ndjson": write_ndjson,
+    "xlsx": write_xlsx,
+}
@@ -0,0 +1,75 @@
+"""Named eager-loading profiles for Job queries."""
+
+from enum import StrEnum
+
+from sqlalchemy.orm import defer, joinedload, selectinload
+from sqlalchemy.orm.interfaces import ORMOption
+
+from veriqko.devices.models import Device
+from veriqko.jobs.models import Job, TestResult
+
+
+class JobLoad(StrEnum):
+    """
+    What a caller needs from a Job query.
+
+    - LIST: list rows; device and assigned technician, heavy columns deferred.
+    - DETAIL: full job response; every many-to-one relation in one joined query.
+    - GUARD: workflow checks; job columns only, no relations.
+    - REPORT: report generation; detail relations plus test results and steps.
+    """
+
+    LIST = "list"
+    DETAIL = "detail"
+    GUARD = "guard"
+    REPORT = "report"
+
+
+# Columns that can be large and are only needed by the detail view
+_HEAVY_COLUMNS = (
+    Job.picea_diagnostics_raw,
+    Job.picea_erase_certificate,
+    Job.intake_condition,
+    Job.qc_notes,
+    Job.skip_reason,
+)
+
+
+def _device_options() -> list[ORMOption]:
+    return [
+        joinedload(Job.device).joinedload(Device.brand),
+        joinedload(Job.device).joinedload(Device.gadget_type),
+    ]
+
+
+def job_load_options(profile: JobLoad) -> list[ORMOption]:
+    """Loader options for a profile, to pass to `select(Job).options(...)`."""
+    if profile == JobLoad.LIST:
+        return [
+            *_device_options(),
+            joinedload(Job.assigned_technician),
+            *(defer(column) for column in _HEAVY_COLUMNS),
+        ]
+
+    if profile == JobLoad.DETAIL:
+        return [
+            *_device_options(),
+            joinedload(Job.assigned_technician),
+            joinedload(Job.current_station),
+            joinedload(Job.qc_technician),
+        ]
+
+    if profile == JobLoad.GUARD:
+        return [defer(Job.picea_diagnostics_raw), defer(Job.picea_erase_certificate)]
+
+    if profile == JobLoad.REPORT:
+        return [
+            *_device_options(),
+            joinedload(Job.assigned_technician),
+            joinedload(Job.qc_technician),
+            # One-to-many: a second round trip beats multiplying job rows
+            selectinload(Job.test_results).joinedload(TestResult.test_step),
+            defer(Job.picea_diagnostics_raw),
+        ]
+
+    raise ValueError(f"Unknown job load profile: {profile}")
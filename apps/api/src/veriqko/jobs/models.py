@@ -25,6 +25,14 @@ class JobStatus(str, Enum):
     ON_HOLD = "on_hold"
 
 
+# Jobs in these states have left the floor
+INACTIVE_JOB_STATUSES = (JobStatus.COMPLETED, JobStatus.FAILED)
+# Predicate of the active-set partial indexes; queries must match it (see active_job_criteria)
+ACTIVE_JOB_PREDICATE = "status NOT IN ('completed', 'failed') AND deleted_at IS NULL"
+# Predicate of the archive cutoff index; the archiver's query must match it
+FINISHED_JOB_PREDICATE = "status IN ('completed', 'failed')"
+
+
 class TestResultStatus(str, Enum):
     """Test result status."""
 
@@ -34,12 +42,78 @@ class TestResultStatus(str, Enum):
     PENDING = "pending"
 
 
+# Stage timestamps covered by ix_jobs_completed_at_stages
+STAGE_TIMESTAMP_COLUMNS = [
+    "created_at",
+    "intake_started_at",
+    "intake_completed_at",
+    "reset_started_at",
+    "reset_completed_at",
+    "functional_started_at",
+    "functional_completed_at",
+    "qc_started_at",
+    "qc_completed_at",
+]
+
+
 class Job(Base, UUIDMixin, TimestampMixin, SoftDeleteMixin):
     """Job model - core workflow entity representing a device being processed."""
 
     __tablename__ = "jobs"
     __table_args__ = (
         sa.Index("ix_jobs_status_created_at", "status", "created_at"),
+        sa.Index("ix_jobs_created_at_id", "created_at", "id"),
+        # Partial indexes over the active working set (see ACTIVE_JOB_PREDICATE)
+        sa.Index(
+            "ix_jobs_active_station_updated_at",
+            "current_station_id",
+            "updated_at",
+            postgresql_where=sa.text(ACTIVE_JOB_PREDICATE),
+        ),
+        sa.Index(
+            "ix_jobs_active_sla_due_at",
+            "sla_due_at",
+            postgresql_where=sa.text(ACTIVE_JOB_PREDICATE),
+        ),
+        # Throughput series: completed jobs by completion time, with every stage
+        # timestamp included so percentiles come from an index-only scan
+        sa.Index(
+            "ix_jobs_completed_at_stages",
+            "completed_at",
+            postgresql_where=sa.text("completed_at IS NOT NULL AND deleted_at IS NULL"),
+            postgresql_include=STAGE_TIMESTAMP_COLUMNS,
+        ),
+        # Finished jobs by the archive cutoff (see ArchiveService.archive_batch)
+        sa.Index(
+            "ix_jobs_finished_archive_cutoff",
+            sa.text("coalesce(completed_at, updated_at)"),
+            postgresql_where=sa.text(FINISHED_JOB_PREDICATE),
+        ),
+        # Only the (few) soft-deleted jobs; lets rollups find recent deletions
+        sa.Index(
+            "ix_jobs_deleted_at",
+            "deleted_at",
+            postgresql_where=sa.text("deleted_at IS NOT NULL"),
+        ),
+        # Trigram indexes backing substring search (requires pg_trgm)
+        sa.Index(
+            "ix_jobs_serial_number_trgm",
+            "serial_number",
+            postgresql_using="gin",
+            postgresql_ops={"serial_number": "gin_trgm_ops"},
+        ),
+        sa.Index(
+            "ix_jobs_batch_id_trgm",
+            "batch_id",
+            postgresql_using="gin",
+            postgresql_ops={"batch_id": "gin_trgm_ops"},
+        ),
+        sa.Index(
+            "ix_jobs_customer_reference_trgm",
+            "customer_reference",
+            postgresql_using="gin",
+            postgresql_ops={"customer_reference": "gin_trgm_ops"},
+        ),
     )
 
     # Device reference
@@ -114,6 +188,9 @@ class Job(Base, UUIDMixin, TimestampMixin, SoftDeleteMixin):
     is_fully_tested: Mapped[bool] = mapped_column(sa.Boolean, nullable=False, default=True)
     skip_reason: Mapped[str | None] = mapped_column(Text, nullable=True)
 
+    # Optimistic concurrency: bumped on every ORM update, exposed as the ETag
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
+
     # Relationships
     device = relationship("Device", back_populates="jobs")
     current_station = relationship("Station", back_populates="jobs")
@@ -124,10 +201,28 @@ class Job(Base, UUIDMixin, TimestampMixin, SoftDeleteMixin):
     reports = relationship("Report", back_populates="job", cascade="all, delete-orphan")
     history = relationship("JobHistory", back_populates="job", cascade="all, delete-orphan")
 
+    __mapper_args__ = {"version_id_col": version}
+
     def __repr__(self) -> str:
         return f"<Job {self.serial_number} ({self.status})>"
 
 
+def active_job_criteria() -> sa.ColumnElement[bool]:
+    """
+    Filter for jobs still on the floor, written to match ACTIVE_JOB_PREDICATE.
+
+    The statuses are inlined rather than bound: with bind parameters a
+    prepared statement's generic plan cannot prove the partial index
+    predicate and falls back to scanning the whole table.
+    """
+    return sa.and_(
+        Job.status.not_in(
+            [sa.literal_column(f"'{status.value}'") for status in INACTIVE_JOB_STATUSES]
+        ),
+        Job.deleted_at.is_(None),
+    )
+
+
 class TestStep(Base, UUIDMixin, TimestampMixin):
     """Test step template - defines tests for a device type at a station."""
 
@@ -165,6 +260,13 @@ class TestResult(Base, UUIDMixin, TimestampMixin):
     """Test result - job-specific test execution record."""
 
     __tablename__ = "test_results"
+    __table_args__ = (
+        # One result per step per job; batch submission upserts against it
+        sa.UniqueConstraint("job_id", "test_step_id", name="uq_test_results_job_step"),
+        # Defect rollup: day ranges and rows changed since the last refresh
+        sa.Index("ix_test_results_created_at", "created_at"),
+        sa.Index("ix_test_results_updated_at", "updated_at"),
+    )
 
     job_id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
@@ -210,6 +312,13 @@ class JobHistory(Base, UUIDMixin):
     """Job history - audit trail for workflow state changes."""
 
     __tablename__ = "job_history"
+    __table_args__ = (
+        sa.Index("ix_job_history_job_id_changed_at", "job_id", "changed_at", "id"),
+        # Time-range analytics; history is append-only, so changed_at follows physical order
+        sa.Index("ix_job_history_changed_at_brin", "changed_at", postgresql_using="brin"),
+        # Monthly partitions, managed by veriqko.cron.history_partitions
+        {"postgresql_partition_by": "RANGE (changed_at)"},
+    )
 
     job_id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
@@ -231,8 +340,10 @@ class JobHistory(Base, UUIDMixin):
         ForeignKey("users.id"),
         nullable=False,
     )
+    # Partition key, so part of the primary key
     changed_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        primary_key=True,
         nullable=False,
     )
 
@@ -1,35 +1,76 @@
 """Job router."""
 
 from datetime import UTC, datetime
-from typing import Annotated
+from typing import Annotated, Literal
+from uuid import UUID
 
 import fastapi
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
+from veriqko.archive.service import ArchiveService
 from veriqko.db.base import get_db
-from veriqko.dependencies import get_current_user
+from veriqko.db.replica import read_session
+from veriqko.dependencies import get_current_user, require_role
+from veriqko.enums import UserRole
+from veriqko.jobs.export import MEDIA_TYPES, WRITERS
+from veriqko.jobs.loading import JobLoad
+from veriqko.jobs.models import JobStatus
 from veriqko.jobs.schemas import (
-    EvidenceSummary,
+    BulkIntakeItem,
+    BulkIntakeResponse,
+    BulkTransitionItem,
+    BulkTransitionResponse,
     JobBatchCreate,
+    JobBulkTransition,
     JobCreate,
     JobHistoryResponse,
     JobListResponse,
     JobResponse,
     JobTransition,
     JobUpdate,
+    JobWorkspaceResponse,
+    TestResultBatchCreate,
+    TestResultBatchItem,
     TestResultCreate,
     TestStepResponse,
     TransitionResponse,
 )
 from veriqko.jobs.service import JobService
+from veriqko.jobs.workspace import history_to_response, job_steps, load_workspace
 from veriqko.users.models import User
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
 
+def _etag(job) -> str:
+    """Strong ETag for a job; changes whenever the job row is updated."""
+    return f'"{job.version}"'
+
+
+def _if_match_version(if_match: str | None) -> int | None:
+    """
+    Job version an If-Match header requires, or None when any version will do.
+
+    A header that cannot match any job version (weak or malformed tags)
+    fails the precondition straight away.
+    """
+    if if_match is None or if_match.strip() == "*":
+        return None
+
+    tag = if_match.strip()
+    if len(tag) > 2 and tag[0] == tag[-1] == '"' and tag[1:-1].isdigit():
+        return int(tag[1:-1])
+
+    raise HTTPException(
+        status_code=status.HTTP_412_PRECONDITION_FAILED,
+        detail="If-Match must be a single ETag returned by this API",
+    )
+
+
 def _job_to_response(job) -> JobResponse:
     """Convert job model to response schema."""
     return JobResponse(
@@ -87,6 +128,7 @@ def _job_to_response(job) -> JobResponse:
 
 @router.get("", response_model=list[JobListResponse])
 async def list_jobs(
+    response: Response,
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)],
     status: str | None = Query(None),
@@ -94,35 +136,88 @@ async def list_jobs(
     search: str | None = Query(None),
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(
+        None, description="Opaque cursor from a previous X-Next-Cursor header"
+    ),
 ):
-    """List jobs with optional filtering."""
+    """
+    List jobs with optional filtering.
+
+    The cursor for the next page is returned in the `X-Next-Cursor` header.
+    Passing it back as `?cursor=` pages by keyset instead of `offset`.
+    """
     service = JobService(db)
-    jobs = await service.list(
-        status=status,
-        technician_id=technician_id,
-        search=search,
-        limit=limit,
-        offset=offset,
-        current_user=current_user,
-    )
+    try:
+        rows = await service.list_rows(
+            status=status,
+            technician_id=technician_id,
+            search=search,
+            limit=limit,
+            offset=offset,
+            current_user=current_user,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    next_cursor = service.next_cursor(rows, limit)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
 
     return [
         JobListResponse(
-            id=job.id,
-            serial_number=job.serial_number,
-            status=job.status.value,
-            device_brand=job.device.brand.name if job.device else None,
-            device_type=job.device.gadget_type.name if job.device else None,
-            device_model=job.device.model if job.device else None,
-            assigned_technician_name=job.assigned_technician.full_name
-            if job.assigned_technician
-            else None,
-            created_at=job.created_at,
+            id=row.id,
+            serial_number=row.serial_number,
+            status=row.status.value,
+            device_brand=row.device_brand,
+            device_type=row.device_type,
+            device_model=row.device_model,
+            assigned_technician_name=row.assigned_technician_name,
+            customer_reference=row.customer_reference,
+            created_at=row.created_at,
         )
-        for job in jobs
+        for row in rows
     ]
 
 
+@router.get("/export")
+async def export_jobs(
+    current_user: Annotated[User, Depends(get_current_user)],
+    format: Literal["csv", "ndjson", "xlsx"] = Query("csv"),
+    status: str | None = Query(None),
+    technician_id: str | None = Query(None),
+    search: str | None = Query(None),
+):
+    """
+    Export every matching job with its test outcomes.
+
+    Rows are streamed from a server-side cursor, so memory use does not grow
+    with the number of jobs.
+    """
+    # Errors inside the stream can't become a 400, so validate up front
+    if status and status not in {s.value for s in JobStatus}:
+        raise HTTPException(status_code=400, detail="Invalid status")
+
+    async def body():
+        # The request's session would be closed before streaming finishes
+        async with read_session() as db:
+            batches = JobService(db).stream_export_rows(
+                status=status,
+                technician_id=technician_id,
+                search=search,
+                current_user=current_user,
+            )
+            async for chunk in WRITERS[format](batches):
+                yield chunk
+
+    filename = f"jobs_{datetime.now(UTC):%Y%m%d_%H%M%S}.{format}"
+    return StreamingResponse(
+        body(),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
+
+
 @router.post("", response_model=JobResponse, status_code=status.HTTP_201_CREATED)
 async def create_job(
     data: JobCreate,
@@ -147,6 +242,75 @@ async def create_jobs_batch(
     return [_job_to_response(job) for job in jobs]
 
 
+@router.post("/intake:bulk", response_model=BulkIntakeResponse, status_code=status.HTTP_201_CREATED)
+async def bulk_intake_jobs(
+    data: JobBatchCreate,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[User, Depends(get_current_user)],
+):
+    """Intake a pallet of serials; blacklisted or invalid serials are rejected individually."""
+    service = JobService(db)
+    outcomes = await service.bulk_intake(data, current_user.id)
+
+    created = sum(1 for o in outcomes if o.success)
+    return BulkIntakeResponse(
+        created=created,
+        rejected=len(outcomes) - created,
+        results=[
+            BulkIntakeItem(
+                serial_number=o.serial_number,
+                success=o.success,
+                job_id=o.job_id,
+                ticket_id=o.ticket_id,
+                errors=o.errors,
+            )
+            for o in outcomes
+        ],
+    )
+
+
+@router.post("/transitions:bulk", response_model=BulkTransitionResponse)
+async def bulk_transition_jobs(
+    data: JobBulkTransition,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[User, Depends(get_current_user)],
+):
+    """Transition a list of jobs, or every job in a batch, to a new workflow state."""
+    service = JobService(db)
+
+    try:
+        outcomes = await service.bulk_transition(
+            target_status=data.target_status,
+            user_id=current_user.id,
+            job_ids=[str(job_id) for job_id in data.job_ids] if data.job_ids is not None else None,
+            batch_id=data.batch_id,
+            notes=data.notes,
+            is_fully_tested=data.is_fully_tested,
+            skip_reason=data.reason,
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid target status",
+        )
+
+    succeeded = sum(1 for o in outcomes if o.success)
+    return BulkTransitionResponse(
+        to_status=data.target_status,
+        succeeded=succeeded,
+        failed=len(outcomes) - succeeded,
+        results=[
+            BulkTransitionItem(
+                job_id=o.job_id,
+                success=o.success,
+                from_status=o.from_status.value if o.from_status else None,
+                errors=o.errors,
+            )
+            for o in outcomes
+        ],
+    )
+
+
 @router.get("/security/check-imei/{imei}")
 async def check_imei_security(
     imei: str,
@@ -161,12 +325,20 @@ async def check_imei_security(
 @router.get("/{job_id}", response_model=JobResponse)
 async def get_job(
     job_id: str,
+    response: Response,
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)],
 ):
-    """Get a job by ID."""
+    """
+    Get a job by ID, falling back to the archive for long-finished jobs.
+
+    The `ETag` header can be sent back as `If-Match` on updates, transitions
+    and deletes.
+    """
     service = JobService(db)
-    job = await service.get(job_id)
+    job = await service.get(job_id, JobLoad.DETAIL)
+    if not job:
+        job = await ArchiveService(db).get_job(job_id)
 
     if not job:
         raise HTTPException(
@@ -174,6 +346,7 @@ async def get_job(
             detail="Job not found",
         )
 
+    response.headers["ETag"] = _etag(job)
     return _job_to_response(job)
 
 
@@ -181,12 +354,19 @@ async def get_job(
 async def update_job(
     job_id: str,
     data: JobUpdate,
+    response: Response,
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)],
+    if_match: Annotated[str | None, Header()] = None,
 ):
-    """Update a job."""
+    """
+    Update a job.
+
+    With `If-Match`, the update is rejected with 412 if the job has changed
+    since that ETag was issued.
+    """
     service = JobService(db)
-    job = await service.update(job_id, data)
+    job = await service.update(job_id, data, _if_match_version(if_match))
 
     if not job:
         raise HTTPException(
@@ -194,6 +374,7 @@ async def update_job(
             detail="Job not found",
         )
 
+    response.headers["ETag"] = _etag(job)
     return _job_to_response(job)
 
 
@@ -201,10 +382,17 @@ async def update_job(
 async def transition_job(
     job_id: str,
     data: JobTransition,
+    response: Response,
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)],
+    if_match: Annotated[str | None, Header()] = None,
 ):
-    """Transition job to a new workflow state."""
+    """
+    Transition job to a new workflow state.
+
+    With `If-Match`, the transition is rejected with 412 if the job has
+    changed since that ETag was issued.
+    """
     service = JobService(db)
 
     job, result = await service.transition(
@@ -214,6 +402,7 @@ async def transition_job(
         notes=data.notes,
         is_fully_tested=data.is_fully_tested,
         skip_reason=data.reason,
+        expected_version=_if_match_version(if_match),
     )
 
     if job is None:
@@ -231,6 +420,7 @@ async def transition_job(
             },
         )
 
+    response.headers["ETag"] = _etag(job)
     return TransitionResponse(
         job=_job_to_response(job),
         from_status=result.from_status.value,
@@ -240,36 +430,63 @@ async def transition_job(
     )
 
 
+@router.delete("/{job_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_job(
+    job_id: str,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[User, Depends(require_role(UserRole.ADMIN, UserRole.SUPERVISOR))],
+    if_match: Annotated[str | None, Header()] = None,
+):
+    """
+    Soft delete a job.
+
+    With `If-Match`, the delete is rejected with 412 if the job has changed
+    since that ETag was issued.
+    """
+    service = JobService(db)
+    if not await service.delete(job_id, _if_match_version(if_match)):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found",
+        )
+
+
 @router.get("/{job_id}/history", response_model=list[JobHistoryResponse])
 async def get_job_history(
     job_id: str,
+    response: Response,
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)],
+    limit: int = Query(100, ge=1, le=500),
+    cursor: str | None = Query(
+        None, description="Opaque cursor from a previous X-Next-Cursor header"
+    ),
 ):
-    """Get job workflow history."""
+    """
+    Get job workflow history, newest first.
+
+    The cursor for the next page is returned in the `X-Next-Cursor` header.
+    """
     service = JobService(db)
 
     # Verify job exists
-    job = await service.get(job_id)
+    job = await service.get(job_id, JobLoad.GUARD)
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Job not found",
         )
 
-    history = await service.get_history(job_id)
+    try:
+        history = await service.get_history(job_id, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    return [
-        JobHistoryResponse(
-            id=h.id,
-            from_status=h.from_status.value if h.from_status else None,
-            to_status=h.to_status.value,
-            changed_by_name=h.changed_by.full_name if h.changed_by else "Unknown",
-            changed_at=h.changed_at,
-            notes=h.notes,
-        )
-        for h in history
-    ]
+    next_cursor = service.next_cursor(history, limit, timestamp_attr="changed_at")
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+
+    return [history_to_response(h) for h in history]
 
 
 @router.get("/{job_id}/valid-transitions", response_model=list[str])
@@ -280,7 +497,7 @@ async def get_valid_transitions(
 ):
     """Get valid state transitions for a job."""
     service = JobService(db)
-    job = await service.get(job_id)
+    job = await service.get(job_id, JobLoad.GUARD)
 
     if not job:
         raise HTTPException(
@@ -298,126 +515,96 @@ async def get_job_steps(
     current_user: Annotated[User, Depends(get_current_user)],
 ):
     """Get workflow steps with current status for the job."""
-    # Logic:
-    # 1. Get Job -> get current_station_id (or status to infer station type)
-    # 2. Get TestSteps for device_id + station_type
-    # 3. Get TestResults for job_id
-    # 4. Merge
-
-    # Ideally this logic belongs in Service, but implementing here for brevity/speed as per constraints
-    from veriqko.jobs.models import Job, JobStatus, TestResult, TestStep
-
-    # Get Job with session.get but we need relationships
-    stmt = (
-        select(Job)
-        .options(
-            selectinload(Job.device).selectinload(Device.brand),
-            selectinload(Job.device).selectinload(Device.gadget_type)
-        )
-        .where(Job.id == job_id, Job.deleted_at.is_(None))
-    )
-    job = (await db.execute(stmt)).scalar_one_or_none()
+    service = JobService(db)
+
+    # Only status and device_id are needed here
+    job = await service.get(job_id, JobLoad.GUARD)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    # Determine station type from job status (INTAKE, RESET, FUNCTIONAL, QC)
-    # Mapping job status to station type enum
-    current_stage = job.status
-
-    # If job is completed or failed, we show the steps from the last station (QC)
-    # or expose all steps. For now, matching the active stations.
-    if current_stage in [JobStatus.COMPLETED, JobStatus.FAILED]:
-        display_stage = JobStatus.QC
-    else:
-        display_stage = current_stage
-
-    if display_stage not in [JobStatus.INTAKE, JobStatus.RESET, JobStatus.FUNCTIONAL, JobStatus.QC]:
-        return []
-
-    # Get Steps
-    stmt = select(TestStep).where(
-        TestStep.device_id == job.device_id,
-        TestStep.station_type == display_stage
-    ).order_by(TestStep.sequence_order)
-    steps = (await db.execute(stmt)).scalars().all()
-
-    from sqlalchemy.orm import selectinload
-    stmt_results = (
-        select(TestResult)
-        .options(selectinload(TestResult.evidence_items))
-        .where(TestResult.job_id == job_id)
+    return await job_steps(db, job)
+
+
+@router.get("/{job_id}/workspace", response_model=JobWorkspaceResponse)
+async def get_job_workspace(
+    job_id: str,
+    response: Response,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[User, Depends(get_current_user)],
+):
+    """
+    Get the job together with everything the job screen shows.
+
+    Combines the job, valid transitions, the first history page, steps,
+    evidence, reports and parts used. The job is loaded once and the rest
+    is fetched concurrently. When history continues past the first page,
+    its cursor is in `history_next_cursor` and the `X-Next-Cursor` header.
+    """
+    service = JobService(db)
+    job = await service.get(job_id, JobLoad.DETAIL)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found",
+        )
+
+    # Same rule as the reports listing
+    if current_user.role == UserRole.CUSTOMER and job.customer_reference != current_user.email:
+        raise HTTPException(status_code=403, detail="Unauthorised Access")
+
+    workspace = await load_workspace(job)
+
+    response.headers["ETag"] = _etag(job)
+    if workspace["history_next_cursor"]:
+        response.headers["X-Next-Cursor"] = workspace["history_next_cursor"]
+    return JobWorkspaceResponse(
+        job=_job_to_response(job),
+        valid_transitions=service.get_valid_transitions(job),
+        **workspace,
     )
-    results = (await db.execute(stmt_results)).scalars().all()
-    results_map = {r.test_step_id: r for r in results}
-
-    # Build response
-    response = []
-    for step in steps:
-        result = results_map.get(step.id)
-
-        evidence_list = []
-        if result:
-            evidence_list = [
-                EvidenceSummary(
-                    id=ev.id,
-                    original_filename=ev.original_filename,
-                    evidence_type=ev.evidence_type.value,
-                    created_at=ev.created_at
-                ) for ev in result.evidence_items
-            ]
-
-        response.append(TestStepResponse(
-            id=step.id,
-            name=step.name,
-            description=step.description,
-            sequence_order=step.sequence_order,
-            is_mandatory=step.is_mandatory,
-            requires_evidence=step.requires_evidence,
-            status=result.status.value if result else "pending",
-            notes=result.notes if result else None,
-            evidence=evidence_list
-        ))
-
-    return response
+
+
+@router.post("/{job_id}/results:batch", status_code=status.HTTP_200_OK)
+async def submit_step_results_batch(
+    job_id: str,
+    data: TestResultBatchCreate,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[User, Depends(get_current_user)],
+):
+    """Submit results for several steps in one request."""
+    service = JobService(db)
+
+    try:
+        count = await service.submit_results(job_id, data.results, current_user.id)
+    except IntegrityError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Unknown job or test step",
+        )
+
+    return {"status": "success", "count": count}
 
 
 @router.post("/{job_id}/results/{step_id}", status_code=status.HTTP_200_OK)
 async def submit_step_result(
     job_id: str,
-    step_id: str,
+    step_id: UUID,
     data: TestResultCreate,
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)],
 ):
     """Submit a test result."""
-    from datetime import datetime
-
-    from veriqko.jobs.models import TestResult, TestResultStatus
-
-    # Check if result exists
-    stmt = select(TestResult).where(
-        TestResult.job_id == job_id,
-        TestResult.test_step_id == step_id
-    )
-    result = (await db.execute(stmt)).scalar_one_or_none()
+    service = JobService(db)
+    item = TestResultBatchItem(test_step_id=step_id, status=data.status, notes=data.notes)
 
-    if result:
-        result.status = TestResultStatus(data.status)
-        result.notes = data.notes
-        result.performed_at = datetime.now(UTC)
-        result.performed_by_id = current_user.id
-    else:
-        result = TestResult(
-            job_id=job_id,
-            test_step_id=step_id,
-            status=TestResultStatus(data.status),
-            performed_by_id=current_user.id,
-            performed_at=datetime.now(UTC),
-            notes=data.notes
+    try:
+        await service.submit_results(job_id, [item], current_user.id)
+    except IntegrityError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Unknown job or test step",
         )
-        db.add(result)
 
-    await db.commit()
     return {"status": "success"}
 
 @router.post("/{job_id}/results/{step_id}/evidence", status_code=status.HTTP_201_CREATED)
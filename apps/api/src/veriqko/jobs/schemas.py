@@ -1,8 +1,13 @@
 """Job schemas."""
 
 from datetime import datetime
+from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+from veriqko.evidence.schemas import EvidenceListResponse
+from veriqko.parts.schemas import PartUsageResponse
+from veriqko.reports.schemas import ReportListResponse
 
 
 class JobCreate(BaseModel):
@@ -62,6 +67,23 @@ class JobTransition(BaseModel):
     reason: str | None = None
 
 
+class JobBulkTransition(BaseModel):
+    """Schema for transitioning many jobs at once, by id list or batch."""
+
+    job_ids: list[UUID] | None = Field(None, min_length=1, max_length=1000)
+    batch_id: str | None = None
+    target_status: str
+    notes: str | None = None
+    is_fully_tested: bool = True
+    reason: str | None = None
+
+    @model_validator(mode="after")
+    def require_one_selector(self) -> "JobBulkTransition":
+        if (self.job_ids is None) == (self.batch_id is None):
+            raise ValueError("Provide exactly one of job_ids or batch_id")
+        return self
+
+
 class DeviceSummary(BaseModel):
     """Device summary for job responses."""
 
@@ -175,6 +197,42 @@ class TransitionResponse(BaseModel):
     warnings: list[str] = []
 
 
+class BulkTransitionItem(BaseModel):
+    """Per-job outcome of a bulk transition."""
+
+    job_id: str
+    success: bool
+    from_status: str | None = None
+    errors: list[str] = []
+
+
+class BulkTransitionResponse(BaseModel):
+    """Response after a bulk transition."""
+
+    to_status: str
+    succeeded: int
+    failed: int
+    results: list[BulkTransitionItem]
+
+
+class BulkIntakeItem(BaseModel):
+    """Per-serial outcome of a bulk intake."""
+
+    serial_number: str
+    success: bool
+    job_id: str | None = None
+    ticket_id: int | None = None
+    errors: list[str] = []
+
+
+class BulkIntakeResponse(BaseModel):
+    """Response after a bulk intake."""
+
+    created: int
+    rejected: int
+    results: list[BulkIntakeItem]
+
+
 class JobHistoryResponse(BaseModel):
     """Job history entry response."""
 
@@ -215,7 +273,35 @@ class TestStepResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class JobWorkspaceResponse(BaseModel):
+    """Everything the job screen shows, in one payload."""
+
+    job: JobResponse
+    valid_transitions: list[str]
+    history: list[JobHistoryResponse]
+    # Cursor for /jobs/{id}/history when the first page is not the whole history
+    history_next_cursor: str | None = None
+    steps: list[TestStepResponse]
+    evidence: list[EvidenceListResponse]
+    reports: list[ReportListResponse]
+    parts: list[PartUsageResponse]
+
+
 class TestResultCreate(BaseModel):
     """Schema for submitting a test result."""
     status: str
     notes: str | None = None
+
+
+class TestResultBatchItem(BaseModel):
+    """One step result within a batch submission."""
+
+    test_step_id: UUID
+    status: str = Field(..., pattern="^(pass|fail|skip|pending)$")
+    notes: str | None = None
+
+
+class TestResultBatchCreate(BaseModel):
+    """Schema for submitting several step results at once."""
+
+    results: list[TestResultBatchItem] = Field(..., min_length=1, max_length=500)
@@ -2,17 +2,73 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+import asyncio
+import time
+from collections import Counter
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
 from uuid import uuid4
 
-from sqlalchemy import String, or_, select
+import structlog
+from sqlalchemy import (
+    Select,
+    and_,
+    exists,
+    func,
+    insert,
+    literal_column,
+    or_,
+    select,
+    true,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
+from sqlalchemy.orm.exc import StaleDataError
+
+from veriqko.config import get_settings
+from veriqko.db.bulk import copy_rows
+from veriqko.db.pagination import decode_cursor, encode_cursor
+from veriqko.devices.models import Brand, Device, GadgetType
+from veriqko.errors.exceptions import PreconditionFailedError
+from veriqko.jobs.loading import JobLoad, job_load_options
+from veriqko.jobs.models import Job, JobHistory, JobStatus, TestResult, TestResultStatus, TestStep
+from veriqko.jobs.schemas import JobBatchCreate, JobCreate, JobUpdate, TestResultBatchItem
+from veriqko.jobs.state_machine import BulkTransitionOutcome, JobStateMachine, TransitionResult
+from veriqko.outbox.service import COMPLETION_EMAIL, MIRADORE_ENROLL, PICEA_SYNC, OutboxService
+from veriqko.stats.service import StatusCounterService
+from veriqko.users.models import User
+
+logger = structlog.get_logger(__name__)
+
+# pg_trgm only indexes terms of at least three characters
+TRIGRAM_MIN_LENGTH = 3
+# Upper bound of the INTEGER ticket_id column
+TICKET_ID_MAX = 2**31 - 1
+
+
+def check_version(job: Job, expected_version: int | None) -> None:
+    """Raise PreconditionFailedError if the caller's copy of `job` is out of date."""
+    if expected_version is not None and job.version != expected_version:
+        raise PreconditionFailedError(
+            "Job has been modified since it was read",
+            details={"job_id": job.id, "current_version": job.version},
+        )
+
+
+@dataclass
+class IntakeOutcome:
+    """Per-serial outcome of a bulk intake."""
 
-from veriqko.devices.models import Device
-from veriqko.jobs.models import Job, JobHistory, JobStatus
-from veriqko.jobs.schemas import JobBatchCreate, JobCreate, JobUpdate
-from veriqko.jobs.state_machine import JobStateMachine, TransitionResult
+    serial_number: str
+    success: bool
+    job_id: str | None = None
+    ticket_id: int | None = None
+    errors: list[str] = field(default_factory=list)
 
 
 class JobRepository:
@@ -20,18 +76,13 @@ class JobRepository:
 
     def __init__(self, db: AsyncSession):
         self.db = db
+        self.counters = StatusCounterService(db)
 
-    async def get(self, job_id: str) -> Job | None:
-        """Get a job by ID with relationships."""
+    async def get(self, job_id: str, profile: JobLoad = JobLoad.DETAIL) -> Job | None:
+        """Get a job by ID, loading what the given profile needs."""
         stmt = (
             select(Job)
-            .options(
-                selectinload(Job.device).selectinload(Device.brand),
-                selectinload(Job.device).selectinload(Device.gadget_type),
-                selectinload(Job.assigned_technician),
-                selectinload(Job.current_station),
-                selectinload(Job.qc_technician),
-            )
+            .options(*job_load_options(profile))
             .where(Job.id == job_id, Job.deleted_at.is_(None))
         )
         result = await self.db.execute(stmt)
@@ -45,21 +96,153 @@ class JobRepository:
         limit: int = 50,
         offset: int = 0,
         current_user: User | None = None,
+        cursor: str | None = None,
     ) -> list[Job]:
-        """List jobs with optional filtering."""
-        from veriqko.enums import UserRole
+        """
+        List jobs with optional filtering.
 
+        When `cursor` is given, paging is keyset-based on `(created_at, id)` and
+        `offset` is ignored, so page cost does not grow with depth.
+        """
         stmt = (
             select(Job)
-            .options(
-                selectinload(Job.device).selectinload(Device.brand),
-                selectinload(Job.device).selectinload(Device.gadget_type),
-                selectinload(Job.assigned_technician)
+            .options(*job_load_options(JobLoad.LIST))
+            .where(Job.deleted_at.is_(None))
+        )
+        stmt = self._filter_list(
+            stmt, status, technician_id, search, limit, offset, current_user, cursor
+        )
+
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
+    async def list_rows(
+        self,
+        status: JobStatus | None = None,
+        technician_id: str | None = None,
+        search: str | None = None,
+        limit: int = 50,
+        offset: int = 0,
+        current_user: User | None = None,
+        cursor: str | None = None,
+    ) -> list[Row]:
+        """
+        List jobs as flat rows holding only the job list columns.
+
+        Same filtering and paging as `list`, but selects the device, brand,
+        type and technician names through joins instead of hydrating ORM
+        objects and their relationships.
+        """
+        stmt = (
+            select(
+                Job.id,
+                Job.serial_number,
+                Job.status,
+                Brand.name.label("device_brand"),
+                GadgetType.name.label("device_type"),
+                Device.model.label("device_model"),
+                User.full_name.label("assigned_technician_name"),
+                Job.customer_reference,
+                Job.created_at,
             )
+            .select_from(Job)
+            .outerjoin(Device, Job.device_id == Device.id)
+            .outerjoin(Brand, Device.brand_id == Brand.id)
+            .outerjoin(GadgetType, Device.type_id == GadgetType.id)
+            .outerjoin(User, Job.assigned_technician_id == User.id)
             .where(Job.deleted_at.is_(None))
-            .order_by(Job.created_at.desc())
+        )
+        stmt = self._filter_list(
+            stmt, status, technician_id, search, limit, offset, current_user, cursor
         )
 
+        result = await self.db.execute(stmt)
+        return list(result.all())
+
+    async def stream_export_rows(
+        self,
+        status: JobStatus | None = None,
+        technician_id: str | None = None,
+        search: str | None = None,
+        current_user: User | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[list[Row]]:
+        """
+        Yield every matching job, with test outcome counts, in batches.
+
+        Rows come from a server-side cursor (`yield_per`), so only one batch
+        is held in memory at a time. Same filters and order as `list`.
+        """
+        outcomes = (
+            select(
+                func.count()
+                .filter(TestResult.status == TestResultStatus.PASS)
+                .label("tests_passed"),
+                func.count()
+                .filter(TestResult.status == TestResultStatus.FAIL)
+                .label("tests_failed"),
+                func.count()
+                .filter(TestResult.status == TestResultStatus.SKIP)
+                .label("tests_skipped"),
+                func.string_agg(TestStep.name, literal_column("'; '"))
+                .filter(TestResult.status == TestResultStatus.FAIL)
+                .label("failed_steps"),
+            )
+            .select_from(TestResult)
+            .join(TestStep, TestResult.test_step_id == TestStep.id)
+            .where(TestResult.job_id == Job.id)
+            .lateral("outcomes")
+        )
+        stmt = (
+            select(
+                Job.id,
+                Job.ticket_id,
+                Job.serial_number,
+                Job.imei,
+                Job.status,
+                Brand.name.label("device_brand"),
+                GadgetType.name.label("device_type"),
+                Device.model.label("device_model"),
+                Job.customer_reference,
+                Job.batch_id,
+                User.full_name.label("assigned_technician_name"),
+                Job.created_at,
+                Job.completed_at,
+                outcomes.c.tests_passed,
+                outcomes.c.tests_failed,
+                outcomes.c.tests_skipped,
+                outcomes.c.failed_steps,
+            )
+            .select_from(Job)
+            .outerjoin(Device, Job.device_id == Device.id)
+            .outerjoin(Brand, Device.brand_id == Brand.id)
+            .outerjoin(GadgetType, Device.type_id == GadgetType.id)
+            .outerjoin(User, Job.assigned_technician_id == User.id)
+            .outerjoin(outcomes, true())
+            .where(Job.deleted_at.is_(None))
+        )
+        stmt = self._filter_list(stmt, status, technician_id, search, 0, 0, current_user, None)
+
+        result = await self.db.stream(stmt.execution_options(yield_per=batch_size))
+        async for partition in result.partitions():
+            yield partition
+
+    def _filter_list(
+        self,
+        stmt: Select,
+        status: JobStatus | None,
+        technician_id: str | None,
+        search: str | None,
+        limit: int,
+        offset: int,
+        current_user: User | None,
+        cursor: str | None,
+    ) -> Select:
+        """Apply list filters, newest-first ordering and paging to a jobs query."""
+        from veriqko.enums import UserRole
+
+        stmt = stmt.order_by(Job.created_at.desc(), Job.id.desc())
+
         # Customer filtering
         if current_user and current_user.role == UserRole.CUSTOMER:
             stmt = stmt.where(Job.customer_reference == current_user.email)
@@ -71,46 +254,77 @@ class JobRepository:
             stmt = stmt.where(Job.assigned_technician_id == technician_id)
 
         if search:
-            search_term = f"%{search}%"
-            stmt = stmt.where(
-                or_(
-                    Job.serial_number.ilike(search_term),
-                    Job.batch_id.ilike(search_term),
-                    Job.customer_reference.ilike(search_term),
-                    Job.ticket_id.cast(String).ilike(search_term),
-                )
-            )
+            stmt = stmt.where(self._search_clause(search))
 
-        if limit:
-            stmt = stmt.limit(limit)
-        if offset:
+        if cursor:
+            cursor_created_at, cursor_id = decode_cursor(cursor)
+            stmt = stmt.where(tuple_(Job.created_at, Job.id) < (cursor_created_at, cursor_id))
+        elif offset:
             stmt = stmt.offset(offset)
 
-        result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+        if limit:
+            stmt = stmt.limit(limit)
 
-    async def _get_next_ticket_id(self) -> int:
-        """Get the next sequential ticket ID."""
-        from sqlalchemy import func
-        stmt = select(func.max(Job.ticket_id))
-        max_id = await self.db.scalar(stmt)
-        return (max_id or 10000) + 1
+        return stmt
+
+    @staticmethod
+    def _search_clause(search: str):
+        """
+        Pick the cheapest index-backed predicate for a free-text job search.
+
+        - 15 digits: IMEI, exact match on the imei/serial_number b-tree indexes.
+        - Other numbers: exact ticket_id match, plus substring match on the text columns.
+        - Shorter than 3 characters: trigrams cannot help, so only exact matches.
+        - Anything else: ILIKE substring match served by the pg_trgm GIN indexes.
+        """
+        term = search.strip()
+        is_number = term.isascii() and term.isdigit()
+        text_columns = (Job.serial_number, Job.batch_id, Job.customer_reference)
+
+        if is_number and len(term) == 15:
+            return or_(Job.imei == term, Job.serial_number == term)
+
+        if len(term) < TRIGRAM_MIN_LENGTH:
+            clauses = [column == term for column in text_columns]
+        else:
+            escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            pattern = f"%{escaped}%"
+            clauses = [column.ilike(pattern, escape="\\") for column in text_columns]
+
+        if is_number and int(term) <= TICKET_ID_MAX:
+            clauses.append(Job.ticket_id == int(term))
+
+        return or_(*clauses)
+
+    async def reserve_ticket_ids(self, count: int) -> list[int]:
+        """
+        Reserve a block of ticket IDs from the ticket_id identity sequence.
+
+        nextval() never blocks or hands out a number twice, so parallel
+        intake stations can reserve at once. Blocks are not guaranteed to be
+        contiguous, and IDs of rolled-back transactions are not reused.
+        """
+        if count <= 0:
+            return []
+        stmt = select(func.nextval(func.pg_get_serial_sequence("jobs", "ticket_id"))).select_from(
+            func.generate_series(1, count)
+        )
+        return sorted((await self.db.scalars(stmt)).all())
 
     async def create(self, data: JobCreate, user_id: str) -> Job:
         """Create a new job."""
         if data.imei:
-            from veriqko.integrations.gsma import gsma_client
             from fastapi import HTTPException
+
+            from veriqko.integrations.gsma import gsma_client
             is_blacklisted = await gsma_client.check_imei_blacklist(data.imei)
             if is_blacklisted:
                 raise HTTPException(status_code=400, detail="Device IMEI is blacklisted by GSMA")
 
         now = datetime.now(UTC)
-        ticket_id = await self._get_next_ticket_id()
-        from datetime import timedelta
+        # ticket_id comes from the identity sequence
         job = Job(
             id=str(uuid4()),
-            ticket_id=ticket_id,
             device_id=data.device_id,
             serial_number=data.serial_number,
             imei=data.imei,
@@ -137,23 +351,25 @@ class JobRepository:
         )
         self.db.add(history)
         await self.db.flush()
+        await self.counters.record(entered={JobStatus.INTAKE: 1}, at=now)
 
         return await self.get(job.id)
 
     async def create_batch(self, data: JobBatchCreate, user_id: str) -> list[Job]:
         """Create multiple jobs."""
         now = datetime.now(UTC)
-        start_ticket_id = await self._get_next_ticket_id()
+        ticket_ids = await self.reserve_ticket_ids(len(data.serial_numbers))
         jobs = []
 
         common = data.common_data or {}
         device_id = common.get("device_id")
 
-        from veriqko.integrations.gsma import gsma_client
         from fastapi import HTTPException
 
+        from veriqko.integrations.gsma import gsma_client
+
         for i, sn in enumerate(data.serial_numbers):
-            # In a batch context, we usually do not have distinct IMEIs provided in the serial_numbers list 
+            # In a batch context, we usually do not have distinct IMEIs provided in the serial_numbers list
             # unless SN is used as IMEI. We will assume serial_numbers could be IMEI for the sake of the GSMA check
             # if the device is a phone. To be safe, we just check SN against GSMA if it looks like an IMEI (15 digits).
             if sn.isdigit() and len(sn) == 15:
@@ -162,7 +378,7 @@ class JobRepository:
                     raise HTTPException(status_code=400, detail=f"Device with IMEI {sn} is blacklisted by GSMA")
             job = Job(
                 id=str(uuid4()),
-                ticket_id=start_ticket_id + i,
+                ticket_id=ticket_ids[i],
                 device_id=device_id,
                 serial_number=sn,
                 imei=common.get("imei"),
@@ -192,35 +408,115 @@ class JobRepository:
             self.db.add(history)
 
         await self.db.flush()
+        await self.counters.record(entered={JobStatus.INTAKE: len(jobs)}, at=now)
         return jobs
 
-    async def update(self, job_id: str, data: JobUpdate) -> Job | None:
-        """Update a job."""
+    async def bulk_insert(
+        self, serial_numbers: list[str], data: JobBatchCreate, user_id: str
+    ) -> list[tuple[str, int]]:
+        """
+        Insert intake jobs and their history rows in two bulk statements.
+
+        Returns `(job_id, ticket_id)` per serial, in input order.
+        """
+        now = datetime.now(UTC)
+        ticket_ids = await self.reserve_ticket_ids(len(serial_numbers))
+
+        common = data.common_data or {}
+        job_rows = [
+            {
+                "id": str(uuid4()),
+                "ticket_id": ticket_ids[i],
+                "device_id": common.get("device_id"),
+                "serial_number": sn,
+                "imei": common.get("imei"),
+                "customer_reference": data.customer_reference or common.get("customer_reference"),
+                "batch_id": data.batch_id or common.get("batch_id"),
+                "intake_condition": common.get("intake_condition"),
+                "status": JobStatus.INTAKE,
+                "assigned_technician_id": user_id,
+                "intake_started_at": now,
+                "sla_due_at": now + timedelta(hours=24),
+                "picea_mdm_locked": False,
+                "picea_erase_confirmed": False,
+                "is_fully_tested": True,
+                "version": 1,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i, sn in enumerate(serial_numbers)
+        ]
+        history_rows = [
+            {
+                "id": str(uuid4()),
+                "job_id": row["id"],
+                "from_status": None,
+                "to_status": JobStatus.INTAKE,
+                "changed_by_id": user_id,
+                "changed_at": now,
+                "notes": "Job created (Bulk intake)",
+            }
+            for row in job_rows
+        ]
+
+        await copy_rows(self.db, Job.__table__, job_rows)
+        await copy_rows(self.db, JobHistory.__table__, history_rows)
+        await self.counters.record(entered={JobStatus.INTAKE: len(job_rows)}, at=now)
+
+        return [(row["id"], row["ticket_id"]) for row in job_rows]
+
+    async def update(
+        self, job_id: str, data: JobUpdate, expected_version: int | None = None
+    ) -> Job | None:
+        """
+        Update a job.
+
+        With `expected_version`, the update only applies if the job is still
+        at that version (see check_version).
+        """
         job = await self.get(job_id)
         if not job:
             return None
+        check_version(job, expected_version)
 
         update_data = data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(job, field, value)
+        for attr, value in update_data.items():
+            setattr(job, attr, value)
 
-        await self.db.flush()
+        await self.flush_versioned(job)
         return await self.get(job_id)
 
+    async def flush_versioned(self, job: Job) -> None:
+        """
+        Flush pending changes to `job`.
+
+        The UPDATE is guarded by the version the job was loaded at, so a
+        write committed by someone else in the meantime raises
+        PreconditionFailedError instead of being overwritten.
+        """
+        try:
+            await self.db.flush()
+        except StaleDataError:
+            raise PreconditionFailedError(
+                "Job was modified by another request",
+                details={"job_id": job.id},
+            )
+
     async def update_status(
         self,
-        job_id: str,
+        job: Job,
         status: JobStatus,
         user_id: str,
         notes: str | None = None,
         is_fully_tested: bool = True,
         skip_reason: str | None = None,
-    ) -> Job | None:
-        """Update job status and record history."""
-        job = await self.get(job_id)
-        if not job:
-            return None
+    ) -> Job:
+        """
+        Update status of an already-loaded job and record history.
 
+        The job is modified in place and flushed in one round trip; callers
+        keep using the same instance instead of reloading it.
+        """
         now = datetime.now(UTC)
         old_status = job.status
 
@@ -231,23 +527,15 @@ class JobRepository:
             job.skip_reason = skip_reason
 
         # Update relevant timestamp
-        if status == JobStatus.RESET:
-            job.intake_completed_at = now
-            job.reset_started_at = now
-        elif status == JobStatus.FUNCTIONAL:
-            job.reset_completed_at = now
-            job.functional_started_at = now
-        elif status == JobStatus.QC:
-            job.functional_completed_at = now
-            job.qc_started_at = now
-        elif status == JobStatus.COMPLETED:
-            job.qc_completed_at = now
-            job.completed_at = now
+        for attr, value in self._status_timestamps(status, now).items():
+            setattr(job, attr, value)
+        # Set explicitly so the flushed instance needs no refresh
+        job.updated_at = now
 
         # Create history entry
         history = JobHistory(
             id=str(uuid4()),
-            job_id=job_id,
+            job_id=job.id,
             from_status=old_status,
             to_status=status,
             changed_by_id=user_id,
@@ -255,29 +543,127 @@ class JobRepository:
             notes=notes or skip_reason,
         )
         self.db.add(history)
-        await self.db.flush()
+        await self.flush_versioned(job)
+        await self.counters.record(entered={status: 1}, left={old_status: 1}, at=now)
 
-        return await self.get(job_id)
+        return job
+
+    @staticmethod
+    def _status_timestamps(status: JobStatus, now: datetime) -> dict[str, datetime]:
+        """Workflow timestamp fields to set when entering `status`."""
+        if status == JobStatus.RESET:
+            return {"intake_completed_at": now, "reset_started_at": now}
+        if status == JobStatus.FUNCTIONAL:
+            return {"reset_completed_at": now, "functional_started_at": now}
+        if status == JobStatus.QC:
+            return {"functional_completed_at": now, "qc_started_at": now}
+        if status == JobStatus.COMPLETED:
+            return {"qc_completed_at": now, "completed_at": now}
+        return {}
+
+    async def bulk_update_status(
+        self,
+        from_statuses: dict[str, JobStatus],
+        status: JobStatus,
+        user_id: str,
+        notes: str | None = None,
+        is_fully_tested: bool = True,
+        skip_reason: str | None = None,
+    ) -> list[Row]:
+        """
+        Move many jobs to `status` with one UPDATE and one history INSERT.
+
+        `from_statuses` maps job id to the status it was validated in; a job
+        whose status changed since then is left untouched. Returns
+        `(id, serial_number, customer_reference)` rows for the jobs that
+        were actually updated.
+        """
+        if not from_statuses:
+            return []
+
+        now = datetime.now(UTC)
+        # Core UPDATE bypasses the mapper's version counter, so bump it here
+        values = {"status": status, "is_fully_tested": is_fully_tested, "version": Job.version + 1}
+        if skip_reason:
+            values["skip_reason"] = skip_reason
+        values.update(self._status_timestamps(status, now))
 
-    async def get_history(self, job_id: str) -> list[JobHistory]:
-        """Get job history entries."""
+        stmt = (
+            update(Job)
+            .where(
+                tuple_(Job.id, Job.status).in_(list(from_statuses.items())),
+                Job.deleted_at.is_(None),
+            )
+            .values(**values)
+            .returning(Job.id, Job.serial_number, Job.customer_reference)
+            .execution_options(synchronize_session=False)
+        )
+        updated = list((await self.db.execute(stmt)).all())
+
+        if updated:
+            await self.db.execute(
+                insert(JobHistory),
+                [
+                    {
+                        "id": str(uuid4()),
+                        "job_id": job_id,
+                        "from_status": from_statuses[job_id],
+                        "to_status": status,
+                        "changed_by_id": user_id,
+                        "changed_at": now,
+                        "notes": notes or skip_reason,
+                    }
+                    for job_id in (row.id for row in updated)
+                ],
+            )
+            await self.counters.record(
+                entered={status: len(updated)},
+                left=Counter(from_statuses[row.id] for row in updated),
+                at=now,
+            )
+
+        return updated
+
+    async def get_history(
+        self, job_id: str, limit: int = 100, cursor: str | None = None
+    ) -> list[JobHistory]:
+        """
+        Get a page of job history entries, newest first.
+
+        Raises ValueError if the cursor is malformed.
+        """
         stmt = (
             select(JobHistory)
-            .options(selectinload(JobHistory.changed_by))
+            .options(joinedload(JobHistory.changed_by))
             .where(JobHistory.job_id == job_id)
-            .order_by(JobHistory.changed_at.desc())
+            .order_by(JobHistory.changed_at.desc(), JobHistory.id.desc())
+            .limit(limit)
         )
+        if cursor:
+            cursor_changed_at, cursor_id = decode_cursor(cursor)
+            stmt = stmt.where(
+                # The plain bound lets the planner prune newer partitions
+                JobHistory.changed_at <= cursor_changed_at,
+                tuple_(JobHistory.changed_at, JobHistory.id) < (cursor_changed_at, cursor_id),
+            )
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
-    async def delete(self, job_id: str) -> bool:
-        """Soft delete a job."""
-        job = await self.get(job_id)
+    async def delete(self, job_id: str, expected_version: int | None = None) -> bool:
+        """
+        Soft delete a job.
+
+        With `expected_version`, the delete only applies if the job is still
+        at that version (see check_version).
+        """
+        job = await self.get(job_id, JobLoad.GUARD)
         if not job:
             return False
+        check_version(job, expected_version)
 
         job.deleted_at = datetime.now(UTC)
-        await self.db.flush()
+        await self.flush_versioned(job)
+        await self.counters.record(left={job.status: 1})
         return True
 
 
@@ -287,6 +673,19 @@ class EvidenceRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    async def exists_for_job_stage(self, job_id: str, stage: JobStatus) -> bool:
+        """Check whether any current evidence exists for a job stage."""
+        from veriqko.evidence.models import Evidence
+
+        stmt = select(
+            exists().where(
+                Evidence.job_id == job_id,
+                Evidence.stage == stage,
+                Evidence.superseded_at.is_(None),
+            )
+        )
+        return bool(await self.db.scalar(stmt))
+
     async def get_for_job_stage(self, job_id: str, stage: JobStatus) -> list:
         """Get evidence for a specific job stage."""
         from veriqko.evidence.models import Evidence
@@ -300,6 +699,78 @@ class EvidenceRepository:
         return list(result.scalars().all())
 
 
+class TestResultRepository:
+    """Repository for job test results."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_for_steps(self, job_id: str, step_ids: list[str]) -> list[Row]:
+        """
+        A job's results for the given steps, one row per evidence item.
+
+        Results without evidence come back once with null evidence columns.
+        """
+        from veriqko.evidence.models import Evidence
+
+        if not step_ids:
+            return []
+
+        stmt = (
+            select(
+                TestResult.test_step_id,
+                TestResult.status,
+                TestResult.notes,
+                Evidence.id.label("evidence_id"),
+                Evidence.original_filename,
+                Evidence.evidence_type,
+                Evidence.created_at.label("evidence_created_at"),
+            )
+            .outerjoin(Evidence, Evidence.test_result_id == TestResult.id)
+            .where(TestResult.job_id == job_id, TestResult.test_step_id.in_(step_ids))
+            .order_by(Evidence.created_at)
+        )
+        return list((await self.db.execute(stmt)).all())
+
+    async def upsert_many(
+        self, job_id: str, results: list[TestResultBatchItem], user_id: str
+    ) -> int:
+        """
+        Insert or update results for several steps in one statement.
+
+        Relies on the `(job_id, test_step_id)` unique constraint. If a step
+        appears more than once, the last entry wins.
+        """
+        now = datetime.now(UTC)
+        by_step = {str(item.test_step_id): item for item in results}
+        rows = [
+            {
+                "id": str(uuid4()),
+                "job_id": job_id,
+                "test_step_id": step_id,
+                "status": TestResultStatus(item.status),
+                "notes": item.notes,
+                "performed_by_id": user_id,
+                "performed_at": now,
+            }
+            for step_id, item in by_step.items()
+        ]
+
+        stmt = pg_insert(TestResult).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_test_results_job_step",
+            set_={
+                "status": stmt.excluded.status,
+                "notes": stmt.excluded.notes,
+                "performed_by_id": stmt.excluded.performed_by_id,
+                "performed_at": stmt.excluded.performed_at,
+                "updated_at": func.now(),
+            },
+        )
+        await self.db.execute(stmt)
+        return len(rows)
+
+
 class JobService:
     """Job service for business logic."""
 
@@ -307,11 +778,12 @@ class JobService:
         self.db = db
         self.repo = JobRepository(db)
         self.evidence_repo = EvidenceRepository(db)
+        self.result_repo = TestResultRepository(db)
         self.state_machine = JobStateMachine(self.repo, self.evidence_repo)
 
-    async def get(self, job_id: str) -> Job | None:
+    async def get(self, job_id: str, profile: JobLoad = JobLoad.DETAIL) -> Job | None:
         """Get a job by ID."""
-        return await self.repo.get(job_id)
+        return await self.repo.get(job_id, profile)
 
     async def list(
         self,
@@ -321,6 +793,7 @@ class JobService:
         limit: int = 50,
         offset: int = 0,
         current_user: User | None = None,
+        cursor: str | None = None,
     ) -> list[Job]:
         """List jobs."""
 
@@ -335,9 +808,56 @@ class JobService:
             search=search,
             limit=limit,
             offset=offset,
-            current_user=current_user
+            current_user=current_user,
+            cursor=cursor,
         )
 
+    async def list_rows(
+        self,
+        status: str | None = None,
+        technician_id: str | None = None,
+        search: str | None = None,
+        limit: int = 50,
+        offset: int = 0,
+        current_user: User | None = None,
+        cursor: str | None = None,
+    ) -> list[Row]:
+        """List jobs as flat rows for list views."""
+        return await self.repo.list_rows(
+            status=JobStatus(status) if status else None,
+            technician_id=technician_id,
+            search=search,
+            limit=limit,
+            offset=offset,
+            current_user=current_user,
+            cursor=cursor,
+        )
+
+    def stream_export_rows(
+        self,
+        status: str | None = None,
+        technician_id: str | None = None,
+        search: str | None = None,
+        current_user: User | None = None,
+    ) -> AsyncIterator[list[Row]]:
+        """Batches of export rows for every matching job."""
+        return self.repo.stream_export_rows(
+            status=JobStatus(status) if status else None,
+            technician_id=technician_id,
+            search=search,
+            current_user=current_user,
+        )
+
+    @staticmethod
+    def next_cursor(
+        jobs: list[Job] | list[Row], limit: int, timestamp_attr: str = "created_at"
+    ) -> str | None:
+        """Cursor for the page after `jobs`, or None if this was the last page."""
+        if not jobs or len(jobs) < limit:
+            return None
+        last = jobs[-1]
+        return encode_cursor(getattr(last, timestamp_attr), last.id)
+
     async def create(self, data: JobCreate, user_id: str) -> Job:
         """Create a new job."""
         return await self.repo.create(data, user_id)
@@ -346,9 +866,92 @@ class JobService:
         """Create multiple jobs."""
         return await self.repo.create_batch(data, user_id)
 
-    async def update(self, job_id: str, data: JobUpdate) -> Job | None:
-        """Update a job."""
-        return await self.repo.update(job_id, data)
+    async def bulk_intake(self, data: JobBatchCreate, user_id: str) -> list[IntakeOutcome]:
+        """
+        Intake a pallet of serials, accepting the clean ones and rejecting the rest.
+
+        GSMA checks run concurrently (bounded by `intake_gsma_concurrency`) and
+        accepted jobs are written with one bulk load each for jobs and history.
+        Results keep the request order.
+        """
+        started = time.perf_counter()
+        outcomes = [IntakeOutcome(serial_number=sn, success=False) for sn in data.serial_numbers]
+
+        seen: set[str] = set()
+        to_check: list[IntakeOutcome] = []
+        for outcome in outcomes:
+            sn = outcome.serial_number.strip()
+            if not sn or len(sn) > 100:
+                outcome.errors.append("Serial number must be 1-100 characters")
+            elif sn in seen:
+                outcome.errors.append("Duplicate serial number in request")
+            else:
+                seen.add(sn)
+                outcome.serial_number = sn
+                to_check.append(outcome)
+
+        await self._screen_blacklist(to_check)
+
+        accepted = [o for o in to_check if not o.errors]
+        if accepted:
+            created = await self.repo.bulk_insert(
+                [o.serial_number for o in accepted], data, user_id
+            )
+            for outcome, (job_id, ticket_id) in zip(accepted, created):
+                outcome.success = True
+                outcome.job_id = job_id
+                outcome.ticket_id = ticket_id
+
+        elapsed = time.perf_counter() - started
+        logger.info(
+            "Bulk intake finished",
+            batch_id=data.batch_id,
+            created=len(accepted),
+            rejected=len(outcomes) - len(accepted),
+            jobs_per_second=round(len(accepted) / elapsed, 1) if elapsed else None,
+        )
+        return outcomes
+
+    async def _screen_blacklist(self, outcomes: list[IntakeOutcome]) -> None:
+        from veriqko.integrations.gsma import gsma_client
+
+        # Only serials that look like an IMEI (15 digits) are checked, as in create_batch
+        imei_like = [
+            o for o in outcomes if o.serial_number.isdigit() and len(o.serial_number) == 15
+        ]
+        semaphore = asyncio.Semaphore(get_settings().intake_gsma_concurrency)
+
+        async def check(imei: str) -> bool:
+            async with semaphore:
+                return await gsma_client.check_imei_blacklist(imei)
+
+        results = await asyncio.gather(
+            *(check(o.serial_number) for o in imei_like),
+            return_exceptions=True,
+        )
+        for outcome, result in zip(imei_like, results):
+            if isinstance(result, BaseException):
+                outcome.errors.append("GSMA blacklist check failed")
+            elif result:
+                outcome.errors.append(
+                    f"Device with IMEI {outcome.serial_number} is blacklisted by GSMA"
+                )
+
+    async def update(
+        self, job_id: str, data: JobUpdate, expected_version: int | None = None
+    ) -> Job | None:
+        """Update a job, optionally only if it is still at `expected_version`."""
+        return await self.repo.update(job_id, data, expected_version)
+
+    async def delete(self, job_id: str, expected_version: int | None = None) -> bool:
+        """Soft delete a job, optionally only if it is still at `expected_version`."""
+        return await self.repo.delete(job_id, expected_version)
+
+    async def submit_results(
+        self, job_id: str, results: list[TestResultBatchItem], user_id: str
+    ) -> int:
+        """Record several step results for a job at once."""
+        return await self.result_repo.upsert_many(job_id, results, user_id)
 
     async def transition(
         self,
@@ -358,17 +961,25 @@ class JobService:
         notes: str | None = None,
         is_fully_tested: bool = True,
         skip_reason: str | None = None,
+        expected_version: int | None = None,
     ) -> tuple[Job | None, TransitionResult]:
-        """Transition job to a new status."""
+        """
+        Transition job to a new status.
+
+        The job is loaded once; guards, the status update and the response
+        all work on that same instance. With `expected_version`, raises
+        PreconditionFailedError if the job has moved on since the caller
+        read it.
+        """
         job = await self.repo.get(job_id)
         if not job:
             return None, None
+        check_version(job, expected_version)
 
         target = JobStatus(target_status)
 
         result = await self.state_machine.transition(
-            job_id=job_id,
-            current_status=job.status,
+            job=job,
             target_status=target,
             user_id=user_id,
             notes=notes,
@@ -377,7 +988,7 @@ class JobService:
 
         if result.success:
             job = await self.repo.update_status(
-                job_id,
+                job,
                 target,
                 user_id,
                 notes,
@@ -385,50 +996,161 @@ class JobService:
                 skip_reason=skip_reason
             )
 
-            # Auto-trigger Picea sync when moving to RESET
-            if target == JobStatus.RESET:
-                from veriqko.integrations.picea.service import PiceaService
-                picea_service = PiceaService(self.db)
-                # Fire and forget/BG task ideally, but for now we wait to ensure UI updates with fresh data
-                await picea_service.sync_job_diagnostics(job_id, user_id)
-                # Re-fetch job to get updated Picea fields
-                job = await self.repo.get(job_id)
+            self._enqueue_side_effects(
+                job.id, job.serial_number, job.customer_reference, target, user_id
+            )
+
+        return job, result
+
+    def _enqueue_side_effects(
+        self,
+        job_id: str,
+        serial_number: str,
+        customer_reference: str | None,
+        target: JobStatus,
+        user_id: str,
+    ) -> None:
+        """
+        Record integration side effects of a transition in the outbox.
+
+        They commit with the transition and are delivered by the outbox
+        dispatcher, so vendor latency never reaches the request.
+        """
+        outbox = OutboxService(self.db)
+
+        # Auto-trigger Picea sync when moving to RESET
+        if target == JobStatus.RESET:
+            outbox.enqueue(PICEA_SYNC, {"job_id": job_id, "user_id": user_id})
+
+        if target == JobStatus.COMPLETED:
+            customer_email = None
+            if customer_reference and "@" in customer_reference:
+                customer_email = customer_reference
 
             # Send completion email if job is completed
-            if target == JobStatus.COMPLETED:
-                from veriqko.integrations.email import email_service
-
-                customer_email = None
-                if job.customer_reference and "@" in job.customer_reference:
-                    customer_email = job.customer_reference
-
-                if customer_email:
-                    customer_name = "Valued Customer"
-                    # Fire and forget (bg task in production)
-                    await email_service.send_completion_email(
-                        recipient_email=customer_email,
-                        recipient_name=customer_name,
-                        job_id=job.id,
-                        serial_number=job.serial_number
-                    )
-                else:
-                    # Log that no email was sent
-                    import logging
-                    logging.getLogger("veriqko").info(f"No customer email found in reference for job {job.id}, skipping completion email")
-
-                # Trigger Miradore MDM re-enrollment
-                from veriqko.integrations.miradore import miradore_client
-                import asyncio
-                
-                # Run as a background pseudo-task by attaching to the event loop un-awaited to avoid blocking response
-                # (in a real production setup this would be an APScheduler/Celery task)
-                asyncio.create_task(miradore_client.enroll_device(job.serial_number, customer_email))
+            if customer_email:
+                outbox.enqueue(COMPLETION_EMAIL, {
+                    "recipient_email": customer_email,
+                    "recipient_name": "Valued Customer",
+                    "job_id": job_id,
+                    "serial_number": serial_number,
+                })
+            else:
+                logger.info(
+                    "No customer email in reference, skipping completion email", job_id=job_id
+                )
 
-        return job, result
+            # Trigger Miradore MDM re-enrollment
+            outbox.enqueue(
+                MIRADORE_ENROLL, {"serial_number": serial_number, "user_email": customer_email}
+            )
+
+    async def bulk_transition(
+        self,
+        target_status: str,
+        user_id: str,
+        job_ids: list[str] | None = None,
+        batch_id: str | None = None,
+        notes: str | None = None,
+        is_fully_tested: bool = True,
+        skip_reason: str | None = None,
+    ) -> list[BulkTransitionOutcome]:
+        """
+        Transition many jobs at once using set-based SQL.
+
+        Transition rules and guards are evaluated for all jobs in a single
+        SELECT, then eligible jobs are moved by `JobRepository.bulk_update_status`.
+        Integration side effects are queued in the outbox, as for single transitions.
+        """
+        target = JobStatus(target_status)
+        allowed_from = [
+            status
+            for status, targets in self.state_machine.TRANSITIONS.items()
+            if target in targets
+        ]
+
+        # One boolean column per guard, true when the job fails that guard
+        guards = []
+        for from_status in allowed_from:
+            for condition, error in self.state_machine.guard_conditions(
+                from_status, target, is_fully_tested
+            ):
+                label = f"guard_{len(guards)}"
+                failed = and_(Job.status == from_status, condition.is_not(True))
+                guards.append((label, error, failed.label(label)))
+
+        stmt = select(
+            Job.id,
+            Job.status,
+            *(column for _, _, column in guards),
+        ).where(Job.deleted_at.is_(None))
+        if job_ids is not None:
+            stmt = stmt.where(Job.id.in_(job_ids))
+        else:
+            stmt = stmt.where(Job.batch_id == batch_id)
+
+        rows = (await self.db.execute(stmt)).all()
+
+        outcomes: dict[str, BulkTransitionOutcome] = {}
+        eligible: dict[str, JobStatus] = {}
+        for row in rows:
+            if row.status not in allowed_from:
+                outcomes[row.id] = BulkTransitionOutcome(
+                    job_id=row.id,
+                    success=False,
+                    from_status=row.status,
+                    errors=[f"Cannot transition from {row.status.value} to {target.value}"],
+                )
+                continue
+
+            errors = [error for label, error, _ in guards if getattr(row, label)]
+            if errors:
+                outcomes[row.id] = BulkTransitionOutcome(
+                    job_id=row.id, success=False, from_status=row.status, errors=errors
+                )
+            else:
+                eligible[row.id] = row.status
+
+        updated = await self.repo.bulk_update_status(
+            eligible,
+            target,
+            user_id,
+            notes,
+            is_fully_tested=is_fully_tested,
+            skip_reason=skip_reason,
+        )
+        updated_ids = {row.id for row in updated}
+        for row in updated:
+            self._enqueue_side_effects(
+                row.id, row.serial_number, row.customer_reference, target, user_id
+            )
+        for job_id, from_status in eligible.items():
+            if job_id in updated_ids:
+                outcomes[job_id] = BulkTransitionOutcome(
+                    job_id=job_id, success=True, from_status=from_status
+                )
+            else:
+                outcomes[job_id] = BulkTransitionOutcome(
+                    job_id=job_id,
+                    success=False,
+                    from_status=from_status,
+                    errors=["Job was modified by another request"],
+                )
 
-    async def get_history(self, job_id: str) -> list[JobHistory]:
-        """Get job history."""
-        return await self.repo.get_history(job_id)
+        # Report requested ids that do not exist, preserving request order
+        if job_ids is not None:
+            return [
+                outcomes.get(job_id)
+                or BulkTransitionOutcome(job_id=job_id, success=False, errors=["Job not found"])
+                for job_id in dict.fromkeys(job_ids)
+            ]
+        return list(outcomes.values())
+
+    async def get_history(
+        self, job_id: str, limit: int = 100, cursor: str | None = None
+    ) -> list[JobHistory]:
+        """Get a page of job history."""
+        return await self.repo.get_history(job_id, limit, cursor)
 
     def get_valid_transitions(self, job: Job) -> list[str]:
         """Get valid transitions for a job."""
@@ -1,10 +1,12 @@
 """Job workflow state machine."""
 
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 
-from veriqko.jobs.models import JobStatus
+from sqlalchemy import ColumnElement, Text, and_, exists, func, select
+
+from veriqko.jobs.models import Job, JobStatus
 
 
 @dataclass
@@ -30,6 +32,16 @@ class TransitionResult:
     errors: list[str]
 
 
+@dataclass
+class BulkTransitionOutcome:
+    """Per-job result of a bulk transition."""
+
+    job_id: str
+    success: bool
+    from_status: JobStatus | None = None
+    errors: list[str] = field(default_factory=list)
+
+
 # Type aliases
 Guard = Callable[[TransitionContext, "JobRepository"], tuple[bool, str | None]]
 
@@ -91,17 +103,21 @@ class JobStateMachine:
 
     async def transition(
         self,
-        job_id: str,
-        current_status: JobStatus,
+        job: Job,
         target_status: JobStatus,
         user_id: str,
         notes: str | None = None,
         force: bool = False,
         is_fully_tested: bool = True,
     ) -> TransitionResult:
-        """Execute a state transition."""
+        """
+        Validate a state transition for an already-loaded job.
+
+        Guards read the job snapshot directly and only go back to the
+        database for EXISTS probes, so validation never reloads the job.
+        """
         timestamp = datetime.now(UTC)
-        errors = []
+        current_status = job.status
         warnings = []
 
         # Validate transition
@@ -119,7 +135,7 @@ class JobStateMachine:
 
         # Run transition-specific guards
         if not force:
-            guard_errors = await self._run_guards(job_id, current_status, target_status, user_id, is_fully_tested)
+            guard_errors = await self._run_guards(job, target_status, is_fully_tested)
             if guard_errors:
                 return TransitionResult(
                     success=False,
@@ -141,39 +157,87 @@ class JobStateMachine:
 
     async def _run_guards(
         self,
-        job_id: str,
-        current_status: JobStatus,
+        job: Job,
         target_status: JobStatus,
-        user_id: str,
         is_fully_tested: bool = True,
     ) -> list[str]:
-        """Run transition-specific validation guards."""
+        """Run transition-specific validation guards against a job snapshot."""
         errors = []
+        current_status = job.status
 
         # INTAKE -> RESET: Require intake condition
         if current_status == JobStatus.INTAKE and target_status == JobStatus.RESET:
-            job = await self.job_repo.get(job_id)
             if not job.intake_condition:
                 errors.append("Intake condition assessment must be completed")
 
         # RESET -> FUNCTIONAL: Require reset evidence AND Picea Erase confirmation
         elif current_status == JobStatus.RESET and target_status == JobStatus.FUNCTIONAL:
-            evidence = await self.evidence_repo.get_for_job_stage(job_id, JobStatus.RESET)
-            if not evidence:
+            if not await self.evidence_repo.exists_for_job_stage(job.id, JobStatus.RESET):
                 errors.append("Factory reset evidence (photo/video) is required")
 
-            job = await self.job_repo.get(job_id)
             if is_fully_tested and not job.picea_erase_confirmed:
                 errors.append("Picea Data Erasure must be confirmed before proceeding to Functional Test")
 
         # QC -> COMPLETED: Require QC sign-off
         elif current_status == JobStatus.QC and target_status == JobStatus.COMPLETED:
-            job = await self.job_repo.get(job_id)
             if not job.qc_initials or not job.qc_technician_id:
                 errors.append("QC sign-off is required before completion")
 
         return errors
 
+    def guard_conditions(
+        self,
+        current_status: JobStatus,
+        target_status: JobStatus,
+        is_fully_tested: bool = True,
+    ) -> list[tuple[ColumnElement[bool], str]]:
+        """
+        SQL form of `_run_guards` for set-based checks over many jobs.
+
+        Returns (condition, error) pairs; a job passes a guard when its
+        condition evaluates true for that row.
+        """
+        from veriqko.evidence.models import Evidence
+
+        conditions = []
+
+        if current_status == JobStatus.INTAKE and target_status == JobStatus.RESET:
+            conditions.append((
+                and_(
+                    Job.intake_condition.is_not(None),
+                    Job.intake_condition.cast(Text).not_in(["null", "{}"]),
+                ),
+                "Intake condition assessment must be completed",
+            ))
+
+        elif current_status == JobStatus.RESET and target_status == JobStatus.FUNCTIONAL:
+            has_reset_evidence = exists(
+                select(Evidence.id).where(
+                    Evidence.job_id == Job.id,
+                    Evidence.stage == JobStatus.RESET,
+                    Evidence.superseded_at.is_(None),
+                )
+            )
+            conditions.append(
+                (has_reset_evidence, "Factory reset evidence (photo/video) is required")
+            )
+            if is_fully_tested:
+                conditions.append((
+                    Job.picea_erase_confirmed.is_(True),
+                    "Picea Data Erasure must be confirmed before proceeding to Functional Test",
+                ))
+
+        elif current_status == JobStatus.QC and target_status == JobStatus.COMPLETED:
+            conditions.append((
+                and_(
+                    func.coalesce(Job.qc_initials, "") != "",
+                    Job.qc_technician_id.is_not(None),
+                ),
+                "QC sign-off is required before completion",
+            ))
+
+        return conditions
+
     def get_timestamp_field(self, status: JobStatus, is_start: bool = True) -> str:
         """Get the timestamp field name for a status."""
         suffix = "started_at" if is_start else "completed_at"
@@ -0,0 +1,182 @@
+"""Job workspace: the job screen's data, fetched concurrently."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import joinedload
+
+from veriqko.config import get_settings
+from veriqko.db.base import async_session_factory
+from veriqko.evidence.models import Evidence, EvidenceType
+from veriqko.evidence.schemas import EvidenceListResponse
+from veriqko.jobs.models import Job, JobHistory, JobStatus
+from veriqko.jobs.schemas import EvidenceSummary, JobHistoryResponse, TestStepResponse
+from veriqko.jobs.service import JobRepository, JobService, TestResultRepository
+from veriqko.parts.models import PartUsage
+from veriqko.parts.schemas import PartUsageResponse
+from veriqko.reports.models import Report
+from veriqko.reports.schemas import ReportListResponse
+from veriqko.templates.cache import step_template_cache
+
+T = TypeVar("T")
+
+# Stations whose steps are shown on the job screen
+STEP_STAGES = (JobStatus.INTAKE, JobStatus.RESET, JobStatus.FUNCTIONAL, JobStatus.QC)
+# First page of history; the rest comes from /jobs/{id}/history with the cursor
+HISTORY_PAGE_SIZE = 100
+
+# Shared by every workspace load in the process, so concurrent loads cannot
+# drain the connection pool that other endpoints need
+_connection_slots = asyncio.Semaphore(get_settings().workspace_max_connections)
+
+
+def history_to_response(entry: JobHistory) -> JobHistoryResponse:
+    """Convert a history entry (with changed_by loaded) to its response schema."""
+    return JobHistoryResponse(
+        id=entry.id,
+        from_status=entry.from_status.value if entry.from_status else None,
+        to_status=entry.to_status.value,
+        changed_by_name=entry.changed_by.full_name if entry.changed_by else "Unknown",
+        changed_at=entry.changed_at,
+        notes=entry.notes,
+    )
+
+
+async def job_steps(db: AsyncSession, job: Job) -> list[TestStepResponse]:
+    """Steps of the job's current station with this job's results and evidence."""
+    # Completed and failed jobs show the last station's (QC) steps
+    if job.status in [JobStatus.COMPLETED, JobStatus.FAILED]:
+        display_stage = JobStatus.QC
+    else:
+        display_stage = job.status
+
+    if display_stage not in STEP_STAGES:
+        return []
+
+    # Templates come from the in-process cache; only this job's results hit the database
+    steps = await step_template_cache.get(db, job.device_id, display_stage)
+    rows = await TestResultRepository(db).get_for_steps(job.id, [step.id for step in steps])
+
+    results: dict[str, dict] = {}
+    for row in rows:
+        result = results.setdefault(
+            row.test_step_id,
+            {"status": row.status.value, "notes": row.notes, "evidence": []},
+        )
+        if row.evidence_id:
+            result["evidence"].append(
+                EvidenceSummary(
+                    id=row.evidence_id,
+                    original_filename=row.original_filename,
+                    evidence_type=row.evidence_type.value,
+                    created_at=row.evidence_created_at,
+                )
+            )
+
+    return [
+        TestStepResponse(
+            id=step.id,
+            name=step.name,
+            description=step.description,
+            sequence_order=step.sequence_order,
+            is_mandatory=step.is_mandatory,
+            requires_evidence=step.requires_evidence,
+            **results.get(step.id, {}),
+        )
+        for step in steps
+    ]
+
+
+async def _history(db: AsyncSession, job: Job) -> tuple[list[JobHistoryResponse], str | None]:
+    entries = await JobRepository(db).get_history(job.id, HISTORY_PAGE_SIZE)
+    next_cursor = JobService.next_cursor(entries, HISTORY_PAGE_SIZE, timestamp_attr="changed_at")
+    return [history_to_response(h) for h in entries], next_cursor
+
+
+async def _evidence(db: AsyncSession, job: Job) -> list[EvidenceListResponse]:
+    stmt = (
+        select(Evidence)
+        .where(Evidence.job_id == job.id, Evidence.superseded_at.is_(None))
+        .order_by(Evidence.captured_at.desc())
+    )
+    base_url = get_settings().base_url
+    return [
+        EvidenceListResponse(
+            id=e.id,
+            evidence_type=e.evidence_type.value,
+            original_filename=e.original_filename,
+            file_size_bytes=e.file_size_bytes,
+            captured_at=e.captured_at,
+            thumbnail_url=f"{base_url}/api/v1/evidence/{e.id}/thumbnail"
+            if e.evidence_type == EvidenceType.PHOTO
+            else None,
+        )
+        for e in (await db.execute(stmt)).scalars().all()
+    ]
+
+
+async def _reports(db: AsyncSession, job: Job) -> list[ReportListResponse]:
+    stmt = select(Report).where(Report.job_id == job.id).order_by(Report.generated_at.desc())
+    base_url = get_settings().base_url
+    return [
+        ReportListResponse(
+            id=r.id,
+            scope=r.scope.value,
+            variant=r.variant.value,
+            expires_at=r.expires_at,
+            generated_at=r.generated_at,
+            public_url=f"{base_url}/r/{r.access_token}",
+        )
+        for r in (await db.execute(stmt)).scalars().all()
+    ]
+
+
+async def _parts(db: AsyncSession, job: Job) -> list[PartUsageResponse]:
+    stmt = (
+        select(PartUsage)
+        .where(PartUsage.job_id == job.id)
+        .order_by(PartUsage.created_at)
+        .options(joinedload(PartUsage.part))
+    )
+    return [PartUsageResponse.model_validate(u) for u in (await db.execute(stmt)).scalars().all()]
+
+
+async def load_workspace(
+    job: Job,
+    session_factory: async_sessionmaker[AsyncSession] = async_session_factory,
+) -> dict:
+    """
+    Fetch the job screen's sub-resources for an already-loaded job.
+
+    Each query runs on its own pooled session so they proceed in parallel;
+    an AsyncSession cannot run two statements at once. The total latency is
+    that of the slowest query rather than the sum of all of them.
+
+    Connection cost: up to five pooled connections per load besides the
+    request's own. Across all loads in the process, at most
+    `workspace_max_connections` are held at once. Further sub-queries wait
+    for a slot, so busy periods slow the workspace, not other endpoints.
+    """
+
+    async def run(fetch: Callable[[AsyncSession, Job], Awaitable[T]]) -> T:
+        async with _connection_slots, session_factory() as db:
+            return await fetch(db, job)
+
+    (history, history_next_cursor), steps, evidence, reports, parts = await asyncio.gather(
+        run(_history),
+        run(job_steps),
+        run(_evidence),
+        run(_reports),
+        run(_parts),
+    )
+    return {
+        "history": history,
+        "history_next_cursor": history_next_cursor,
+        "steps": steps,
+        "evidence": evidence,
+        "reports": reports,
+        "parts": parts,
+    }
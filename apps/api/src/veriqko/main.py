@@ -1,6 +1,7 @@
 """Veriqko API - Main application."""
 
 from contextlib import asynccontextmanager
+from datetime import UTC, datetime
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
@@ -38,6 +39,94 @@ async def lifespan(app: FastAPI):
         replace_existing=True,
     )
 
+    if settings.archive_after_days:
+        from veriqko.cron.job_archiver import run_job_archiver
+
+        # Move long-finished jobs out of the hot tables
+        scheduler.add_job(
+            run_job_archiver,
+            IntervalTrigger(hours=1),
+            id="job_archiver",
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True,
+        )
+
+    from veriqko.cron.history_partitions import run_history_partition_maintenance
+
+    # Create job_history partitions ahead of time; first run at startup
+    scheduler.add_job(
+        run_history_partition_maintenance,
+        IntervalTrigger(hours=24),
+        id="history_partitions",
+        replace_existing=True,
+        next_run_time=datetime.now(UTC),
+    )
+
+    from veriqko.cron.counter_reconciler import run_counter_reconciler
+
+    # Repair drift in the dashboard's job status counters
+    scheduler.add_job(
+        run_counter_reconciler,
+        IntervalTrigger(minutes=settings.status_counter_reconcile_minutes),
+        id="counter_reconciler",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
+
+    from veriqko.cron.defect_rollup import run_defect_rollup
+
+    # Fold new test results into the defect heatmap rollup; first run at startup
+    scheduler.add_job(
+        run_defect_rollup,
+        IntervalTrigger(minutes=settings.defect_rollup_refresh_minutes),
+        id="defect_rollup",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+        next_run_time=datetime.now(UTC),
+    )
+
+    from veriqko.cron.technician_rollup import run_technician_rollup
+
+    # Fold new job history into the technician leaderboard rollup; first run at startup
+    scheduler.add_job(
+        run_technician_rollup,
+        IntervalTrigger(minutes=settings.technician_rollup_refresh_minutes),
+        id="technician_rollup",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+        next_run_time=datetime.now(UTC),
+    )
+
+    if settings.fact_export_enabled:
+        from veriqko.cron.fact_export import run_fact_export
+
+        # Write changed job/test result fact partitions for BI
+        scheduler.add_job(
+            run_fact_export,
+            IntervalTrigger(minutes=settings.fact_export_interval_minutes),
+            id="fact_export",
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True,
+        )
+
+    if settings.outbox_worker_enabled:
+        from veriqko.cron.outbox_dispatcher import run_outbox_dispatcher
+
+        # Drain integration side effects written by transitions
+        scheduler.add_job(
+            run_outbox_dispatcher,
+            IntervalTrigger(seconds=settings.outbox_poll_seconds),
+            id="outbox_dispatcher",
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True,
+        )
+
     scheduler.start()
     app.state.scheduler = scheduler
 
@@ -46,6 +135,10 @@ async def lifespan(app: FastAPI):
     # Shutdown
     scheduler.shutdown()
 
+    from veriqko.stats.floor import floor_broadcaster
+
+    await floor_broadcaster.stop()
+
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
@@ -82,6 +175,7 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["ETag", "X-Next-Cursor"],
     )
 
     # Logging Middleware
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+# Archive tables mirror the hot job tables and import them first
+from veriqko.archive.models import ArchivedJob, ArchivedReport  # noqa: F401
+
 # Import in dependency order to avoid circular imports
 # Base models first (no dependencies)
 from veriqko.devices.models import Brand, Device, GadgetType  # noqa: F401
@@ -9,10 +12,17 @@ from veriqko.evidence.models import Evidence  # noqa: F401
 
 # Then models that depend on base models
 from veriqko.jobs.models import Job, JobHistory, JobStatus  # noqa: F401
+from veriqko.outbox.models import OutboxEvent  # noqa: F401
 from veriqko.parts.models import Part, PartUsage  # noqa: F401
 from veriqko.printing.models import LabelTemplate  # noqa: F401
 from veriqko.reports.models import Report  # noqa: F401
 from veriqko.stations.models import Station  # noqa: F401
+from veriqko.stats.models import (  # noqa: F401
+    DefectRollup,
+    JobStatusCounter,
+    RollupWatermark,
+    TechnicianStageRollup,
+)
 from veriqko.users.models import User  # noqa: F401
 
 __all__ = [
@@ -29,4 +39,11 @@ __all__ = [
     "Part",
     "PartUsage",
     "LabelTemplate",
+    "OutboxEvent",
+    "JobStatusCounter",
+    "DefectRollup",
+    "RollupWatermark",
+    "TechnicianStageRollup",
+    "ArchivedJob",
+    "ArchivedReport",
 ]
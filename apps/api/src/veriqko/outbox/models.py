@@ -0,0 +1,59 @@
+"""Transactional outbox models."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from enum import StrEnum
+
+import sqlalchemy as sa
+from sqlalchemy import JSON, DateTime, Integer, String, Text
+from sqlalchemy.dialects.postgresql import ENUM
+from sqlalchemy.orm import Mapped, mapped_column
+
+from veriqko.db.base import Base, TimestampMixin, UUIDMixin
+
+
+class OutboxStatus(StrEnum):
+    """Delivery status of an outbox event."""
+
+    PENDING = "pending"
+    PROCESSING = "processing"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class OutboxEvent(Base, UUIDMixin, TimestampMixin):
+    """
+    Side effect recorded in the same transaction as the change that caused it.
+
+    Rows are drained by the outbox dispatcher after commit, so a slow or
+    unavailable vendor never holds up the request that enqueued it.
+    """
+
+    __tablename__ = "outbox_events"
+    __table_args__ = (
+        sa.Index("ix_outbox_events_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
+    effect: Mapped[str] = mapped_column(String(100), nullable=False)
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+
+    status: Mapped[OutboxStatus] = mapped_column(
+        # The Postgres type (migration 018) uses the lowercase values as labels
+        ENUM(
+            OutboxStatus,
+            name="outbox_status",
+            create_type=False,
+            values_callable=lambda x: [e.value for e in x],
+        ),
+        nullable=False,
+        default=OutboxStatus.PENDING,
+    )
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    next_attempt_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    locked_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    processed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<OutboxEvent {self.effect} ({self.status})>"
@@ -0,0 +1,186 @@
+"""Transactional outbox: enqueue side effects and dispatch them with retries."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import structlog
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from veriqko.config import Settings, get_settings
+from veriqko.db.base import async_session_factory
+from veriqko.outbox.models import OutboxEvent, OutboxStatus
+
+logger = structlog.get_logger(__name__)
+
+# Effect names
+PICEA_SYNC = "picea.sync_diagnostics"
+COMPLETION_EMAIL = "email.completion"
+MIRADORE_ENROLL = "miradore.enroll"
+
+Handler = Callable[[dict], Awaitable[None]]
+
+
+class OutboxService:
+    """Records side effects in the caller's transaction."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    def enqueue(self, effect: str, payload: dict) -> OutboxEvent:
+        """Add an event to the current session; it is delivered once the session commits."""
+        event = OutboxEvent(
+            id=str(uuid4()),
+            effect=effect,
+            payload=payload,
+            status=OutboxStatus.PENDING,
+            attempts=0,
+            next_attempt_at=datetime.now(UTC),
+        )
+        self.db.add(event)
+        return event
+
+
+async def _sync_picea(payload: dict) -> None:
+    from veriqko.integrations.picea.service import PiceaService
+
+    async with async_session_factory() as db:
+        # False means nothing to sync (not configured, no data); not worth retrying
+        await PiceaService(db).sync_job_diagnostics(payload["job_id"], payload["user_id"])
+
+
+async def _send_completion_email(payload: dict) -> None:
+    from veriqko.integrations.email import email_service
+
+    if not await email_service.send_completion_email(**payload):
+        raise RuntimeError("Completion email could not be delivered")
+
+
+async def _enroll_miradore(payload: dict) -> None:
+    from veriqko.integrations.miradore import miradore_client
+
+    if not miradore_client.is_configured:
+        return
+    if not await miradore_client.enroll_device(payload["serial_number"], payload.get("user_email")):
+        raise RuntimeError("Miradore enrollment request failed")
+
+
+HANDLERS: dict[str, Handler] = {
+    PICEA_SYNC: _sync_picea,
+    COMPLETION_EMAIL: _send_completion_email,
+    MIRADORE_ENROLL: _enroll_miradore,
+}
+
+
+class OutboxDispatcher:
+    """
+    Drains pending outbox events.
+
+    Events are claimed with `FOR UPDATE SKIP LOCKED`, so several dispatchers
+    (in-process or separate workers) can run side by side. Failures are
+    retried with exponential backoff until `outbox_max_attempts`.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] = async_session_factory,
+        handlers: dict[str, Handler] | None = None,
+        settings: Settings | None = None,
+    ):
+        self.session_factory = session_factory
+        self.handlers = handlers if handlers is not None else HANDLERS
+        self.settings = settings or get_settings()
+
+    async def claim(self) -> list[OutboxEvent]:
+        """Mark a batch of due events as processing and return them."""
+        now = datetime.now(UTC)
+        stale_before = now - timedelta(seconds=self.settings.outbox_lock_timeout_seconds)
+
+        async with self.session_factory() as db:
+            stmt = (
+                select(OutboxEvent)
+                .where(
+                    or_(
+                        and_(
+                            OutboxEvent.status == OutboxStatus.PENDING,
+                            OutboxEvent.next_attempt_at <= now,
+                        ),
+                        # Reclaim events from a dispatcher that died mid-delivery
+                        and_(
+                            OutboxEvent.status == OutboxStatus.PROCESSING,
+                            OutboxEvent.locked_at < stale_before,
+                        ),
+                    )
+                )
+                .order_by(OutboxEvent.next_attempt_at)
+                .limit(self.settings.outbox_batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            events = list((await db.execute(stmt)).scalars().all())
+
+            for event in events:
+                event.status = OutboxStatus.PROCESSING
+                event.attempts += 1
+                event.locked_at = now
+
+            await db.commit()
+            return events
+
+    async def dispatch_pending(self) -> int:
+        """Deliver one batch of due events. Returns the number of events attempted."""
+        events = await self.claim()
+        if not events:
+            return 0
+
+        semaphore = asyncio.Semaphore(self.settings.outbox_concurrency)
+        await asyncio.gather(*(self._deliver(event, semaphore) for event in events))
+        return len(events)
+
+    async def _deliver(self, event: OutboxEvent, semaphore: asyncio.Semaphore) -> None:
+        error = None
+        handler = self.handlers.get(event.effect)
+
+        async with semaphore:
+            if handler is None:
+                error = f"No handler registered for effect {event.effect}"
+            else:
+                try:
+                    await handler(event.payload)
+                except Exception as e:
+                    error = str(e) or e.__class__.__name__
+                    logger.warning(
+                        "Outbox delivery failed",
+                        event_id=event.id,
+                        effect=event.effect,
+                        attempt=event.attempts,
+                        error=error,
+                    )
+
+        await self._record(event, error)
+
+    async def _record(self, event: OutboxEvent, error: str | None) -> None:
+        now = datetime.now(UTC)
+        values: dict = {"locked_at": None, "last_error": error}
+
+        if error is None:
+            values.update(status=OutboxStatus.DONE, processed_at=now)
+        elif event.attempts >= self.settings.outbox_max_attempts:
+            values.update(status=OutboxStatus.FAILED, processed_at=now)
+            logger.error(
+                "Outbox event gave up", event_id=event.id, effect=event.effect, error=error
+            )
+        else:
+            values.update(
+                status=OutboxStatus.PENDING, next_attempt_at=now + self.backoff(event.attempts)
+            )
+
+        async with self.session_factory() as db:
+            await db.execute(update(OutboxEvent).where(OutboxEvent.id == event.id).values(**values))
+            await db.commit()
+
+    def backoff(self, attempts: int) -> timedelta:
+        """Delay before the next attempt, doubling per attempt up to one hour."""
+        seconds = self.settings.outbox_retry_base_seconds * 2 ** (attempts - 1)
+        return timedelta(seconds=min(seconds, 3600))
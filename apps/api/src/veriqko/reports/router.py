@@ -11,11 +11,13 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from veriqko.archive.service import ArchiveService
 from veriqko.config import get_settings
-from veriqko.db.base import get_db
+from veriqko.db.base import async_session_factory, get_db
+from veriqko.db.replica import get_read_db, read_replica
 from veriqko.dependencies import get_current_user
-from veriqko.devices.models import Device
-from veriqko.jobs.models import Job, TestResult
+from veriqko.jobs.loading import JobLoad, job_load_options
+from veriqko.jobs.models import Job
 from veriqko.reports.generator import ReportData, TestResultData, get_report_generator
 from veriqko.reports.models import Report, ReportScope, ReportVariant
 from veriqko.reports.qr import generate_access_token
@@ -78,13 +80,7 @@ async def create_report(
     # Get job with relationships
     stmt = (
         select(Job)
-        .options(
-            selectinload(Job.device).selectinload(Device.brand),
-            selectinload(Job.device).selectinload(Device.gadget_type),
-            selectinload(Job.assigned_technician),
-            selectinload(Job.qc_technician),
-            selectinload(Job.test_results).selectinload(TestResult.test_step),
-        )
+        .options(*job_load_options(JobLoad.REPORT))
         .where(Job.id == job_id, Job.deleted_at.is_(None))
     )
     result = await db.execute(stmt)
@@ -217,14 +213,7 @@ async def create_report(
 public_router = APIRouter(tags=["public"])
 
 
-@public_router.get("/r/{token}")
-async def get_public_report(
-    token: str,
-    db: Annotated[AsyncSession, Depends(get_db)],
-):
-    """Access a report via public token."""
-    settings = get_settings()
-
+async def _report_by_token(db: AsyncSession, token: str) -> Report | None:
     stmt = (
         select(Report)
         .options(selectinload(Report.job).selectinload(Job.device))
@@ -232,6 +221,25 @@ async def get_public_report(
     )
     result = await db.execute(stmt)
     report = result.scalar_one_or_none()
+    if not report:
+        # Reports of archived jobs move with them
+        report = await ArchiveService(db).get_report_by_token(token)
+    return report
+
+
+@public_router.get("/r/{token}")
+async def get_public_report(
+    token: str,
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+):
+    """Access a report via public token."""
+    settings = get_settings()
+
+    report = await _report_by_token(db, token)
+    if not report and read_replica.replica is not None:
+        # A report generated moments ago may not have reached the replica yet
+        async with async_session_factory() as primary:
+            report = await _report_by_token(primary, token)
 
     if not report:
         raise HTTPException(
@@ -4,12 +4,12 @@ from fastapi import APIRouter, Depends, HTTPException, status
 
 # Placeholder schemas (defining inline simple ones if no schemas.py)
 from pydantic import BaseModel, ConfigDict
-from sqlalchemy import and_, select
+from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from veriqko.db.base import get_db
 from veriqko.dependencies import get_current_user
-from veriqko.jobs.models import Job, JobStatus
+from veriqko.jobs.models import Job, JobStatus, active_job_criteria
 from veriqko.stations.models import Station
 from veriqko.users.models import User, UserRole
 
@@ -61,6 +61,15 @@ async def create_station(
     await db.refresh(station)
     return station
 
+def _station_queue_query(station_id: str) -> Select:
+    # Range scan on ix_jobs_active_station_updated_at, already in queue order
+    return (
+        select(Job)
+        .where(Job.current_station_id == station_id, active_job_criteria())
+        .order_by(Job.updated_at)
+    )
+
+
 @router.get("/{station_id}/queue")
 async def get_station_queue(
     station_id: str,
@@ -72,12 +81,5 @@ async def get_station_queue(
     if not station:
         raise HTTPException(status_code=404, detail="Station not found")
 
-    stmt = select(Job).where(
-        and_(
-            Job.current_station_id == station_id,
-            Job.status.notin_([JobStatus.COMPLETED, JobStatus.FAILED])
-        )
-    ).order_by(Job.updated_at)
-
-    result = await db.execute(stmt)
+    result = await db.execute(_station_queue_query(station_id))
     return result.scalars().all()
@@ -0,0 +1,143 @@
+"""Daily defect rollup behind the defect heatmap."""
+
+from datetime import UTC, date, datetime
+from typing import Any
+
+import sqlalchemy as sa
+from sqlalchemy import delete, func, insert, select, text, union, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from veriqko.archive.models import jobs_archive, test_results_archive
+from veriqko.devices.models import Device
+from veriqko.jobs.models import Job, TestResult, TestResultStatus, TestStep
+from veriqko.stats.models import DefectRollup
+from veriqko.stats.rollups import advance_watermark, on_utc_days, read_watermark, utc_day
+
+WATERMARK = "defect_rollup"
+# Heatmap rows returned
+HEATMAP_LIMIT = 100
+
+
+def _daily_outcomes(results: sa.Table, jobs: sa.Table, days: list[date] | None) -> sa.Select:
+    day = utc_day(results.c.created_at)
+    stmt = (
+        select(
+            day.label("day"),
+            Device.model.label("device_model"),
+            TestStep.name.label("test_step"),
+            func.count().filter(results.c.status == TestResultStatus.FAIL).label("failures"),
+            func.count().label("total"),
+        )
+        .select_from(results)
+        .join(jobs, jobs.c.id == results.c.job_id)
+        .join(Device, Device.id == jobs.c.device_id)
+        .join(TestStep, TestStep.id == results.c.test_step_id)
+        .where(
+            results.c.status.in_([TestResultStatus.PASS, TestResultStatus.FAIL]),
+            jobs.c.deleted_at.is_(None),
+        )
+        .group_by(day, Device.model, TestStep.name)
+    )
+    if days is not None:
+        stmt = stmt.where(on_utc_days(results.c.created_at, days))
+    return stmt
+
+
+class DefectRollupService:
+    """Maintains and reads defect_rollup in the caller's transaction."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def refresh(self, now: datetime | None = None) -> list[date] | None:
+        """
+        Rebuild the rollup for every day that gained, changed or lost results
+        since the last refresh; without a watermark, rebuild it entirely.
+
+        A day is recomputed from scratch rather than patched, so results that
+        flip between pass and fail, and jobs deleted after testing, come out
+        right. Archived results are included, so touching an old day does not
+        drop jobs that have since moved to the archive.
+
+        Holds an EXCLUSIVE lock on the rollup until the caller commits;
+        heatmap reads are not blocked. Returns the days rebuilt, or None
+        after a full rebuild.
+        """
+        now = now or datetime.now(UTC)
+        await self.db.execute(text("LOCK TABLE defect_rollup IN EXCLUSIVE MODE"))
+
+        since = await read_watermark(self.db, WATERMARK)
+        if since is None:
+            days = None
+            await self.db.execute(delete(DefectRollup))
+            await self._rebuild(days)
+        else:
+            days = await self._touched_days(since)
+            if days:
+                await self.db.execute(delete(DefectRollup).where(DefectRollup.day.in_(days)))
+                await self._rebuild(days)
+
+        await advance_watermark(self.db, WATERMARK, now)
+        return days
+
+    async def _touched_days(self, since: datetime) -> list[date]:
+        day = utc_day(TestResult.created_at)
+        stmt = union(
+            select(day).where(TestResult.updated_at >= since),
+            select(day).join(Job, Job.id == TestResult.job_id).where(Job.deleted_at >= since),
+        )
+        return sorted((await self.db.scalars(stmt)).all())
+
+    async def _rebuild(self, days: list[date] | None) -> None:
+        outcomes = union_all(
+            _daily_outcomes(TestResult.__table__, Job.__table__, days),
+            _daily_outcomes(test_results_archive, jobs_archive, days),
+        ).subquery()
+        merged = select(
+            outcomes.c.day,
+            outcomes.c.device_model,
+            outcomes.c.test_step,
+            func.sum(outcomes.c.failures),
+            func.sum(outcomes.c.total),
+        ).group_by(outcomes.c.day, outcomes.c.device_model, outcomes.c.test_step)
+        columns = ["day", "device_model", "test_step", "failures", "total"]
+        await self.db.execute(insert(DefectRollup).from_select(columns, merged))
+
+    async def heatmap(
+        self,
+        from_day: date | None = None,
+        to_day: date | None = None,
+        model: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Failures and failure rate per model and step over an inclusive range of UTC days."""
+        failures = func.sum(DefectRollup.failures)
+        total = func.sum(DefectRollup.total)
+        stmt = (
+            select(
+                DefectRollup.device_model,
+                DefectRollup.test_step,
+                failures.label("failures"),
+                total.label("total"),
+            )
+            .group_by(DefectRollup.device_model, DefectRollup.test_step)
+            .having(failures > 0)
+            .order_by(failures.desc(), DefectRollup.device_model, DefectRollup.test_step)
+            .limit(HEATMAP_LIMIT)
+        )
+        if from_day is not None:
+            stmt = stmt.where(DefectRollup.day >= from_day)
+        if to_day is not None:
+            stmt = stmt.where(DefectRollup.day <= to_day)
+        if model is not None:
+            stmt = stmt.where(DefectRollup.device_model == model)
+
+        return [
+            {
+                "model": row.device_model,
+                "test_step": row.test_step,
+                "count": row.failures,
+                "total": row.total,
+                "failure_rate": round(row.failures / row.total * 100, 1),
+            }
+            for row in (await self.db.execute(stmt)).all()
+        ]
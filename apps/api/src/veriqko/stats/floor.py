@@ -0,0 +1,322 @@
+"""Live floor view and its shared, change-driven broadcaster."""
+
+import asyncio
+import json
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+from uuid import uuid4
+
+import structlog
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from veriqko.config import Settings, get_settings
+from veriqko.db.base import async_session_factory, engine
+from veriqko.jobs.loading import JobLoad, job_load_options
+from veriqko.jobs.models import Job, active_job_criteria
+from veriqko.stations.models import Station
+
+logger = structlog.get_logger(__name__)
+
+# NOTIFY channel fired by the jobs and stations triggers (migration 026)
+FLOOR_CHANNEL = "floor_changed"
+# Pause before re-opening a dropped listener connection
+RECONNECT_DELAY_SECONDS = 5
+
+
+def active_jobs_query() -> Select:
+    # Walks ix_jobs_active_station_updated_at in index order
+    return (
+        select(Job)
+        .options(*job_load_options(JobLoad.LIST))
+        .where(active_job_criteria())
+        .order_by(Job.current_station_id, Job.updated_at)
+    )
+
+
+async def get_floor_status_data(session: AsyncSession) -> list[dict[str, Any]]:
+    # Fetch all active stations
+    stations_query = select(Station).where(Station.is_active.is_(True)).order_by(Station.name)
+    stations_result = await session.execute(stations_query)
+    stations = stations_result.scalars().all()
+
+    # Fetch all active jobs with device details
+    jobs_result = await session.execute(active_jobs_query())
+    active_jobs = jobs_result.scalars().all()
+
+    # Group jobs by station
+    jobs_by_station = {}
+    for job in active_jobs:
+        station_id = str(job.current_station_id) if job.current_station_id else "unassigned"
+        if station_id not in jobs_by_station:
+            jobs_by_station[station_id] = []
+
+        jobs_by_station[station_id].append({
+            "id": str(job.id),
+            "serial_number": job.serial_number,
+            "status": job.status,
+            "brand": job.device.brand.name if job.device and job.device.brand else "Unknown",
+            "device_type": (
+                job.device.gadget_type.name if job.device and job.device.gadget_type else "Unknown"
+            ),
+            "model": job.device.model if job.device else "Unknown",
+            "updated_at": job.updated_at,
+            "batches": job.batch_id,
+            "picea_verify_status": job.picea_verify_status,
+            "picea_erase_confirmed": job.picea_erase_confirmed,
+            "picea_mdm_locked": job.picea_mdm_locked
+        })
+
+    # Build response structure
+    floor_view = []
+
+    if "unassigned" in jobs_by_station and jobs_by_station["unassigned"]:
+        floor_view.append({
+            "id": "unassigned",
+            "name": "Unassigned / Intake Queue",
+            "type": "queue",
+            "jobs": jobs_by_station["unassigned"]
+        })
+
+    for station in stations:
+        s_id = str(station.id)
+        floor_view.append({
+            "id": s_id,
+            "name": station.name,
+            "type": station.station_type,
+            "jobs": jobs_by_station.get(s_id, [])
+        })
+
+    return floor_view
+
+
+@dataclass(frozen=True)
+class FloorState:
+    """Floor view flattened for diffing."""
+
+    # Station metadata (id, name, type) in display order
+    stations: list[dict[str, Any]]
+    # Job id -> job fields plus station_id
+    jobs: dict[str, dict[str, Any]]
+
+    @classmethod
+    def from_view(cls, floor: list[dict[str, Any]]) -> "FloorState":
+        stations = []
+        jobs = {}
+        for station in floor:
+            stations.append({k: v for k, v in station.items() if k != "jobs"})
+            for job in station["jobs"]:
+                jobs[job["id"]] = {**job, "station_id": station["id"]}
+        return cls(stations=stations, jobs=jobs)
+
+
+@dataclass(frozen=True)
+class FloorEvent:
+    """One server-sent event, serialized once and shared by all subscribers."""
+
+    id: str
+    event: str
+    data: str
+
+
+def diff_floor(old: FloorState, new: FloorState) -> list[dict[str, Any]]:
+    """Changes turning `old` into `new`: station list, then per-job add/move/update/remove."""
+    changes: list[dict[str, Any]] = []
+    if new.stations != old.stations:
+        changes.append({"op": "stations", "stations": new.stations})
+
+    for job_id, job in new.jobs.items():
+        before = old.jobs.get(job_id)
+        if before is None:
+            changes.append({"op": "add", "job": job})
+            continue
+        changed = {k: v for k, v in job.items() if before.get(k) != v}
+        station_id = changed.pop("station_id", None)
+        if station_id is not None:
+            changes.append(
+                {"op": "move", "id": job_id, "station_id": station_id, "changes": changed}
+            )
+        elif changed:
+            changes.append({"op": "update", "id": job_id, "changes": changed})
+
+    changes.extend({"op": "remove", "id": job_id} for job_id in old.jobs.keys() - new.jobs.keys())
+    return changes
+
+
+class FloorBroadcaster:
+    """
+    Shares one live floor view between all stream subscribers of a process.
+
+    While anyone is subscribed, a background task LISTENs on a dedicated
+    connection. Each burst of job or station writes triggers one recompute
+    after `floor_stream_debounce_seconds`. The result is diffed against the
+    previous floor and published as one numbered delta event, serialized
+    once for every subscriber. Database load therefore depends on the write
+    rate and bandwidth on the change rate, not on viewers or floor size. A
+    periodic resync covers notifications missed while the listener was
+    reconnecting.
+
+    Event ids are `<epoch>-<seq>`. The last `floor_stream_replay_size`
+    deltas are kept so a reconnecting client can resume from Last-Event-ID.
+    An id from another epoch (another process, or before the broadcaster
+    went idle) or one older than the buffer gets a fresh snapshot instead.
+    """
+
+    def __init__(
+        self,
+        db_engine: AsyncEngine = engine,
+        session_factory: async_sessionmaker[AsyncSession] = async_session_factory,
+        load: Callable[[AsyncSession], Awaitable[list[dict[str, Any]]]] = get_floor_status_data,
+        settings: Settings | None = None,
+    ):
+        self.engine = db_engine
+        self.session_factory = session_factory
+        self.load = load
+        self.settings = settings or get_settings()
+
+        self._subscribers = 0
+        self._task: asyncio.Task | None = None
+        self._changed = asyncio.Event()
+        self._published = asyncio.Event()
+        self._reset()
+
+    def _reset(self) -> None:
+        self.epoch = uuid4().hex[:8]
+        self.seq = 0
+        self.floor: list[dict[str, Any]] | None = None
+        self.state: FloorState | None = None
+        self._deltas: deque[FloorEvent] = deque(maxlen=self.settings.floor_stream_replay_size)
+        self._snapshot: FloorEvent | None = None
+
+    async def subscribe(self, last_event_id: str | None = None) -> AsyncIterator[FloorEvent | None]:
+        """
+        Yield the events that bring this subscriber up to date, then each new
+        delta as it is published. Yields None when nothing changed for a
+        heartbeat interval.
+        """
+        self._subscribers += 1
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+        seen_epoch, _, seen = (last_event_id or "").partition("-")
+        seen = int(seen) if seen.isdigit() else None
+        try:
+            while True:
+                if self.floor is not None:
+                    epoch, seq = self.epoch, self.seq
+                    events = self._events_after(seen if seen_epoch == epoch else None)
+                    seen_epoch, seen = epoch, seq
+                    if events:
+                        for event in events:
+                            yield event
+                        continue
+
+                published = self._published
+                try:
+                    await asyncio.wait_for(
+                        published.wait(), timeout=self.settings.floor_stream_heartbeat_seconds
+                    )
+                except TimeoutError:
+                    yield None
+        finally:
+            self._subscribers -= 1
+            if self._subscribers == 0:
+                await self.stop()
+
+    def _events_after(self, seen: int | None) -> list[FloorEvent]:
+        if seen == self.seq:
+            return []
+        if seen is not None and 0 <= self.seq - seen <= len(self._deltas):
+            return list(self._deltas)[len(self._deltas) - (self.seq - seen):]
+        return [self.snapshot()]
+
+    def snapshot(self) -> FloorEvent:
+        """The whole current floor as one event, serialized once per sequence number."""
+        if self._snapshot is None or self._snapshot.id != self._event_id():
+            self._snapshot = FloorEvent(
+                id=self._event_id(),
+                event="snapshot",
+                data=json.dumps({"seq": self.seq, "floor": self.floor}, default=str),
+            )
+        return self._snapshot
+
+    def _event_id(self) -> str:
+        return f"{self.epoch}-{self.seq}"
+
+    async def stop(self) -> None:
+        """Stop listening; the next subscriber starts a new epoch from a fresh snapshot."""
+        task, self._task = self._task, None
+        self._reset()
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def _on_notify(self, *args) -> None:
+        # asyncpg listener callback: (connection, pid, channel, payload)
+        self._changed.set()
+
+    async def refresh(self) -> None:
+        """Recompute the floor and publish what changed to all subscribers."""
+        async with self.session_factory() as db:
+            floor = await self.load(db)
+        self._publish(floor)
+
+    def _publish(self, floor: list[dict[str, Any]]) -> None:
+        state = FloorState.from_view(floor)
+        if self.state is not None:
+            changes = diff_floor(self.state, state)
+            if not changes:
+                return
+            self.seq += 1
+            self._deltas.append(
+                FloorEvent(
+                    id=self._event_id(),
+                    event="delta",
+                    data=json.dumps({"seq": self.seq, "changes": changes}, default=str),
+                )
+            )
+        self.floor, self.state = floor, state
+
+        published, self._published = self._published, asyncio.Event()
+        published.set()
+
+    async def _wait_and_refresh(self) -> None:
+        try:
+            await asyncio.wait_for(
+                self._changed.wait(), timeout=self.settings.floor_stream_resync_seconds
+            )
+        except TimeoutError:
+            pass
+        # Let a burst of writes settle into a single recompute
+        await asyncio.sleep(self.settings.floor_stream_debounce_seconds)
+        self._changed.clear()
+        await self.refresh()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                async with self.engine.connect() as conn:
+                    raw = await conn.get_raw_connection()
+                    listener = raw.driver_connection
+                    await listener.add_listener(FLOOR_CHANNEL, self._on_notify)
+                    try:
+                        # Anything may have changed while we were not listening
+                        await self.refresh()
+                        while not listener.is_closed():
+                            await self._wait_and_refresh()
+                    finally:
+                        if not listener.is_closed():
+                            await listener.remove_listener(FLOOR_CHANNEL, self._on_notify)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception("Floor listener failed; reconnecting", error=str(e))
+                await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+
+
+floor_broadcaster = FloorBroadcaster()
@@ -0,0 +1,102 @@
+"""Dashboard rollup models."""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+
+import sqlalchemy as sa
+from sqlalchemy import BigInteger, Date, DateTime, Float, ForeignKey, Integer, SmallInteger, String
+from sqlalchemy.dialects.postgresql import ENUM, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from veriqko.db.base import Base
+from veriqko.jobs.models import JobStatus
+
+
+class JobStatusCounter(Base):
+    """
+    Job counts per status, maintained incrementally by the job repository.
+
+    The `total` bucket holds the number of live (non-deleted, not archived)
+    jobs currently in each status. Day buckets (`YYYY-MM-DD`, UTC) count the
+    jobs that entered each status that day. Each counter is split over
+    shards so concurrent writers rarely wait on the same row; its value is
+    the sum over shards, and a single shard may be negative.
+    """
+
+    __tablename__ = "job_status_counters"
+
+    bucket: Mapped[str] = mapped_column(String(10), primary_key=True)
+    status: Mapped[JobStatus] = mapped_column(
+        ENUM(JobStatus, name="job_status", create_type=False),
+        primary_key=True,
+    )
+    shard: Mapped[int] = mapped_column(SmallInteger, primary_key=True, default=0)
+    job_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<JobStatusCounter {self.bucket} {self.status}[{self.shard}]={self.job_count}>"
+
+
+class DefectRollup(Base):
+    """
+    Daily test outcomes per device model and step, for the defect heatmap.
+
+    A result belongs to the UTC day it was first recorded (its created_at).
+    `total` counts pass and fail results; skipped and pending steps are left
+    out of both columns. Rebuilt per day by DefectRollupService.refresh.
+    """
+
+    __tablename__ = "defect_rollup"
+    __table_args__ = (sa.Index("ix_defect_rollup_device_model_day", "device_model", "day"),)
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    device_model: Mapped[str] = mapped_column(String(100), primary_key=True)
+    test_step: Mapped[str] = mapped_column(String(255), primary_key=True)
+    failures: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<DefectRollup {self.day} {self.device_model}/{self.test_step} {self.failures}>"
+
+
+class TechnicianStageRollup(Base):
+    """
+    Stages completed per UTC day, technician and stage, for the leaderboard.
+
+    A stage is credited to whoever moved the job out of it (the history
+    entry's changed_by), on the day they did. Its duration runs from the
+    job's previous status change. Rebuilt per day by
+    TechnicianRollupService.refresh.
+    """
+
+    __tablename__ = "technician_stage_rollup"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    user_id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False),
+        ForeignKey("users.id"),
+        primary_key=True,
+    )
+    stage: Mapped[JobStatus] = mapped_column(
+        ENUM(JobStatus, name="job_status", create_type=False),
+        primary_key=True,
+    )
+    jobs: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_seconds: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    median_seconds: Mapped[float | None] = mapped_column(Float, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<TechnicianStageRollup {self.day} {self.user_id} {self.stage}={self.jobs}>"
+
+
+class RollupWatermark(Base):
+    """How far an incremental rollup or export has processed its source rows."""
+
+    __tablename__ = "rollup_watermarks"
+
+    name: Mapped[str] = mapped_column(String(100), primary_key=True)
+    value: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<RollupWatermark {self.name}={self.value}>"
@@ -0,0 +1,46 @@
+"""Shared pieces of the incremental stats rollups."""
+
+from datetime import UTC, date, datetime, time, timedelta
+
+import sqlalchemy as sa
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from veriqko.stats.models import RollupWatermark
+
+# A transaction still open when a refresh starts stamps its rows with an
+# earlier time than the new watermark; re-read this far back each time
+SAFETY_MARGIN = timedelta(minutes=5)
+
+
+def utc_day(at: sa.ColumnElement) -> sa.ColumnElement:
+    """The UTC calendar day of a timestamptz column."""
+    return func.date(func.timezone("UTC", at))
+
+
+def on_utc_days(at: sa.ColumnElement, days: list[date]) -> sa.ColumnElement:
+    """`at` falls on one of `days` (UTC), as index-friendly ranges."""
+    return or_(
+        *(
+            and_(
+                at >= datetime.combine(day, time.min, UTC),
+                at < datetime.combine(day + timedelta(days=1), time.min, UTC),
+            )
+            for day in days
+        )
+    )
+
+
+async def read_watermark(db: AsyncSession, name: str) -> datetime | None:
+    return await db.scalar(select(RollupWatermark.value).where(RollupWatermark.name == name))
+
+
+async def advance_watermark(db: AsyncSession, name: str, started: datetime) -> None:
+    """Record a refresh that started at `started`, less the safety margin."""
+    stmt = pg_insert(RollupWatermark).values(name=name, value=started - SAFETY_MARGIN)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[RollupWatermark.name],
+        set_={"value": stmt.excluded.value},
+    )
+    await db.execute(stmt)
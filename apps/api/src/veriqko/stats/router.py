@@ -1,76 +1,65 @@
-from datetime import UTC, datetime, timedelta
-from typing import Any
-
-from fastapi import APIRouter, Depends
-from sqlalchemy import and_, case, func, select
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from datetime import UTC, date, datetime, timedelta
+from typing import Annotated, Any
 
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
 from fastapi.responses import StreamingResponse
-import asyncio
-import json
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from veriqko.db.base import get_db, async_session_factory
+from veriqko.db.replica import get_read_db
 from veriqko.dependencies import get_current_user
-from veriqko.devices.models import Device
-from veriqko.jobs.models import Job, JobStatus, TestResult, TestResultStatus, TestStep
+from veriqko.jobs.loading import JobLoad, job_load_options
+from veriqko.jobs.models import Job, JobStatus
+from veriqko.stats.defects import DefectRollupService
+from veriqko.stats.floor import floor_broadcaster, get_floor_status_data
+from veriqko.stats.service import TOTAL_BUCKET, StatusCounterService, day_bucket
+from veriqko.stats.technicians import TechnicianRollupService
+from veriqko.stats.throughput import Bucket, parse_percentiles, series_window, throughput_series
 from veriqko.users.models import User
 
 router = APIRouter(prefix="/stats", tags=["stats"])
 
 @router.get("/dashboard")
 async def get_dashboard_stats(
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ) -> dict[str, Any]:
     """
     Get aggregated statistics for the dashboard.
-    """
 
-    # Base query for counts
-    # We'll do a single aggregation query for efficiency
-    query = select(
-        func.count(Job.id).label("total"),
-        func.sum(case((Job.status == JobStatus.COMPLETED, 1), else_=0)).label("completed"),
-        func.sum(case((Job.status == JobStatus.FAILED, 1), else_=0)).label("failed"),
-        func.sum(case((Job.status.in_([
-            JobStatus.INTAKE,
-            JobStatus.RESET,
-            JobStatus.FUNCTIONAL,
-            JobStatus.QC
-        ]), 1), else_=0)).label("in_progress")
-    ).where(Job.deleted_at.is_(None))
-
-    result = await session.execute(query)
-    stats = result.one()
+    Counts come from the job_status_counters rollup (a few rows per status),
+    not from scanning jobs.
+    """
+    today = day_bucket(datetime.now(UTC))
+    counters = await StatusCounterService(session).counts(TOTAL_BUCKET, today)
+    totals = counters[TOTAL_BUCKET]
+
+    completed = totals.get(JobStatus.COMPLETED, 0)
+    failed = totals.get(JobStatus.FAILED, 0)
+    in_progress = sum(
+        totals.get(s, 0)
+        for s in (JobStatus.INTAKE, JobStatus.RESET, JobStatus.FUNCTIONAL, JobStatus.QC)
+    )
 
     # Calculate yield (Pass rate)
-    total_closed = (stats.completed or 0) + (stats.failed or 0)
+    total_closed = completed + failed
     yield_rate = 0
     if total_closed > 0:
-        yield_rate = (stats.completed / total_closed) * 100
+        yield_rate = (completed / total_closed) * 100
 
     # Get recent jobs (limit 5)
-    recent_query = (
-        select(Job)
-        .options(
-            selectinload(Job.device).selectinload(Device.brand),
-            selectinload(Job.device).selectinload(Device.gadget_type)
-        )
-        .where(Job.deleted_at.is_(None))
-        .order_by(Job.created_at.desc())
-        .limit(5)
-    )
-    recent_result = await session.execute(recent_query)
+    recent_result = await session.execute(_recent_jobs_query())
     recent_jobs = recent_result.scalars().all()
 
     return {
         "counts": {
-            "total": stats.total or 0,
-            "completed": stats.completed or 0,
-            "failed": stats.failed or 0,
-            "in_progress": stats.in_progress or 0
+            "total": sum(totals.values()),
+            "completed": completed,
+            "failed": failed,
+            "in_progress": in_progress
         },
+        # Jobs that entered each status today (UTC)
+        "today": {status.value: n for status, n in counters[today].items()},
         "metrics": {
             "yield_rate": round(yield_rate, 1)
         },
@@ -111,185 +100,93 @@ def _get_sla_status(due_at: datetime | None) -> str:
     return "healthy"
 
 
-from veriqko.stations.models import Station
-
-
 @router.get("/floor")
 async def get_floor_status(
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ) -> list[dict[str, Any]]:
     """
     Get live floor status: stations with their active jobs.
     """
-    return await _get_floor_status_data(session)
-
-async def _get_floor_status_data(session: AsyncSession) -> list[dict[str, Any]]:
-    # Fetch all active stations
-    stations_query = select(Station).where(Station.is_active == True).order_by(Station.name)
-    stations_result = await session.execute(stations_query)
-    stations = stations_result.scalars().all()
-
-    # Fetch all active jobs with device details
-    jobs_query = select(Job).options(
-        selectinload(Job.device).selectinload(Device.brand),
-        selectinload(Job.device).selectinload(Device.gadget_type)
-    ).where(
-        and_(
-            Job.status.notin_([JobStatus.COMPLETED, JobStatus.FAILED]),
-            Job.deleted_at.is_(None)
-        )
+    return await get_floor_status_data(session)
+
+def _recent_jobs_query() -> Select:
+    return (
+        select(Job)
+        .options(*job_load_options(JobLoad.LIST))
+        .where(Job.deleted_at.is_(None))
+        .order_by(Job.created_at.desc())
+        .limit(5)
     )
-    jobs_result = await session.execute(jobs_query)
-    active_jobs = jobs_result.scalars().all()
-
-    # Group jobs by station
-    jobs_by_station = {}
-    for job in active_jobs:
-        station_id = str(job.current_station_id) if job.current_station_id else "unassigned"
-        if station_id not in jobs_by_station:
-            jobs_by_station[station_id] = []
-
-        jobs_by_station[station_id].append({
-            "id": str(job.id),
-            "serial_number": job.serial_number,
-            "status": job.status,
-            "brand": job.device.brand.name if job.device and job.device.brand else "Unknown",
-            "device_type": job.device.gadget_type.name if job.device and job.device.gadget_type else "Unknown",
-            "model": job.device.model if job.device else "Unknown",
-            "updated_at": job.updated_at,
-            "batches": job.batch_id,
-            "picea_verify_status": job.picea_verify_status,
-            "picea_erase_confirmed": job.picea_erase_confirmed,
-            "picea_mdm_locked": job.picea_mdm_locked
-        })
-
-    # Build response structure
-    floor_view = []
-
-    if "unassigned" in jobs_by_station and jobs_by_station["unassigned"]:
-        floor_view.append({
-            "id": "unassigned",
-            "name": "Unassigned / Intake Queue",
-            "type": "queue",
-            "jobs": jobs_by_station["unassigned"]
-        })
-
-    for station in stations:
-        s_id = str(station.id)
-        floor_view.append({
-            "id": s_id,
-            "name": station.name,
-            "type": station.station_type,
-            "jobs": jobs_by_station.get(s_id, [])
-        })
-
-    return floor_view
+
 
 @router.get("/floor/stream")
 async def get_floor_status_stream(
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    last_event_id: Annotated[str | None, Header()] = None,
 ):
     """
     SSE endpoint for real-time floor view updates.
+
+    Starts with a `snapshot` event (the /floor payload plus its sequence
+    number), then sends a `delta` event of per-job add/move/update/remove
+    changes whenever the floor changes, and a heartbeat comment while it
+    does not. Reconnecting with `Last-Event-ID` replays the missed deltas
+    when they are still buffered and sends a new snapshot otherwise.
     """
     async def event_generator():
-        while True:
-            async with async_session_factory() as db_session:
-                floor_view = await _get_floor_status_data(db_session)
-                yield f"data: {json.dumps(floor_view, default=str)}\n\n"
-            await asyncio.sleep(5)
+        async for event in floor_broadcaster.subscribe(last_event_id):
+            if event is None:
+                yield ": heartbeat\n\n"
+            else:
+                yield f"id: {event.id}\nevent: {event.event}\ndata: {event.data}\n\n"
 
     return StreamingResponse(event_generator(), media_type="text/event-stream")
 
 
 @router.get("/defects")
 async def get_defect_heatmap(
-    session: AsyncSession = Depends(get_db),
+    from_: date | None = Query(None, alias="from"),
+    to: date | None = None,
+    model: str | None = None,
+    session: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ) -> list[dict[str, Any]]:
     """
     Get defect heatmap aggregated by Device Model and Test Step.
-    Returns list of { model, test_step, count }.
-    """
-    # Query: Count failed TestResults grouped by Job->Device->Model and TestStep->Name
-    query = (
-        select(
-            Device.model,
-            TestStep.name.label("test_step"),
-            func.count(TestResult.id).label("failure_count")
-        )
-        .select_from(TestResult)
-        .join(TestResult.job)
-        .join(Job.device)
-        .join(TestResult.test_step)
-        .where(
-            and_(
-                TestResult.status == TestResultStatus.FAIL,
-                Job.deleted_at.is_(None)
-            )
-        )
-        .group_by(Device.model, TestStep.name)
-        .order_by(func.count(TestResult.id).desc())
-        .limit(100)
-    )
 
-    result = await session.execute(query)
-    rows = result.all()
-
-    return [
-        {
-            "model": row.model,
-            "test_step": row.test_step,
-            "count": row.failure_count
-        } for row in rows
-    ]
+    Sums the daily defect_rollup buckets between `from` and `to` (inclusive
+    UTC days), optionally for one model. The rollup is refreshed every
+    `defect_rollup_refresh_minutes`.
+    Returns list of { model, test_step, count, total, failure_rate }.
+    """
+    return await DefectRollupService(session).heatmap(from_, to, model)
 
 @router.get("/technicians")
 async def get_technician_leaderboard(
     days: int = 7,
-    session: AsyncSession = Depends(get_db),
+    from_: date | None = Query(None, alias="from"),
+    to: date | None = None,
+    station: JobStatus | None = None,
+    session: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ) -> list[dict[str, Any]]:
     """
-    Get technician efficiency leaderboard for the last N days.
-    """
-    cutoff = datetime.now(UTC) - timedelta(days=days)
+    Get technician efficiency leaderboard.
 
-    # Query: Jobs completed per assigned technician in period
-    query = (
-        select(
-            User.full_name,
-            func.count(Job.id).label("jobs_completed")
-        )
-        .select_from(Job)
-        .join(Job.assigned_technician)
-        .where(
-            and_(
-                Job.status == JobStatus.COMPLETED,
-                Job.completed_at >= cutoff,
-                Job.deleted_at.is_(None)
-            )
-        )
-        .group_by(User.id, User.full_name)
-        .order_by(func.count(Job.id).desc())
-        .limit(10)
-    )
-
-    result = await session.execute(query)
-    rows = result.all()
-
-    return [
-        {
-            "name": row.full_name,
-            "jobs_completed": row.jobs_completed
-        } for row in rows
-    ]
+    The window is `from`..`to` (inclusive UTC days), or the last `days` days
+    up to today; `station` limits it to one station type. Each stage is
+    credited to the technician who completed it, from the daily
+    technician_stage_rollup, so `jobs_completed` counts stages completed.
+    """
+    to = to or datetime.now(UTC).date()
+    from_ = from_ or to - timedelta(days=days - 1)
+    return await TechnicianRollupService(session).leaderboard(from_, to, station)
 
 @router.get("/throughput")
 async def get_throughput_times(
     days: int = 30,
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ) -> dict[str, Any]:
     """
@@ -334,3 +231,36 @@ async def get_throughput_times(
         ],
         "total_avg_time_hours": format_hours(stats.avg_total)
     }
+
+@router.get("/throughput/series")
+async def get_throughput_series(
+    bucket: Bucket = "day",
+    percentiles: str = "50,90,99",
+    days: int = 30,
+    from_: date | None = Query(None, alias="from"),
+    to: date | None = None,
+    session: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+) -> dict[str, Any]:
+    """
+    Get completions and station duration percentiles per hour or day.
+
+    The window is `from`..`to` (inclusive UTC days), or the last `days` days
+    up to today. Percentiles are computed in the database with
+    percentile_cont; only one row per bucket is returned from it.
+    """
+    to = to or datetime.now(UTC).date()
+    from_ = from_ or to - timedelta(days=days - 1)
+    try:
+        wanted = parse_percentiles(percentiles)
+        start, end = series_window(from_, to, bucket)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return {
+        "bucket": bucket,
+        "from": from_,
+        "to": to,
+        "percentiles": wanted,
+        "series": await throughput_series(session, bucket, start, end, wanted),
+    }
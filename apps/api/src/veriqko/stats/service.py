@@ -0,0 +1,163 @@
+"""Incremental job status counters behind the dashboard."""
+
+import random
+import weakref
+from collections import Counter
+from collections.abc import Mapping
+from datetime import UTC, date, datetime, time, timedelta
+
+import structlog
+from sqlalchemy import func, literal, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from veriqko.jobs.models import Job, JobHistory, JobStatus
+from veriqko.stats.models import JobStatusCounter
+
+logger = structlog.get_logger(__name__)
+
+# Bucket holding the live job count per status
+TOTAL_BUCKET = "total"
+# Rows per counter; concurrent writers mostly land on different rows
+COUNTER_SHARDS = 16
+
+_session_shards: weakref.WeakKeyDictionary[AsyncSession, int] = weakref.WeakKeyDictionary()
+
+CounterKey = tuple[str, JobStatus]
+
+
+def day_bucket(day: date | datetime) -> str:
+    """Counter bucket for a UTC day."""
+    if isinstance(day, datetime):
+        day = day.astimezone(UTC).date()
+    return day.isoformat()
+
+
+def _sorted(keys) -> list[CounterKey]:
+    # Fixed row order so concurrent writers lock counters in the same order
+    return sorted(keys, key=lambda key: (key[0], key[1].value))
+
+
+class StatusCounterService:
+    """Reads and maintains job_status_counters in the caller's transaction."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @property
+    def shard(self) -> int:
+        """
+        This session's counter shard. It is fixed for the session's lifetime,
+        so a transaction never locks two shards of one counter.
+        """
+        if self.db not in _session_shards:
+            _session_shards[self.db] = random.randrange(COUNTER_SHARDS)
+        return _session_shards[self.db]
+
+    async def record(
+        self,
+        entered: Mapping[JobStatus, int] | None = None,
+        left: Mapping[JobStatus, int] | None = None,
+        at: datetime | None = None,
+    ) -> None:
+        """
+        Apply job status changes to the counters.
+
+        `entered` counts jobs that moved into a status at `at`; they are added
+        to the total and to that day's bucket. `left` counts jobs that moved
+        out of a status or stopped being live, and only comes off the total.
+        """
+        day = day_bucket(at or datetime.now(UTC))
+        deltas: Counter[CounterKey] = Counter()
+        for status, n in (entered or {}).items():
+            deltas[(TOTAL_BUCKET, status)] += n
+            deltas[(day, status)] += n
+        for status, n in (left or {}).items():
+            deltas[(TOTAL_BUCKET, status)] -= n
+        await self._add(deltas, self.shard)
+
+    async def _add(self, deltas: Mapping[CounterKey, int], shard: int) -> None:
+        rows = [
+            {"bucket": b, "status": s, "shard": shard, "job_count": deltas[b, s]}
+            for b, s in _sorted(deltas)
+            if deltas[b, s]
+        ]
+        if not rows:
+            return
+
+        stmt = pg_insert(JobStatusCounter).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                JobStatusCounter.bucket,
+                JobStatusCounter.status,
+                JobStatusCounter.shard,
+            ],
+            set_={"job_count": JobStatusCounter.job_count + stmt.excluded.job_count},
+        )
+        await self.db.execute(stmt)
+
+    async def counts(self, *buckets: str) -> dict[str, dict[JobStatus, int]]:
+        """Counters per bucket, summed over shards; statuses without a row are left out."""
+        counter = JobStatusCounter
+        stmt = (
+            select(counter.bucket, counter.status, func.sum(counter.job_count))
+            .where(counter.bucket.in_(buckets))
+            .group_by(counter.bucket, counter.status)
+        )
+        counts: dict[str, dict[JobStatus, int]] = {bucket: {} for bucket in buckets}
+        for bucket, status, n in (await self.db.execute(stmt)).all():
+            counts[bucket][status] = n
+        return counts
+
+    async def drift(self, days: int) -> dict[CounterKey, int]:
+        """
+        Recount the total bucket and the last `days` day buckets from jobs
+        and job history. Returns what each drifted counter is off by.
+
+        Takes no locks. Run it in a REPEATABLE READ transaction so the stored
+        counters and the recount come from the same snapshot; writers that
+        commit meanwhile change both, so the difference stays valid.
+        """
+        start = datetime.now(UTC).date() - timedelta(days=days - 1)
+        buckets = [TOTAL_BUCKET, *(day_bucket(start + timedelta(days=i)) for i in range(days))]
+
+        stored = {
+            (bucket, status): n
+            for bucket, counts in (await self.counts(*buckets)).items()
+            for status, n in counts.items()
+        }
+
+        day = func.to_char(func.timezone("UTC", JobHistory.changed_at), "YYYY-MM-DD")
+        recounts = [
+            select(literal(TOTAL_BUCKET), Job.status, func.count())
+            .where(Job.deleted_at.is_(None))
+            .group_by(Job.status),
+            select(day, JobHistory.to_status, func.count())
+            .where(JobHistory.changed_at >= datetime.combine(start, time.min, UTC))
+            .group_by(day, JobHistory.to_status),
+        ]
+        actual = {}
+        for stmt in recounts:
+            for bucket, status, n in (await self.db.execute(stmt)).all():
+                actual[(bucket, status)] = n
+
+        return {
+            key: actual.get(key, 0) - stored.get(key, 0)
+            for key in _sorted(stored.keys() | actual.keys())
+            if stored.get(key, 0) != actual.get(key, 0)
+        }
+
+    async def correct(self, drift: Mapping[CounterKey, int]) -> None:
+        """
+        Add the differences found by `drift` to the counters.
+
+        Corrections are relative, so changes committed since the recount are
+        kept. Shard 0 takes them; only the sum over shards is meaningful.
+        """
+        if drift:
+            logger.warning(
+                "Job status counters drifted",
+                counters=len(drift),
+                buckets=sorted({bucket for bucket, _ in drift}),
+            )
+        await self._add(drift, shard=0)
@@ -0,0 +1,153 @@
+"""Daily technician productivity rollup behind the leaderboard."""
+
+from datetime import UTC, date, datetime
+from typing import Any
+
+import sqlalchemy as sa
+from sqlalchemy import delete, extract, func, insert, select, text, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from veriqko.archive.models import job_history_archive
+from veriqko.jobs.models import JobHistory, JobStatus
+from veriqko.stats.models import TechnicianStageRollup
+from veriqko.stats.rollups import advance_watermark, on_utc_days, read_watermark, utc_day
+from veriqko.users.models import User
+
+WATERMARK = "technician_rollup"
+# Statuses a technician works a job through
+STAGES = (JobStatus.INTAKE, JobStatus.RESET, JobStatus.FUNCTIONAL, JobStatus.QC)
+LEADERBOARD_LIMIT = 10
+
+
+def _stage_exits(days: list[date] | None) -> sa.Select:
+    """
+    Per UTC day, user and stage: stages completed, and their total and
+    median durations in seconds.
+    """
+    columns = ["job_id", "from_status", "changed_by_id", "changed_at"]
+    hot = JobHistory.__table__
+    branches = [select(*(table.c[c] for c in columns)) for table in (hot, job_history_archive)]
+    if days is not None:
+        # Whole history of the jobs that moved on those days, so each exit finds its entry
+        moved = select(hot.c.job_id).where(on_utc_days(hot.c.changed_at, days))
+        branches = [branch.where(branch.selected_columns.job_id.in_(moved)) for branch in branches]
+    entries = union_all(*branches).subquery()
+
+    exits = select(
+        entries,
+        func.lag(entries.c.changed_at)
+        .over(partition_by=entries.c.job_id, order_by=entries.c.changed_at)
+        .label("started_at"),
+    ).subquery()
+
+    day = utc_day(exits.c.changed_at)
+    seconds = extract("epoch", exits.c.changed_at - exits.c.started_at)
+    stmt = (
+        select(
+            day,
+            exits.c.changed_by_id,
+            exits.c.from_status,
+            func.count(),
+            func.sum(seconds),
+            func.percentile_cont(0.5).within_group(seconds),
+        )
+        .where(exits.c.from_status.in_(STAGES), exits.c.started_at.is_not(None))
+        .group_by(day, exits.c.changed_by_id, exits.c.from_status)
+    )
+    if days is not None:
+        stmt = stmt.where(on_utc_days(exits.c.changed_at, days))
+    return stmt
+
+
+def _minutes(seconds: float | None) -> float | None:
+    return None if seconds is None else round(seconds / 60.0, 1)
+
+
+class TechnicianRollupService:
+    """Maintains and reads technician_stage_rollup in the caller's transaction."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def refresh(self, now: datetime | None = None) -> list[date] | None:
+        """
+        Rebuild the rollup for every day with new job history since the last
+        refresh; without a watermark, rebuild it from all hot and archived
+        history. History is append-only, so new entries are the only change.
+
+        Holds an EXCLUSIVE lock on the rollup until the caller commits.
+        Returns the days rebuilt, or None after a full rebuild.
+        """
+        now = now or datetime.now(UTC)
+        await self.db.execute(text("LOCK TABLE technician_stage_rollup IN EXCLUSIVE MODE"))
+
+        since = await read_watermark(self.db, WATERMARK)
+        if since is None:
+            days = None
+            await self.db.execute(delete(TechnicianStageRollup))
+        else:
+            day = utc_day(JobHistory.changed_at)
+            stmt = select(day).where(JobHistory.changed_at >= since).distinct()
+            days = sorted((await self.db.scalars(stmt)).all())
+            if days:
+                await self.db.execute(
+                    delete(TechnicianStageRollup).where(TechnicianStageRollup.day.in_(days))
+                )
+        if days is None or days:
+            columns = ["day", "user_id", "stage", "jobs", "total_seconds", "median_seconds"]
+            await self.db.execute(
+                insert(TechnicianStageRollup).from_select(columns, _stage_exits(days))
+            )
+
+        await advance_watermark(self.db, WATERMARK, now)
+        return days
+
+    async def leaderboard(
+        self,
+        from_day: date,
+        to_day: date,
+        stage: JobStatus | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Top technicians by stages completed over an inclusive range of UTC
+        days, optionally for one stage, with per-stage durations.
+
+        `avg_minutes` is exact. `median_minutes` is the median of the daily
+        medians, since medians cannot be combined exactly.
+        """
+        rollup = TechnicianStageRollup
+        stmt = (
+            select(
+                User.id,
+                User.full_name,
+                rollup.stage,
+                func.sum(rollup.jobs).label("jobs"),
+                func.sum(rollup.total_seconds).label("total_seconds"),
+                func.percentile_cont(0.5)
+                .within_group(rollup.median_seconds)
+                .label("median_seconds"),
+            )
+            .join(User, User.id == rollup.user_id)
+            .where(rollup.day >= from_day, rollup.day <= to_day)
+            .group_by(User.id, User.full_name, rollup.stage)
+        )
+        if stage is not None:
+            stmt = stmt.where(rollup.stage == stage)
+
+        rows = sorted((await self.db.execute(stmt)).all(), key=lambda row: STAGES.index(row.stage))
+        technicians: dict[str, dict[str, Any]] = {}
+        for row in rows:
+            entry = technicians.setdefault(
+                row.id,
+                {"user_id": row.id, "name": row.full_name, "jobs_completed": 0, "stations": []},
+            )
+            entry["jobs_completed"] += row.jobs
+            entry["stations"].append({
+                "name": row.stage.value,
+                "jobs": row.jobs,
+                "avg_minutes": _minutes(row.total_seconds / row.jobs),
+                "median_minutes": _minutes(row.median_seconds),
+            })
+
+        ranked = sorted(technicians.values(), key=lambda t: (-t["jobs_completed"], t["name"]))
+        return ranked[:LEADERBOARD_LIMIT]
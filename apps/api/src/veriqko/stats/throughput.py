@@ -0,0 +1,128 @@
+"""Station throughput time series, aggregated in the database."""
+
+from datetime import UTC, date, datetime, time, timedelta
+from typing import Any, Literal
+
+import sqlalchemy as sa
+from sqlalchemy import Float, extract, func, literal, select, union_all
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from veriqko.archive.models import jobs_archive
+from veriqko.jobs.models import Job
+
+Bucket = Literal["hour", "day"]
+
+BUCKET_SIZES: dict[str, timedelta] = {"hour": timedelta(hours=1), "day": timedelta(days=1)}
+# Largest series one request may ask for (about 41 days of hours)
+MAX_SERIES_BUCKETS = 1000
+MAX_PERCENTILES = 5
+
+# Station name -> (started, completed) columns of jobs
+STAGES: dict[str, tuple[str, str]] = {
+    "Intake": ("intake_started_at", "intake_completed_at"),
+    "Reset": ("reset_started_at", "reset_completed_at"),
+    "Functional": ("functional_started_at", "functional_completed_at"),
+    "QC": ("qc_started_at", "qc_completed_at"),
+}
+# Whole job, created to completed
+TOTAL = ("created_at", "completed_at")
+
+
+def parse_percentiles(raw: str) -> list[float]:
+    """'50,90,99' -> [50.0, 90.0, 99.0]; raises ValueError for anything else."""
+    try:
+        percentiles = sorted({float(p) for p in raw.split(",") if p.strip()})
+    except ValueError:
+        raise ValueError(f"Invalid percentiles: {raw!r}") from None
+    if not percentiles or len(percentiles) > MAX_PERCENTILES:
+        raise ValueError(f"Between 1 and {MAX_PERCENTILES} percentiles are supported")
+    if not all(0 < p < 100 for p in percentiles):
+        raise ValueError("Percentiles must be between 0 and 100")
+    return percentiles
+
+
+def series_window(from_day: date, to_day: date, bucket: Bucket) -> tuple[datetime, datetime]:
+    """[start, end) of whole UTC days; raises ValueError for empty or oversized ranges."""
+    if to_day < from_day:
+        raise ValueError("'to' is before 'from'")
+    start = datetime.combine(from_day, time.min, UTC)
+    end = datetime.combine(to_day + timedelta(days=1), time.min, UTC)
+    if (end - start) / BUCKET_SIZES[bucket] > MAX_SERIES_BUCKETS:
+        raise ValueError(f"At most {MAX_SERIES_BUCKETS} {bucket} buckets per request")
+    return start, end
+
+
+def _completed_jobs(start: datetime, end: datetime) -> sa.Subquery:
+    # Hot and archived jobs; both are read by completed_at index range scans
+    columns = list(dict.fromkeys(c for pair in (*STAGES.values(), TOTAL) for c in pair))
+
+    def window(table: sa.Table) -> sa.Select:
+        return select(*(table.c[c] for c in columns)).where(
+            table.c.completed_at >= start,
+            table.c.completed_at < end,
+            table.c.deleted_at.is_(None),
+        )
+
+    return union_all(window(Job.__table__), window(jobs_archive)).subquery()
+
+
+def series_query(
+    bucket: Bucket, start: datetime, end: datetime, percentiles: list[float]
+) -> sa.Select:
+    """One row per non-empty bucket: completions, then per stage a count and percentile array."""
+    jobs = _completed_jobs(start, end)
+    bucket_start = func.date_trunc(bucket, func.timezone("UTC", jobs.c.completed_at))
+    # percentile_cont takes an array of fractions and sorts each stage once
+    fractions = literal([p / 100 for p in percentiles], ARRAY(Float))
+
+    columns = [bucket_start.label("bucket"), func.count().label("completed")]
+    for name, (started, completed) in {**STAGES, "total": TOTAL}.items():
+        seconds = extract("epoch", jobs.c[completed] - jobs.c[started])
+        percentile = func.percentile_cont(fractions, type_=ARRAY(Float)).within_group(seconds)
+        # Stages a job skipped or never finished have a NULL duration
+        columns.append(func.count(seconds).label(f"{name.lower()}_jobs"))
+        columns.append(percentile.label(f"{name.lower()}_seconds"))
+    return select(*columns).group_by(bucket_start).order_by(bucket_start)
+
+
+def _hours(seconds: float | None) -> float | None:
+    return None if seconds is None else round(seconds / 3600.0, 2)
+
+
+async def throughput_series(
+    session: AsyncSession,
+    bucket: Bucket,
+    start: datetime,
+    end: datetime,
+    percentiles: list[float],
+) -> list[dict[str, Any]]:
+    """
+    Completions and stage duration percentiles (hours) per bucket of
+    completion time, from `start` up to `end`. Every bucket in the window
+    is returned; empty ones have no percentiles.
+    """
+    keys = [f"p{p:g}" for p in percentiles]
+    result = await session.execute(series_query(bucket, start, end, percentiles))
+    rows = {row.bucket.replace(tzinfo=UTC): row for row in result.all()}
+
+    def durations(row: Any, name: str) -> dict[str, Any]:
+        name = name.lower()
+        seconds = (getattr(row, f"{name}_seconds") if row else None) or [None] * len(keys)
+        return {
+            "jobs": getattr(row, f"{name}_jobs") if row else 0,
+            "hours": dict(zip(keys, map(_hours, seconds))),
+        }
+
+    series = []
+    at = start
+    while at < end:
+        row = rows.get(at)
+        series.append({
+            "start": at,
+            "completed": row.completed if row else 0,
+            "stations": [{"name": name, **durations(row, name)} for name in STAGES],
+            "total": durations(row, "total"),
+        })
+        at += BUCKET_SIZES[bucket]
+    return series
@@ -0,0 +1,77 @@
+"""In-process cache of step templates per (device, station)."""
+
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from veriqko.config import get_settings
+from veriqko.jobs.models import JobStatus, TestStep
+
+
+@dataclass(frozen=True)
+class StepTemplate:
+    """Immutable snapshot of a TestStep, safe to share across requests."""
+
+    id: str
+    name: str
+    description: str | None
+    sequence_order: int
+    is_mandatory: bool
+    requires_evidence: bool
+
+
+class StepTemplateCache:
+    """
+    Ordered step templates keyed by `(device_id, station_type)`.
+
+    The template endpoints call `invalidate()` after every write. Entries
+    also expire after `step_template_cache_ttl_seconds`, which bounds
+    staleness in other worker processes that did not see the write.
+    """
+
+    def __init__(self, ttl_seconds: float | None = None):
+        if ttl_seconds is None:
+            ttl_seconds = get_settings().step_template_cache_ttl_seconds
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[
+            tuple[str | None, JobStatus], tuple[float, tuple[StepTemplate, ...]]
+        ] = {}
+        self._generation = 0
+
+    async def get(
+        self, db: AsyncSession, device_id: str | None, station_type: JobStatus
+    ) -> tuple[StepTemplate, ...]:
+        key = (device_id, station_type)
+        entry = self._entries.get(key)
+        if entry and time.monotonic() < entry[0]:
+            return entry[1]
+
+        generation = self._generation
+        stmt = (
+            select(
+                TestStep.id,
+                TestStep.name,
+                TestStep.description,
+                TestStep.sequence_order,
+                TestStep.is_mandatory,
+                TestStep.requires_evidence,
+            )
+            .where(TestStep.device_id == device_id, TestStep.station_type == station_type)
+            .order_by(TestStep.sequence_order)
+        )
+        steps = tuple(StepTemplate(*row) for row in (await db.execute(stmt)).all())
+
+        # Don't store a result loaded before a concurrent invalidation
+        if generation == self._generation:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, steps)
+        return steps
+
+    def invalidate(self) -> None:
+        """Drop every entry. Template edits are rare, so no per-key bookkeeping."""
+        self._generation += 1
+        self._entries.clear()
+
+
+step_template_cache = StepTemplateCache()
@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from veriqko.db.base import get_db
 from veriqko.dependencies import get_current_user
 from veriqko.jobs.models import JobStatus, TestStep
+from veriqko.templates.cache import step_template_cache
 from veriqko.templates.schemas import TestStepCreate, TestStepResponse, TestStepUpdate
 from veriqko.users.models import User
 
@@ -48,6 +49,7 @@ async def create_template(
     step = TestStep(**data.model_dump())
     db.add(step)
     await db.commit()
+    step_template_cache.invalidate()
     await db.refresh(step)
     return step
 
@@ -68,6 +70,7 @@ async def update_template(
         setattr(step, field, value)
 
     await db.commit()
+    step_template_cache.invalidate()
     await db.refresh(step)
     return step
 
@@ -84,3 +87,4 @@ async def delete_template(
 
     await db.delete(step)
     await db.commit()
+    step_template_cache.invalidate()
@@ -9,6 +9,7 @@ from sqlalchemy.pool import NullPool
 
 from veriqko.config import get_settings
 from veriqko.db.base import get_db
+from veriqko.db.replica import get_read_db
 from veriqko.main import app
 
 settings = get_settings()
@@ -60,6 +61,7 @@ async def async_client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient,
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
 
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
         yield client
@@ -0,0 +1,88 @@
+"""
+Plan checks for the active-job queries.
+
+Seeds `jobs` with a representative shape (many finished jobs, a small
+active working set), runs ANALYZE, and EXPLAINs each query with the
+planner's normal costs: the plan must use the index the query was written
+for. Everything is rolled back afterwards. Skipped when no database is
+reachable.
+"""
+
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from veriqko.cron.sla_checker import _sla_candidates_query
+from veriqko.stations.router import _station_queue_query
+from veriqko.stats.floor import active_jobs_query
+from veriqko.stats.router import _recent_jobs_query
+
+# Query -> (statement, index it must use)
+QUERIES = {
+    "floor": (lambda: active_jobs_query(), "ix_jobs_active_station_updated_at"),
+    "dashboard_recent": (lambda: _recent_jobs_query(), "ix_jobs_created_at_id"),
+    "sla_checker": (
+        lambda: _sla_candidates_query(datetime.now(UTC)),
+        "ix_jobs_active_sla_due_at",
+    ),
+    "station_queue": (
+        lambda: _station_queue_query("00000000-0000-0000-0000-000000000000"),
+        "ix_jobs_active_station_updated_at",
+    ),
+}
+
+FINISHED_JOBS = 50_000
+ACTIVE_JOBS = 500
+
+SEED_SQL = text("""
+    INSERT INTO jobs (
+        id, serial_number, status, sla_due_at, completed_at, created_at, updated_at,
+        picea_mdm_locked, picea_erase_confirmed, is_fully_tested, version
+    )
+    SELECT
+        gen_random_uuid(),
+        'PLAN-' || n,
+        CASE WHEN n <= :active THEN 'intake' ELSE 'completed' END::job_status,
+        now() + (n % 96) * interval '1 hour',
+        CASE WHEN n <= :active THEN NULL ELSE now() - n * interval '1 minute' END,
+        now() - n * interval '1 minute',
+        now() - n * interval '1 minute',
+        false, false, true, 1
+    FROM generate_series(1, :total) AS n
+""")
+
+
+def _index_names(plan: dict) -> set[str]:
+    found = {plan["Index Name"]} if "Index Name" in plan else set()
+    for child in plan.get("Plans", []):
+        found |= _index_names(child)
+    return found
+
+
+@pytest.fixture
+async def explain_session(db_session: AsyncSession):
+    try:
+        await db_session.execute(text("SELECT 1"))
+    except Exception as e:
+        pytest.skip(f"Database not available: {e}")
+
+    await db_session.execute(
+        SEED_SQL, {"active": ACTIVE_JOBS, "total": FINISHED_JOBS + ACTIVE_JOBS}
+    )
+    await db_session.execute(text("ANALYZE jobs"))
+    yield db_session
+    await db_session.rollback()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("name", sorted(QUERIES))
+async def test_active_job_query_uses_its_index(explain_session: AsyncSession, name: str):
+    query, index = QUERIES[name]
+    sql = str(query().compile(bind=explain_session.bind, compile_kwargs={"literal_binds": True}))
+
+    result = await explain_session.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"))
+    plan = result.scalar()[0]["Plan"]
+
+    assert index in _index_names(plan), f"{name} does not use {index}:\n{sql}"
@@ -0,0 +1,69 @@
+"""
+Outbox round trip against the configured database.
+
+Writes an event and relays it through the real `outbox_status` type, so a
+mismatch between the mapped enum and the migration's labels fails here.
+Everything runs in one outer transaction that is rolled back; skipped when
+no database is reachable.
+"""
+
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+import veriqko.models  # noqa: F401
+from veriqko.outbox.models import OutboxEvent, OutboxStatus
+from veriqko.outbox.service import OutboxDispatcher, OutboxService
+
+
+@pytest.fixture
+async def outbox_sessions(db_engine):
+    try:
+        connection = await db_engine.connect()
+    except Exception as e:
+        pytest.skip(f"Database not available: {e}")
+
+    transaction = await connection.begin()
+    # Commits inside the dispatcher become savepoints of the outer transaction
+    factory = async_sessionmaker(
+        connection,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+    yield factory
+    await transaction.rollback()
+    await connection.close()
+
+
+@pytest.mark.asyncio
+async def test_event_is_enqueued_and_relayed(outbox_sessions, monkeypatch):
+    delivered = []
+
+    async def handler(payload: dict) -> None:
+        delivered.append(payload)
+
+    effect = f"test.{uuid4().hex}"
+    async with outbox_sessions() as db:
+        event = OutboxService(db).enqueue(effect, {"job_id": "j1"})
+        await db.flush()
+        # Only this event is due inside the test transaction; the sessions
+        # share one connection, so deliveries must not run side by side
+        await db.execute(text("DELETE FROM outbox_events WHERE id <> :id"), {"id": event.id})
+        await db.commit()
+        stored = await db.scalar(
+            text("SELECT status::text FROM outbox_events WHERE id = :id"), {"id": event.id}
+        )
+    assert stored == "pending"
+
+    dispatcher = OutboxDispatcher(outbox_sessions, {effect: handler})
+    assert await dispatcher.dispatch_pending() == 1
+
+    async with outbox_sessions() as db:
+        relayed = await db.scalar(select(OutboxEvent).where(OutboxEvent.id == event.id))
+    assert delivered == [{"job_id": "j1"}]
+    assert relayed.status == OutboxStatus.DONE
+    assert relayed.processed_at <= datetime.now(UTC)
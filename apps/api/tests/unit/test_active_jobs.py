@@ -0,0 +1,22 @@
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import asyncpg
+
+import veriqko.models  # noqa: F401
+from veriqko.jobs.models import ACTIVE_JOB_PREDICATE, Job, active_job_criteria
+
+
+def test_active_job_criteria_inlines_statuses():
+    compiled = select(Job.id).where(active_job_criteria()).compile(dialect=asyncpg.dialect())
+
+    # Bound statuses would stop generic plans from matching the partial indexes
+    assert "jobs.status NOT IN ('completed', 'failed')" in str(compiled)
+    assert "jobs.deleted_at IS NULL" in str(compiled)
+    assert not compiled.params
+
+
+def test_partial_indexes_share_the_active_predicate():
+    indexes = {index.name: index for index in Job.__table__.indexes}
+
+    for name in ("ix_jobs_active_station_updated_at", "ix_jobs_active_sla_due_at"):
+        where = indexes[name].dialect_options["postgresql"]["where"]
+        assert str(where) == ACTIVE_JOB_PREDICATE
@@ -0,0 +1,95 @@
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+import veriqko.models  # noqa: F401
+from veriqko.archive.models import ARCHIVE_TABLES, ArchivedJob
+from veriqko.archive.service import ArchiveService
+from veriqko.jobs.models import JobStatus
+from veriqko.jobs.router import get_job
+
+
+def _compile(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def test_archive_tables_mirror_hot_tables():
+    for source, archive in ARCHIVE_TABLES.items():
+        columns = [c.name for c in source.columns]
+        assert [c.name for c in archive.columns] == [*columns, "archived_at"]
+        assert {c.name for c in archive.primary_key} == {c.name for c in source.primary_key}
+        assert not archive.foreign_keys
+
+
+@pytest.mark.asyncio
+async def test_archive_batch_copies_then_deletes():
+    session = AsyncMock()
+    session.scalars.return_value = MagicMock(all=MagicMock(return_value=["j1", "j2"]))
+    # j2 was soft-deleted, so only j1 comes off the live counters
+    removed = MagicMock()
+    removed.all.return_value = [
+        (JobStatus.COMPLETED, None),
+        (JobStatus.FAILED, datetime(2025, 1, 1, tzinfo=UTC)),
+    ]
+    session.execute.return_value = removed
+
+    moved = await ArchiveService(session).archive_batch(datetime(2026, 1, 1, tzinfo=UTC), 100)
+
+    assert moved == 2
+    select_sql = _compile(session.scalars.await_args.args[0])
+    assert "FOR UPDATE SKIP LOCKED" in select_sql
+    # Matches the partial ix_jobs_finished_archive_cutoff index, oldest first
+    assert "jobs.status IN ('completed', 'failed')" in select_sql
+    assert "ORDER BY coalesce(jobs.completed_at, jobs.updated_at)" in select_sql
+    assert "part_usages" not in select_sql
+
+    statements = [call.args[0] for call in session.execute.await_args_list]
+    assert [_compile(s).split(" (")[0] for s in statements[:-3]] == [
+        "INSERT INTO jobs_archive",
+        "INSERT INTO test_results_archive",
+        "INSERT INTO evidence_archive",
+        "INSERT INTO job_history_archive",
+        "INSERT INTO reports_archive",
+        "INSERT INTO part_usages_archive",
+    ]
+    # Part usages have no ON DELETE CASCADE, so they are removed first
+    assert _compile(statements[-3]).startswith(
+        "DELETE FROM part_usages WHERE part_usages.job_id IN"
+    )
+    assert _compile(statements[-2]).startswith("DELETE FROM jobs")
+    counter_params = statements[-1].compile(dialect=postgresql.dialect()).params
+    assert [v for k, v in counter_params.items() if k.startswith("job_count")] == [-1]
+
+
+@pytest.mark.asyncio
+async def test_archive_batch_with_nothing_due():
+    session = AsyncMock()
+    session.scalars.return_value = MagicMock(all=MagicMock(return_value=[]))
+
+    assert await ArchiveService(session).archive_batch(datetime(2026, 1, 1, tzinfo=UTC), 100) == 0
+    session.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_soft_deleted_job_stays_hidden_once_archived():
+    # The archive holds a job that was soft-deleted before it was moved
+    deleted_at = datetime(2025, 1, 1, tzinfo=UTC)
+    archived = ArchivedJob(id="j1", status=JobStatus.FAILED, deleted_at=deleted_at)
+
+    async def execute(stmt):
+        sql = _compile(stmt)
+        found = "FROM jobs_archive" in sql and "jobs_archive.deleted_at IS NULL" not in sql
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = archived if found else None
+        result.unique.return_value.scalar_one_or_none.return_value = None
+        return result
+
+    session = AsyncMock()
+    session.execute.side_effect = execute
+
+    with pytest.raises(HTTPException) as exc:
+        await get_job("j1", MagicMock(), session, MagicMock())
+    assert exc.value.status_code == 404
@@ -0,0 +1,75 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+import veriqko.models  # noqa: F401
+from veriqko.integrations.gsma import gsma_client
+from veriqko.jobs.models import JobStatus
+from veriqko.jobs.schemas import JobBatchCreate
+from veriqko.jobs.service import JobRepository, JobService
+
+
+@pytest.fixture
+def session():
+    conn = AsyncMock()
+    conn.dialect = MagicMock(driver="psycopg")
+
+    session = AsyncMock()
+    session.connection.return_value = conn
+    session.scalars.side_effect = lambda stmt: MagicMock(all=MagicMock(return_value=[10002, 10001]))
+    return session
+
+
+@pytest.mark.asyncio
+async def test_bulk_intake_reports_per_serial_outcomes(session, monkeypatch):
+    blacklisted = AsyncMock(side_effect=lambda imei: imei.endswith("666"))
+    monkeypatch.setattr(gsma_client, "check_imei_blacklist", blacklisted)
+    service = JobService(session)
+
+    outcomes = await service.bulk_intake(
+        JobBatchCreate(
+            serial_numbers=["SN-1", "350000000000666", " SN-2 ", "SN-1", ""], batch_id="P1"
+        ),
+        "u1",
+    )
+
+    assert [o.serial_number for o in outcomes] == ["SN-1", "350000000000666", "SN-2", "SN-1", ""]
+    assert [o.success for o in outcomes] == [True, False, True, False, False]
+    assert outcomes[1].errors == ["Device with IMEI 350000000000666 is blacklisted by GSMA"]
+    assert outcomes[3].errors == ["Duplicate serial number in request"]
+    assert outcomes[4].errors == ["Serial number must be 1-100 characters"]
+    assert [o.ticket_id for o in outcomes if o.success] == [10001, 10002]
+
+    # Jobs and history each go in as one bulk statement
+    conn = session.connection.return_value
+    assert conn.execute.await_count == 2
+    job_rows = conn.execute.await_args_list[0].args[1]
+    history_rows = conn.execute.await_args_list[1].args[1]
+    assert [r["serial_number"] for r in job_rows] == ["SN-1", "SN-2"]
+    assert all(r["batch_id"] == "P1" and r["status"] == JobStatus.INTAKE for r in job_rows)
+    assert [h["job_id"] for h in history_rows] == [r["id"] for r in job_rows]
+
+
+@pytest.mark.asyncio
+async def test_bulk_intake_rejects_serial_when_gsma_check_errors(session, monkeypatch):
+    timeout = AsyncMock(side_effect=RuntimeError("timeout"))
+    monkeypatch.setattr(gsma_client, "check_imei_blacklist", timeout)
+    service = JobService(session)
+
+    outcomes = await service.bulk_intake(JobBatchCreate(serial_numbers=["350000000000001"]), "u1")
+
+    assert outcomes[0].success is False
+    assert outcomes[0].errors == ["GSMA blacklist check failed"]
+    session.connection.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_reserve_ticket_ids_draws_block_from_sequence(session):
+    ticket_ids = await JobRepository(session).reserve_ticket_ids(2)
+
+    assert ticket_ids == [10001, 10002]
+    sql = str(session.scalars.await_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "nextval(pg_get_serial_sequence" in sql
+    assert "generate_series" in sql
+    assert "max(" not in sql
@@ -0,0 +1,87 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
+
+import pytest
+from pydantic import ValidationError
+
+import veriqko.models  # noqa: F401
+from veriqko.jobs.models import JobStatus
+from veriqko.jobs.schemas import JobBulkTransition
+from veriqko.jobs.service import JobService
+
+
+def _result(rows=None):
+    result = MagicMock()
+    result.all.return_value = rows or []
+    return result
+
+
+@pytest.mark.asyncio
+async def test_bulk_transition_reports_per_job_outcomes():
+    session = AsyncMock()
+    session.add = MagicMock()
+    service = JobService(session)
+
+    rows = [
+        # Passes the intake guard
+        SimpleNamespace(id="j1", status=JobStatus.INTAKE, guard_0=False),
+        # Missing intake condition
+        SimpleNamespace(id="j2", status=JobStatus.INTAKE, guard_0=True),
+        # Not allowed to move to RESET from QC
+        SimpleNamespace(id="j3", status=JobStatus.QC, guard_0=False),
+        # Eligible, but changed concurrently before the UPDATE
+        SimpleNamespace(id="j4", status=JobStatus.INTAKE, guard_0=False),
+    ]
+    session.execute.side_effect = [
+        _result(rows=rows),
+        _result(rows=[SimpleNamespace(id="j1", serial_number="SN1", customer_reference=None)]),
+        _result(),
+        _result(),
+    ]
+
+    outcomes = await service.bulk_transition(
+        target_status="reset",
+        user_id="u1",
+        job_ids=["j1", "j2", "j3", "j4", "missing"],
+    )
+
+    by_id = {o.job_id: o for o in outcomes}
+    assert [o.job_id for o in outcomes] == ["j1", "j2", "j3", "j4", "missing"]
+    assert by_id["j1"].success is True
+    assert by_id["j2"].errors == ["Intake condition assessment must be completed"]
+    assert by_id["j3"].errors == ["Cannot transition from qc to reset"]
+    assert by_id["j4"].errors == ["Job was modified by another request"]
+    assert by_id["missing"].errors == ["Job not found"]
+
+    # One SELECT, one UPDATE ... RETURNING, one history INSERT, one counter upsert
+    assert session.execute.await_count == 4
+    history_rows = session.execute.await_args_list[2].args[1]
+    assert [h["job_id"] for h in history_rows] == ["j1"]
+    assert history_rows[0]["from_status"] == JobStatus.INTAKE
+    # Picea sync queued for the moved job only
+    queued = [call.args[0] for call in session.add.call_args_list]
+    assert [(e.effect, e.payload["job_id"]) for e in queued] == [("picea.sync_diagnostics", "j1")]
+
+
+@pytest.mark.asyncio
+async def test_bulk_transition_skips_writes_when_nothing_eligible():
+    session = AsyncMock()
+    service = JobService(session)
+    session.execute.side_effect = [
+        _result(rows=[SimpleNamespace(id="j1", status=JobStatus.COMPLETED)]),
+    ]
+
+    outcomes = await service.bulk_transition(target_status="qc", user_id="u1", batch_id="B-1")
+
+    assert outcomes[0].success is False
+    assert session.execute.await_count == 1
+
+
+def test_bulk_transition_rejects_non_uuid_job_ids():
+    # A malformed id must be a 422, not a DataError from the IN (...) query
+    with pytest.raises(ValidationError):
+        JobBulkTransition(job_ids=["j1"], target_status="qc")
+
+    data = JobBulkTransition(job_ids=[str(UUID(int=1))], target_status="qc")
+    assert data.job_ids == [UUID(int=1)]
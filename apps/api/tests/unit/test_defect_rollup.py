@@ -0,0 +1,111 @@
+from datetime import UTC, date, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+import veriqko.models  # noqa: F401
+from veriqko.stats.defects import DefectRollupService
+from veriqko.stats.rollups import SAFETY_MARGIN
+
+
+def _result(rows):
+    result = MagicMock()
+    result.all.return_value = rows
+    return result
+
+
+def _sql(call) -> str:
+    return str(call.args[0].compile(dialect=postgresql.dialect()))
+
+
+def _session(watermark, touched_days=()):
+    session = AsyncMock()
+    session.scalar.return_value = watermark
+    scalars = MagicMock()
+    scalars.all.return_value = list(touched_days)
+    session.scalars.return_value = scalars
+    return session
+
+
+@pytest.mark.asyncio
+async def test_first_refresh_rebuilds_everything():
+    session = _session(None)
+    now = datetime(2026, 10, 17, 12, 0, tzinfo=UTC)
+
+    days = await DefectRollupService(session).refresh(now)
+
+    assert days is None
+    lock, clear, rebuild, watermark = session.execute.await_args_list
+    assert "LOCK TABLE defect_rollup IN EXCLUSIVE MODE" in str(lock.args[0])
+    assert _sql(clear) == "DELETE FROM defect_rollup"
+    sql = _sql(rebuild)
+    assert "INSERT INTO defect_rollup (day, device_model, test_step, failures, total)" in sql
+    assert "FROM test_results JOIN jobs" in sql
+    assert "FROM test_results_archive JOIN jobs_archive" in sql
+    assert "created_at >=" not in sql
+    params = watermark.args[0].compile(dialect=postgresql.dialect()).params
+    assert params["value"] == now - SAFETY_MARGIN
+
+
+@pytest.mark.asyncio
+async def test_refresh_rebuilds_only_touched_days():
+    since = datetime(2026, 10, 17, 11, 45, tzinfo=UTC)
+    touched = [date(2026, 10, 16), date(2026, 10, 17)]
+    session = _session(since, touched)
+
+    days = await DefectRollupService(session).refresh(datetime(2026, 10, 17, 12, 0, tzinfo=UTC))
+
+    assert days == touched
+    touched_sql = str(session.scalars.await_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "test_results.updated_at >=" in touched_sql
+    assert "jobs.deleted_at >=" in touched_sql
+
+    _, clear, rebuild, _ = session.execute.await_args_list
+    assert "WHERE defect_rollup.day IN" in _sql(clear)
+    compiled = rebuild.args[0].compile(dialect=postgresql.dialect())
+    # Each day is bounded by a created_at range, on both the hot and archive tables
+    bounds = [v for k, v in compiled.params.items() if k.startswith("created_at")]
+    midnight = [datetime(2026, 10, d, tzinfo=UTC) for d in (16, 17, 18)]
+    assert sorted(bounds) == sorted([midnight[0], midnight[1], midnight[1], midnight[2]] * 2)
+
+
+@pytest.mark.asyncio
+async def test_refresh_without_new_results_only_moves_the_watermark():
+    session = _session(datetime(2026, 10, 17, 11, 45, tzinfo=UTC))
+
+    days = await DefectRollupService(session).refresh()
+
+    assert days == []
+    lock, watermark = session.execute.await_args_list
+    assert "ON CONFLICT (name) DO UPDATE" in _sql(watermark)
+
+
+@pytest.mark.asyncio
+async def test_heatmap_sums_buckets_and_reports_failure_rate():
+    session = AsyncMock()
+    row = MagicMock(device_model="iPhone 13", test_step="Screen", failures=3, total=40)
+    session.execute.return_value = _result([row])
+
+    heatmap = await DefectRollupService(session).heatmap(
+        date(2026, 10, 1), date(2026, 10, 17), model="iPhone 13"
+    )
+
+    assert heatmap == [
+        {"model": "iPhone 13", "test_step": "Screen", "count": 3, "total": 40, "failure_rate": 7.5}
+    ]
+    compiled = session.execute.await_args.args[0].compile(dialect=postgresql.dialect())
+    sql = str(compiled)
+    assert "FROM defect_rollup" in sql
+    assert "test_results" not in sql
+    assert "HAVING sum(defect_rollup.failures) >" in sql
+    assert set(compiled.params.values()) >= {date(2026, 10, 1), date(2026, 10, 17), "iPhone 13"}
+
+
+@pytest.mark.asyncio
+async def test_heatmap_without_filters_reads_all_days():
+    session = AsyncMock()
+    session.execute.return_value = _result([])
+
+    assert await DefectRollupService(session).heatmap() == []
+    assert "WHERE" not in _sql(session.execute.await_args)
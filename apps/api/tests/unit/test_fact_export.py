@@ -0,0 +1,158 @@
+from datetime import UTC, date, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+import veriqko.models  # noqa: F401
+from veriqko.analytics.facts import (
+    JOB_FACT_COLUMNS,
+    TIERS,
+    FactExportService,
+    job_facts_query,
+    to_parquet,
+)
+from veriqko.archive.models import job_history_archive, jobs_archive, test_results_archive
+from veriqko.evidence.storage import LocalFileStorage, StorageConfig
+from veriqko.jobs.models import JobStatus
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def _job_row(job_id: str, status=JobStatus.COMPLETED):
+    fields = {name: None for name, _ in JOB_FACT_COLUMNS}
+    fields.update(
+        job_id=job_id,
+        ticket_id=1,
+        status=status,
+        is_fully_tested=True,
+        completed_at=datetime(2026, 10, 16, 12, 0, tzinfo=UTC),
+        qc_seconds=600,
+        tests_passed=9,
+    )
+    if status == JobStatus.FAILED:
+        fields.update(completed_at=None, qc_seconds=None, tests_passed=0, tests_failed=1)
+    fields["finished_at"] = datetime(2026, 10, 16, 12, 0, tzinfo=UTC)
+    return SimpleNamespace(**fields)
+
+
+def _db(lock=True, watermark=None):
+    db = AsyncMock()
+    db.scalar.side_effect = [lock, watermark]
+    return db
+
+
+def _read_db(days=(), job_rows=()):
+    read_db = AsyncMock()
+    scalars = MagicMock()
+    scalars.all.return_value = list(days)
+    read_db.scalars.return_value = scalars
+
+    def execute(stmt):
+        result = MagicMock()
+        # Job rows come from the hot jobs table only; every other query is empty
+        hot_jobs = "FROM jobs LEFT OUTER JOIN" in _sql(stmt)
+        result.all.return_value = list(job_rows) if hot_jobs else []
+        return result
+
+    read_db.execute.side_effect = execute
+    return read_db
+
+
+def test_parquet_keeps_its_schema_when_empty():
+    table = pq.read_table(pa.BufferReader(to_parquet([], JOB_FACT_COLUMNS)))
+
+    assert table.num_rows == 0
+    assert table.schema.names == [name for name, _ in JOB_FACT_COLUMNS]
+    assert table.schema.field("completed_at").type == pa.timestamp("us", tz="UTC")
+
+
+def test_job_facts_read_archive_tables_too():
+    day = date(2026, 10, 16)
+    sql = _sql(job_facts_query(jobs_archive, test_results_archive, job_history_archive, day))
+
+    assert "FROM jobs_archive" in sql
+    assert "LATERAL (SELECT count(*) FILTER (WHERE test_results_archive.status = " in sql
+    assert "jobs_archive.deleted_at IS NULL" in sql
+
+
+@pytest.mark.asyncio
+async def test_first_run_writes_every_completion_day(tmp_path):
+    storage = LocalFileStorage(StorageConfig(base_path=tmp_path))
+    read_db = _read_db([date(2026, 10, 15), date(2026, 10, 16)], [_job_row("j1"), _job_row("j2")])
+
+    days = await FactExportService(_db(), storage, "analytics", read_db=read_db).run()
+
+    assert days == [date(2026, 10, 15), date(2026, 10, 16)]
+    assert "FROM jobs_archive" in _sql(read_db.scalars.await_args.args[0])
+    partition = tmp_path / "analytics" / "job_facts" / "finished_date=2026-10-16" / "part-0.parquet"
+    table = pq.read_table(partition)
+    assert table.column("job_id").to_pylist() == ["j1", "j2"]
+    assert table.column("status").to_pylist() == ["completed", "completed"]
+    assert table.column("qc_seconds").to_pylist() == [600.0, 600.0]
+    results = (
+        tmp_path / "analytics" / "test_result_facts" / "finished_date=2026-10-15" / "part-0.parquet"
+    )
+    assert pq.read_table(results).num_rows == 0
+
+
+@pytest.mark.asyncio
+async def test_later_runs_rewrite_only_touched_days(tmp_path):
+    storage = LocalFileStorage(StorageConfig(base_path=tmp_path))
+    db = _db(watermark=datetime(2026, 10, 17, 9, 0, tzinfo=UTC))
+    read_db = _read_db([date(2026, 10, 16)], [_job_row("j1")])
+
+    await FactExportService(db, storage, "analytics", read_db=read_db).run()
+    read_db.execute.side_effect = _read_db(job_rows=[_job_row("j2")]).execute.side_effect
+    db.scalar.side_effect = [True, datetime(2026, 10, 17, 10, 0, tzinfo=UTC)]
+    await FactExportService(db, storage, "analytics", read_db=read_db).run()
+
+    sql = _sql(read_db.scalars.await_args.args[0])
+    assert "jobs.completed_at >=" in sql
+    assert "job_history.to_status = " in sql
+    assert "jobs.deleted_at >=" in sql
+    assert "test_results.updated_at >=" in sql
+    partition = tmp_path / "analytics" / "job_facts" / "finished_date=2026-10-16" / "part-0.parquet"
+    # The partition is replaced, not appended to
+    assert pq.read_table(partition).column("job_id").to_pylist() == ["j2"]
+    assert not list(partition.parent.glob(".*"))
+
+
+@pytest.mark.asyncio
+async def test_run_is_skipped_while_another_export_holds_the_lock(tmp_path):
+    db = _db(lock=False)
+    storage = LocalFileStorage(StorageConfig(base_path=tmp_path))
+
+    assert await FactExportService(db, storage, "analytics", read_db=_read_db()).run() is None
+    db.execute.assert_not_awaited()
+    assert not any(tmp_path.iterdir())
+
+
+def test_failed_jobs_are_keyed_on_their_failed_transition():
+    sql = _sql(job_facts_query(*TIERS[0], date(2026, 10, 16)))
+
+    assert "jobs.status IN (" in sql
+    assert "coalesce(jobs.completed_at, (SELECT max(job_history.changed_at)" in sql
+    assert "jobs.completed_at IS NULL AND jobs.id IN (SELECT job_history.job_id" in sql
+
+
+@pytest.mark.asyncio
+async def test_failed_jobs_are_exported(tmp_path):
+    storage = LocalFileStorage(StorageConfig(base_path=tmp_path))
+    rows = [_job_row("j1"), _job_row("j2", JobStatus.FAILED)]
+    read_db = _read_db([date(2026, 10, 16)], rows)
+
+    await FactExportService(_db(), storage, "analytics", read_db=read_db).run()
+
+    partition = tmp_path / "analytics" / "job_facts" / "finished_date=2026-10-16" / "part-0.parquet"
+    table = pq.read_table(partition)
+    assert table.column("status").to_pylist() == ["completed", "failed"]
+    assert table.column("completed_at").to_pylist()[1] is None
+    assert table.column("finished_at").to_pylist()[1] == datetime(2026, 10, 16, 12, 0, tzinfo=UTC)
+    assert table.column("tests_failed").to_pylist() == [None, 1]
@@ -0,0 +1,152 @@
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+import veriqko.models  # noqa: F401
+from veriqko.config import get_settings
+from veriqko.stats.floor import FLOOR_CHANNEL, FloorBroadcaster, FloorState, diff_floor
+
+
+class FakeListener:
+    """Stands in for the asyncpg connection holding the LISTEN."""
+
+    def __init__(self):
+        self.callbacks = {}
+
+    async def add_listener(self, channel, callback):
+        self.callbacks[channel] = callback
+
+    async def remove_listener(self, channel, callback):
+        self.callbacks.pop(channel, None)
+
+    def is_closed(self):
+        return False
+
+    def notify(self):
+        self.callbacks[FLOOR_CHANNEL](self, 1, FLOOR_CHANNEL, "")
+
+
+def _broadcaster(listener: FakeListener, load: AsyncMock, **settings) -> FloorBroadcaster:
+    conn = MagicMock()
+    conn.get_raw_connection = AsyncMock(return_value=SimpleNamespace(driver_connection=listener))
+
+    @asynccontextmanager
+    async def connect():
+        yield conn
+
+    @asynccontextmanager
+    async def session_factory():
+        yield MagicMock()
+
+    return FloorBroadcaster(
+        db_engine=SimpleNamespace(connect=connect),
+        session_factory=session_factory,
+        load=load,
+        settings=get_settings().model_copy(update={
+            "floor_stream_debounce_seconds": 0.01,
+            "floor_stream_heartbeat_seconds": 60,
+            "floor_stream_resync_seconds": 60,
+            **settings,
+        }),
+    )
+
+
+def _floor(*stations):
+    return [
+        {"id": sid, "name": sid.upper(), "type": "reset", "jobs": list(jobs)}
+        for sid, jobs in stations
+    ]
+
+
+def _job(job_id, **fields):
+    return {"id": job_id, "serial_number": f"SN-{job_id}", "status": "reset", **fields}
+
+
+def test_diff_floor_reports_per_job_changes():
+    old = FloorState.from_view(_floor(("s1", [_job("j1"), _job("j2")]), ("s2", [_job("j3")])))
+    new = FloorState.from_view(
+        _floor(("s1", [_job("j1", status="qc")]), ("s2", [_job("j3"), _job("j2"), _job("j4")]))
+    )
+
+    assert diff_floor(old, new) == [
+        {"op": "update", "id": "j1", "changes": {"status": "qc"}},
+        {"op": "move", "id": "j2", "station_id": "s2", "changes": {}},
+        {"op": "add", "job": {**_job("j4"), "station_id": "s2"}},
+    ]
+    assert diff_floor(new, old)[-1] == {"op": "remove", "id": "j4"}
+    assert diff_floor(old, old) == []
+
+
+@pytest.mark.asyncio
+async def test_subscribers_get_a_snapshot_then_shared_deltas():
+    listener = FakeListener()
+    load = AsyncMock(side_effect=[
+        _floor(("s1", [_job("j1")])),
+        _floor(("s1", [_job("j1", status="qc")])),
+    ])
+    broadcaster = _broadcaster(listener, load)
+
+    first, second = broadcaster.subscribe(), broadcaster.subscribe()
+    initial = await asyncio.gather(anext(first), anext(second))
+    assert initial[0] is initial[1]
+    assert initial[0].event == "snapshot"
+    assert json.loads(initial[0].data) == {"seq": 0, "floor": _floor(("s1", [_job("j1")]))}
+
+    # A burst of writes is one recompute, sent to both viewers as one delta
+    for _ in range(3):
+        listener.notify()
+    updated = await asyncio.wait_for(asyncio.gather(anext(first), anext(second)), timeout=1)
+
+    assert updated[0] is updated[1]
+    assert updated[0].event == "delta"
+    assert updated[0].id == f"{broadcaster.epoch}-1"
+    assert json.loads(updated[0].data) == {
+        "seq": 1,
+        "changes": [{"op": "update", "id": "j1", "changes": {"status": "qc"}}],
+    }
+    assert load.await_count == 2
+
+    await first.aclose()
+    assert broadcaster._task is not None
+    await second.aclose()
+    assert broadcaster._task is None
+    assert FLOOR_CHANNEL not in listener.callbacks
+
+
+@pytest.mark.asyncio
+async def test_resume_replays_missed_deltas_or_falls_back_to_snapshot():
+    broadcaster = _broadcaster(FakeListener(), AsyncMock(), floor_stream_replay_size=2)
+    broadcaster._publish(_floor(("s1", [])))
+    for n in range(1, 4):
+        broadcaster._publish(_floor(("s1", [_job(f"j{n}")])))
+    epoch = broadcaster.epoch
+    assert broadcaster.seq == 3
+
+    # Missed seq 3 only; still buffered
+    assert [e.id for e in broadcaster._events_after(2)] == [f"{epoch}-3"]
+    assert broadcaster._events_after(3) == []
+    # Seq 2 and 3 are buffered, seq 1 is not
+    assert [e.event for e in broadcaster._events_after(1)] == ["delta", "delta"]
+    assert [e.event for e in broadcaster._events_after(0)] == ["snapshot"]
+
+    # Resuming from another epoch starts over
+    stream = broadcaster.subscribe(last_event_id="deadbeef-3")
+    assert (await anext(stream)).event == "snapshot"
+    await stream.aclose()
+
+
+@pytest.mark.asyncio
+async def test_quiet_floor_sends_heartbeats():
+    broadcaster = _broadcaster(
+        FakeListener(), AsyncMock(return_value=[]), floor_stream_heartbeat_seconds=0.02
+    )
+
+    stream = broadcaster.subscribe()
+    assert (await anext(stream)).event == "snapshot"
+    assert await anext(stream) is None
+
+    await stream.aclose()
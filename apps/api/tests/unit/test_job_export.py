@@ -0,0 +1,71 @@
+import csv
+import io
+import json
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+import openpyxl
+import pytest
+
+from veriqko.jobs.export import EXPORT_COLUMNS, write_csv, write_ndjson, write_xlsx
+from veriqko.jobs.models import JobStatus
+
+
+def _row(i: int):
+    values = {key: None for _, key in EXPORT_COLUMNS}
+    values.update(
+        id=f"job-{i}",
+        ticket_id=10000 + i,
+        serial_number=f"SN-{i}",
+        status=JobStatus.COMPLETED,
+        created_at=datetime(2026, 10, 1, 12, 0, tzinfo=UTC),
+        tests_passed=3,
+        tests_failed=1,
+        failed_steps="Camera",
+    )
+    return SimpleNamespace(**values)
+
+
+async def _batches(count: int, batch_size: int = 2):
+    rows = [_row(i) for i in range(count)]
+    for start in range(0, count, batch_size):
+        yield rows[start : start + batch_size]
+
+
+async def _collect(writer, count):
+    return [chunk async for chunk in writer(_batches(count))]
+
+
+@pytest.mark.asyncio
+async def test_csv_streams_one_chunk_per_batch():
+    chunks = await _collect(write_csv, 5)
+
+    # Header goes out with the first batch; 3 batches plus the final flush
+    assert len(chunks) == 4
+    rows = list(csv.reader(io.StringIO("".join(chunks))))
+    assert rows[0] == [header for header, _ in EXPORT_COLUMNS]
+    assert len(rows) == 6
+    assert rows[1][:5] == ["job-0", "10000", "SN-0", "", "completed"]
+
+
+@pytest.mark.asyncio
+async def test_ndjson_emits_one_object_per_line():
+    lines = "".join(await _collect(write_ndjson, 3)).splitlines()
+
+    assert len(lines) == 3
+    first = json.loads(lines[0])
+    assert first["status"] == "completed"
+    assert first["failed_steps"] == "Camera"
+    assert first["created_at"] == "2026-10-01 12:00:00+00:00"
+
+
+@pytest.mark.asyncio
+async def test_xlsx_round_trips():
+    content = b"".join(await _collect(write_xlsx, 3))
+
+    sheet = openpyxl.load_workbook(io.BytesIO(content)).active
+    rows = list(sheet.iter_rows(values_only=True))
+    assert rows[0][0] == "Job ID"
+    assert len(rows) == 4
+    assert rows[1][2] == "SN-0"
+    assert rows[1][11] == datetime(2026, 10, 1, 12, 0)
@@ -0,0 +1,95 @@
+from datetime import UTC, date, datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+import veriqko.models  # noqa: F401
+from veriqko.cron.history_partitions import (
+    add_months,
+    detach_history_partitions,
+    ensure_history_partitions,
+)
+from veriqko.db.pagination import encode_cursor
+from veriqko.jobs.service import JobRepository
+
+
+def _names_result(names):
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = names
+    return result
+
+
+def test_add_months_rolls_over_years():
+    assert add_months(date(2026, 11, 1), 3) == date(2027, 2, 1)
+    assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+
+
+@pytest.mark.asyncio
+async def test_ensure_partitions_creates_only_missing_months():
+    this_month = datetime.now(UTC).date().replace(day=1)
+    session = AsyncMock()
+    session.scalar.return_value = False
+    session.execute.side_effect = [
+        _names_result(
+            [f"job_history_{this_month.year:04d}_{this_month.month:02d}", "job_history_default"]
+        ),
+        MagicMock(),
+        MagicMock(),
+    ]
+
+    created = await ensure_history_partitions(session, months_ahead=2)
+
+    assert len(created) == 2
+    ddl = str(session.execute.await_args_list[1].args[0])
+    next_month = add_months(this_month, 1)
+    assert f"PARTITION OF job_history FOR VALUES FROM ('{next_month.isoformat()} 00:00+00')" in ddl
+
+
+@pytest.mark.asyncio
+async def test_ensure_partitions_moves_rows_out_of_the_default_partition():
+    this_month = datetime.now(UTC).date().replace(day=1)
+    session = AsyncMock()
+    session.execute.side_effect = [_names_result(["job_history_default"]), *[MagicMock()] * 5]
+    # Rows for this month landed in the default partition before it existed
+    session.scalar.return_value = True
+
+    created = await ensure_history_partitions(session, months_ahead=0)
+
+    name = f"job_history_{this_month.year:04d}_{this_month.month:02d}"
+    assert created == [name]
+    statements = [str(call.args[0]) for call in session.execute.await_args_list[1:]]
+    assert statements[0] == "ALTER TABLE job_history DETACH PARTITION job_history_default"
+    assert statements[1].startswith(f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF job_history")
+    assert statements[2].startswith(f"INSERT INTO {name} SELECT * FROM job_history_default WHERE")
+    assert statements[3].startswith("DELETE FROM job_history_default WHERE")
+    assert statements[4] == "ALTER TABLE job_history ATTACH PARTITION job_history_default DEFAULT"
+
+
+@pytest.mark.asyncio
+async def test_detach_partitions_before_cutoff():
+    session = AsyncMock()
+    session.execute.side_effect = [
+        _names_result(["job_history_2025_01", "job_history_2025_02", "job_history_default"]),
+        MagicMock(),
+    ]
+
+    detached = await detach_history_partitions(session, before=date(2025, 2, 1))
+
+    assert detached == ["job_history_2025_01"]
+    assert "DETACH PARTITION job_history_2025_01" in str(session.execute.await_args_list[1].args[0])
+
+
+@pytest.mark.asyncio
+async def test_history_cursor_bounds_partition_key():
+    session = AsyncMock()
+    session.execute.return_value = _names_result([])
+    cursor = encode_cursor(datetime(2026, 5, 3, tzinfo=UTC), str(uuid4()))
+
+    await JobRepository(session).get_history("job-1", limit=20, cursor=cursor)
+
+    sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "job_history.changed_at <= " in sql
+    assert "(job_history.changed_at, job_history.id) < " in sql
+    assert "ORDER BY job_history.changed_at DESC, job_history.id DESC" in sql
@@ -0,0 +1,34 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+import veriqko.models  # noqa: F401
+from veriqko.jobs.service import JobRepository
+
+
+@pytest.mark.asyncio
+async def test_list_rows_selects_only_list_columns():
+    session = AsyncMock()
+    session.execute.return_value = MagicMock()
+
+    await JobRepository(session).list_rows(search="SN-100", limit=100)
+
+    stmt = session.execute.await_args.args[0]
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    selected = sql.split(" FROM ")[0]
+
+    assert [c.key for c in stmt.selected_columns] == [
+        "id",
+        "serial_number",
+        "status",
+        "device_brand",
+        "device_type",
+        "device_model",
+        "assigned_technician_name",
+        "customer_reference",
+        "created_at",
+    ]
+    assert "picea_diagnostics_raw" not in selected
+    assert sql.count("LEFT OUTER JOIN") == 4
+    assert "ORDER BY jobs.created_at DESC, jobs.id DESC" in sql
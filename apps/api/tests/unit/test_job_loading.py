@@ -0,0 +1,29 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+import veriqko.models  # noqa: F401
+from veriqko.jobs.loading import JobLoad, job_load_options
+from veriqko.jobs.models import Job
+
+
+def _sql(profile: JobLoad) -> str:
+    stmt = select(Job).options(*job_load_options(profile))
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def test_detail_profile_joins_all_many_to_one_relations():
+    sql = _sql(JobLoad.DETAIL)
+
+    for table in ("devices", "brands", "gadget_types", "users", "stations"):
+        assert f"LEFT OUTER JOIN {table}" in sql
+    assert "jobs.picea_diagnostics_raw" in sql
+
+
+@pytest.mark.parametrize("profile", [JobLoad.LIST, JobLoad.GUARD, JobLoad.REPORT])
+def test_heavy_diagnostics_are_deferred(profile):
+    assert "jobs.picea_diagnostics_raw" not in _sql(profile)
+
+
+def test_guard_profile_has_no_joins():
+    assert "JOIN" not in _sql(JobLoad.GUARD)
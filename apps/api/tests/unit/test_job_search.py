@@ -0,0 +1,42 @@
+import pytest
+from sqlalchemy.dialects import postgresql
+
+import veriqko.models  # noqa: F401
+from veriqko.jobs.service import JobRepository
+
+
+def _compile(search: str) -> tuple[str, list]:
+    compiled = JobRepository._search_clause(search).compile(dialect=postgresql.dialect())
+    return str(compiled), list(compiled.params.values())
+
+
+def test_imei_uses_exact_match():
+    sql, params = _compile("356938035643809")
+
+    assert "jobs.imei = " in sql
+    assert "ILIKE" not in sql
+    assert "ticket_id" not in sql
+    assert params == ["356938035643809", "356938035643809"]
+
+
+def test_numeric_term_matches_ticket_id_exactly():
+    sql, params = _compile("10042")
+
+    assert "jobs.ticket_id = " in sql
+    assert "CAST" not in sql
+    assert "jobs.serial_number ILIKE " in sql
+    assert 10042 in params
+
+
+def test_short_term_skips_trigram_scan():
+    sql, params = _compile("AB")
+
+    assert "ILIKE" not in sql
+    assert params == ["AB", "AB", "AB"]
+
+
+@pytest.mark.parametrize("search, pattern", [("SN_1", "%SN\\_1%"), ("50%", "%50\\%%")])
+def test_like_wildcards_are_escaped(search, pattern):
+    _, params = _compile(search)
+
+    assert pattern in params
@@ -0,0 +1,114 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm.exc import StaleDataError
+
+import veriqko.models  # noqa: F401
+from veriqko.errors.exceptions import PreconditionFailedError
+from veriqko.jobs.models import Job, JobStatus
+from veriqko.jobs.router import _etag, _if_match_version
+from veriqko.jobs.schemas import JobUpdate
+from veriqko.jobs.service import JobService
+
+
+def _session_with_job(job: Job) -> AsyncMock:
+    session = AsyncMock()
+    session.add = MagicMock()
+    load_result = MagicMock()
+    load_result.scalar_one_or_none.return_value = job
+    session.execute.return_value = load_result
+    return session
+
+
+def test_job_mapper_uses_version_counter():
+    assert Job.__mapper__.version_id_col is Job.__table__.c.version
+
+
+def test_if_match_parsing():
+    job = Job(id="j1", version=7)
+
+    assert _etag(job) == '"7"'
+    assert _if_match_version(_etag(job)) == 7
+    assert _if_match_version(None) is None
+    assert _if_match_version("*") is None
+    for header in ('W/"7"', '"7", "8"', "7", '"abc"'):
+        with pytest.raises(HTTPException) as exc:
+            _if_match_version(header)
+        assert exc.value.status_code == 412
+
+
+@pytest.mark.asyncio
+async def test_update_with_stale_version_is_rejected_without_writing():
+    job = Job(id="j1", serial_number="SN1", status=JobStatus.INTAKE, version=3)
+    session = _session_with_job(job)
+
+    with pytest.raises(PreconditionFailedError) as exc:
+        await JobService(session).update("j1", JobUpdate(qc_notes="ok"), expected_version=2)
+
+    assert exc.value.status_code == 412
+    assert exc.value.details["current_version"] == 3
+    assert job.qc_notes is None
+    session.flush.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_write_during_flush_becomes_precondition_failure():
+    job = Job(
+        id="j1", serial_number="SN1", status=JobStatus.RESET, picea_erase_confirmed=True, version=3
+    )
+    session = _session_with_job(job)
+    session.scalar.return_value = True
+    session.flush.side_effect = StaleDataError("expected to update 1 row(s); 0 were matched")
+
+    with pytest.raises(PreconditionFailedError):
+        await JobService(session).transition("j1", "functional", "u1", expected_version=3)
+
+
+@pytest.mark.asyncio
+async def test_transition_with_stale_version_skips_guards():
+    job = Job(id="j1", serial_number="SN1", status=JobStatus.RESET, version=4)
+    session = _session_with_job(job)
+
+    with pytest.raises(PreconditionFailedError):
+        await JobService(session).transition("j1", "functional", "u1", expected_version=3)
+
+    assert job.status == JobStatus.RESET
+    session.scalar.assert_not_awaited()
+    session.flush.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_bulk_status_update_bumps_version():
+    session = AsyncMock()
+    session.execute.return_value = MagicMock(all=MagicMock(return_value=[]))
+
+    await JobService(session).repo.bulk_update_status(
+        {"j1": JobStatus.INTAKE}, JobStatus.RESET, "u1"
+    )
+
+    sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "version=(jobs.version + " in sql
+
+
+@pytest.mark.asyncio
+async def test_delete_with_stale_version_is_rejected_without_writing():
+    job = Job(id="j1", serial_number="SN1", status=JobStatus.INTAKE, version=3)
+    session = _session_with_job(job)
+
+    with pytest.raises(PreconditionFailedError):
+        await JobService(session).delete("j1", expected_version=2)
+
+    assert job.deleted_at is None
+    session.flush.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_write_during_delete_becomes_precondition_failure():
+    job = Job(id="j1", serial_number="SN1", status=JobStatus.INTAKE, version=3)
+    session = _session_with_job(job)
+    session.flush.side_effect = StaleDataError("expected to update 1 row(s); 0 were matched")
+
+    with pytest.raises(PreconditionFailedError):
+        await JobService(session).delete("j1", expected_version=3)
@@ -0,0 +1,107 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
+
+import pytest
+
+import veriqko.models  # noqa: F401
+from veriqko.db.pagination import decode_cursor
+from veriqko.jobs.models import Job, JobStatus
+from veriqko.jobs.workspace import HISTORY_PAGE_SIZE, load_workspace
+
+
+def _session_factory(sessions: list, in_flight: list, peak: list):
+    async def slow_execute(stmt):
+        in_flight.append(stmt)
+        # Hold the "connection" long enough for sibling queries to start
+        await asyncio.sleep(0.01)
+        peak.append(len(in_flight))
+        in_flight.remove(stmt)
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = []
+        return result
+
+    @asynccontextmanager
+    async def factory():
+        session = AsyncMock()
+        session.execute.side_effect = slow_execute
+        sessions.append(session)
+        yield session
+
+    return factory
+
+
+@pytest.mark.asyncio
+async def test_workspace_queries_run_concurrently_on_separate_sessions():
+    # On hold: no station steps, so no template lookup
+    job = Job(id="j1", serial_number="SN1", status=JobStatus.ON_HOLD)
+    sessions: list = []
+    peak: list = []
+
+    workspace = await load_workspace(job, _session_factory(sessions, [], peak))
+
+    assert workspace == {
+        "history": [],
+        "history_next_cursor": None,
+        "steps": [],
+        "evidence": [],
+        "reports": [],
+        "parts": [],
+    }
+    # One session per sub-resource, each running a single query
+    assert len(sessions) == 5
+    assert sum(s.execute.await_count for s in sessions) == 4
+    assert all(s.execute.await_count <= 1 for s in sessions)
+    # All four queries were in flight at once rather than one after another
+    assert max(peak) == 4
+
+
+@pytest.mark.asyncio
+async def test_workspace_returns_a_cursor_when_history_is_truncated():
+    job = Job(id="j1", serial_number="SN1", status=JobStatus.ON_HOLD)
+    start = datetime(2026, 10, 17, tzinfo=UTC)
+    entries = [
+        SimpleNamespace(
+            id=str(UUID(int=i)),
+            from_status=JobStatus.INTAKE,
+            to_status=JobStatus.ON_HOLD,
+            changed_by=None,
+            changed_at=start - timedelta(minutes=i),
+            notes=None,
+        )
+        for i in range(HISTORY_PAGE_SIZE)
+    ]
+
+    async def execute(stmt):
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = entries if "job_history" in str(stmt) else []
+        return result
+
+    @asynccontextmanager
+    async def factory():
+        session = AsyncMock()
+        session.execute.side_effect = execute
+        yield session
+
+    workspace = await load_workspace(job, factory)
+
+    assert len(workspace["history"]) == HISTORY_PAGE_SIZE
+    last = entries[-1]
+    assert decode_cursor(workspace["history_next_cursor"]) == (last.changed_at, last.id)
+
+
+@pytest.mark.asyncio
+async def test_workspace_connections_are_capped_across_loads(monkeypatch):
+    monkeypatch.setattr("veriqko.jobs.workspace._connection_slots", asyncio.Semaphore(2))
+    jobs = [Job(id=f"j{i}", serial_number=f"SN{i}", status=JobStatus.ON_HOLD) for i in range(3)]
+    sessions: list = []
+    peak: list = []
+    factory = _session_factory(sessions, [], peak)
+
+    await asyncio.gather(*(load_workspace(job, factory) for job in jobs))
+
+    assert len(sessions) == 15
+    assert max(peak) == 2
@@ -0,0 +1,116 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+import veriqko.models  # noqa: F401
+from veriqko.jobs.models import Job, JobStatus
+from veriqko.jobs.service import JobService
+from veriqko.outbox.models import OutboxEvent, OutboxStatus
+from veriqko.outbox.service import OutboxDispatcher
+
+
+@pytest.fixture
+def settings():
+    settings = MagicMock()
+    settings.outbox_concurrency = 2
+    settings.outbox_max_attempts = 3
+    settings.outbox_retry_base_seconds = 30
+    return settings
+
+
+def _dispatcher(settings, handlers):
+    session = AsyncMock()
+
+    @asynccontextmanager
+    async def session_factory():
+        yield session
+
+    return OutboxDispatcher(session_factory, handlers, settings), session
+
+
+def test_status_binds_the_migration_labels():
+    # Migration 018 created outbox_status with the lowercase values
+    status = OutboxEvent.__table__.c.status.type
+    assert status.enums == ["pending", "processing", "done", "failed"]
+    assert status.bind_processor(postgresql.dialect())(OutboxStatus.PENDING) == "pending"
+
+
+def _recorded_values(session) -> dict:
+    stmt = session.execute.await_args.args[0]
+    return {col.key: bind.value for col, bind in stmt._values.items()}
+
+
+@pytest.mark.asyncio
+async def test_completed_transition_queues_effects_without_calling_vendors():
+    job = Job(
+        id="j1",
+        serial_number="SN1",
+        status=JobStatus.QC,
+        qc_initials="AB",
+        qc_technician_id="u2",
+        customer_reference="customer@example.com",
+    )
+    session = AsyncMock()
+    session.add = MagicMock()
+    load_result = MagicMock()
+    load_result.scalar_one_or_none.return_value = job
+    session.execute.return_value = load_result
+
+    _, result = await JobService(session).transition("j1", "completed", "u1")
+
+    assert result.success is True
+    events = [c.args[0] for c in session.add.call_args_list if isinstance(c.args[0], OutboxEvent)]
+    assert [e.effect for e in events] == ["email.completion", "miradore.enroll"]
+    assert events[0].payload["recipient_email"] == "customer@example.com"
+    assert all(e.status == OutboxStatus.PENDING for e in events)
+
+
+@pytest.mark.asyncio
+async def test_successful_delivery_marks_done(settings):
+    handler = AsyncMock()
+    dispatcher, session = _dispatcher(settings, {"test.effect": handler})
+    event = OutboxEvent(id="e1", effect="test.effect", payload={"a": 1}, attempts=1)
+
+    await dispatcher._deliver(event, asyncio.Semaphore(1))
+
+    handler.assert_awaited_once_with({"a": 1})
+    values = _recorded_values(session)
+    assert values["status"] == OutboxStatus.DONE
+    assert values["last_error"] is None
+
+
+@pytest.mark.asyncio
+async def test_failed_delivery_is_retried_with_backoff(settings):
+    handler = AsyncMock(side_effect=RuntimeError("vendor down"))
+    dispatcher, session = _dispatcher(settings, {"test.effect": handler})
+    event = OutboxEvent(id="e1", effect="test.effect", payload={}, attempts=2)
+
+    await dispatcher._deliver(event, asyncio.Semaphore(1))
+
+    values = _recorded_values(session)
+    assert values["status"] == OutboxStatus.PENDING
+    assert values["last_error"] == "vendor down"
+    assert "next_attempt_at" in values
+
+
+@pytest.mark.asyncio
+async def test_delivery_gives_up_after_max_attempts(settings):
+    handler = AsyncMock(side_effect=RuntimeError("vendor down"))
+    dispatcher, session = _dispatcher(settings, {"test.effect": handler})
+    event = OutboxEvent(id="e1", effect="test.effect", payload={}, attempts=3)
+
+    await dispatcher._deliver(event, asyncio.Semaphore(1))
+
+    assert _recorded_values(session)["status"] == OutboxStatus.FAILED
+
+
+def test_backoff_doubles_and_caps(settings):
+    dispatcher, _ = _dispatcher(settings, {})
+
+    assert dispatcher.backoff(1) == timedelta(seconds=30)
+    assert dispatcher.backoff(3) == timedelta(seconds=120)
+    assert dispatcher.backoff(20) == timedelta(hours=1)
@@ -0,0 +1,39 @@
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from uuid import UUID
+
+import pytest
+
+from veriqko.db.pagination import decode_cursor, encode_cursor
+from veriqko.jobs.service import JobService
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2026, 3, 1, 12, 30, 15, 123456, tzinfo=UTC)
+    cursor = encode_cursor(created_at, "5b0c4a3e-1f2d-4c6b-9a8e-7d6c5b4a3f2e")
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (created_at, "5b0c4a3e-1f2d-4c6b-9a8e-7d6c5b4a3f2e")
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", "W10", "eyJhIjogMX0"])
+def test_decode_invalid_cursor(cursor):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(cursor)
+
+
+def test_decode_rejects_a_non_uuid_id():
+    # Well-formed, but the database would fail on the id
+    cursor = encode_cursor(datetime(2026, 3, 1, tzinfo=UTC), "job-2")
+
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(cursor)
+
+
+def test_next_cursor_only_on_full_page():
+    created_at = datetime(2026, 3, 1, tzinfo=UTC)
+    jobs = [SimpleNamespace(id=str(UUID(int=i)), created_at=created_at) for i in range(3)]
+
+    assert JobService.next_cursor(jobs, limit=5) is None
+    assert JobService.next_cursor([], limit=5) is None
+    assert decode_cursor(JobService.next_cursor(jobs, limit=3)) == (created_at, str(UUID(int=2)))
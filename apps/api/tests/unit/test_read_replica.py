@@ -0,0 +1,81 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from veriqko.db.replica import ReadReplica
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _factory(lag=0.0, error: Exception | None = None):
+    """Session factory whose sessions report `lag` seconds of replication lag."""
+    session = AsyncMock()
+    if error is not None:
+        session.scalar.side_effect = error
+    else:
+        session.scalar.return_value = lag
+    factory = MagicMock()
+    factory.return_value.__aenter__.return_value = session
+    factory.return_value.__aexit__.return_value = False
+    factory.session = session
+    return factory
+
+
+def _router(replica, clock=None) -> ReadReplica:
+    primary = MagicMock(name="primary")
+    return ReadReplica(replica, primary, max_lag=30, check_interval=5, clock=clock or FakeClock())
+
+
+@pytest.mark.asyncio
+async def test_without_a_replica_reads_use_the_primary():
+    router = _router(None)
+
+    assert await router.session_factory() is router.primary
+
+
+@pytest.mark.asyncio
+async def test_fresh_replica_serves_reads():
+    replica = _factory(lag=2.5)
+    router = _router(replica)
+
+    assert await router.session_factory() is replica
+    assert "pg_last_xact_replay_timestamp" in str(replica.session.scalar.await_args.args[0])
+
+
+@pytest.mark.asyncio
+async def test_lagging_replica_falls_back_to_the_primary():
+    router = _router(_factory(lag=120.0))
+
+    assert await router.session_factory() is router.primary
+
+
+@pytest.mark.asyncio
+async def test_unreachable_replica_falls_back_to_the_primary():
+    router = _router(_factory(error=ConnectionRefusedError("replica down")))
+
+    assert await router.session_factory() is router.primary
+
+
+@pytest.mark.asyncio
+async def test_replica_state_is_checked_once_per_interval():
+    clock = FakeClock()
+    replica = _factory(lag=0.0)
+    router = _router(replica, clock)
+
+    await asyncio.gather(*(router.session_factory() for _ in range(10)))
+    clock.now = 4.9
+    await router.session_factory()
+    assert replica.session.scalar.await_count == 1
+
+    # The replica falls behind; the next check moves reads to the primary
+    replica.session.scalar.return_value = 45.0
+    clock.now = 5.0
+    assert await router.session_factory() is router.primary
+    assert replica.session.scalar.await_count == 2
@@ -0,0 +1,176 @@
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+import veriqko.models  # noqa: F401
+from veriqko.cron.counter_reconciler import reconcile_status_counters
+from veriqko.jobs.models import JobStatus
+from veriqko.stats.router import get_dashboard_stats
+from veriqko.stats.service import (
+    COUNTER_SHARDS,
+    TOTAL_BUCKET,
+    StatusCounterService,
+    day_bucket,
+)
+
+
+def _result(rows):
+    result = MagicMock()
+    result.all.return_value = rows
+    result.scalars.return_value.all.return_value = rows
+    return result
+
+
+def _upserted(stmt, shard=None) -> dict:
+    params = stmt.compile(dialect=postgresql.dialect()).params
+    count = len([k for k in params if k.startswith("bucket")])
+    if shard is not None:
+        assert {params[f"shard_m{i}"] for i in range(count)} == {shard}
+    return {
+        (params[f"bucket_m{i}"], params[f"status_m{i}"]): params[f"job_count_m{i}"]
+        for i in range(count)
+    }
+
+
+def _session():
+    return AsyncMock()
+
+
+@pytest.mark.asyncio
+async def test_transition_moves_total_and_counts_the_day():
+    session = _session()
+    at = datetime(2026, 10, 17, 23, 30, tzinfo=UTC)
+
+    service = StatusCounterService(session)
+    await service.record(
+        entered={JobStatus.RESET: 2},
+        left={JobStatus.INTAKE: 1, JobStatus.QC: 1},
+        at=at,
+    )
+
+    stmt = session.execute.await_args.args[0]
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert (
+        "ON CONFLICT (bucket, status, shard) DO UPDATE "
+        "SET job_count = (job_status_counters.job_count + excluded.job_count)"
+    ) in sql
+    shard = service.shard
+    assert 0 <= shard < COUNTER_SHARDS
+    assert _upserted(stmt, shard) == {
+        ("2026-10-17", JobStatus.RESET): 2,
+        (TOTAL_BUCKET, JobStatus.INTAKE): -1,
+        (TOTAL_BUCKET, JobStatus.QC): -1,
+        (TOTAL_BUCKET, JobStatus.RESET): 2,
+    }
+
+
+@pytest.mark.asyncio
+async def test_a_session_keeps_its_shard():
+    session = _session()
+    service = StatusCounterService(session)
+
+    await service.record(entered={JobStatus.RESET: 1})
+    await StatusCounterService(session).record(entered={JobStatus.QC: 1})
+
+    first, second = (call.args[0] for call in session.execute.await_args_list)
+    shard = service.shard
+    _upserted(first, shard)
+    _upserted(second, shard)
+
+
+@pytest.mark.asyncio
+async def test_record_without_changes_writes_nothing():
+    session = _session()
+
+    await StatusCounterService(session).record(left={JobStatus.QC: 0})
+
+    session.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_drift_compares_summed_shards_with_a_recount():
+    session = _session()
+    today = day_bucket(datetime.now(UTC))
+    session.execute.side_effect = [
+        # Stored counters, summed over shards
+        _result([
+            (TOTAL_BUCKET, JobStatus.INTAKE, 5),
+            (TOTAL_BUCKET, JobStatus.QC, 2),
+            (today, JobStatus.INTAKE, 4),
+        ]),
+        # Recount from jobs
+        _result([(TOTAL_BUCKET, JobStatus.INTAKE, 5), (TOTAL_BUCKET, JobStatus.COMPLETED, 1)]),
+        # Recount from history
+        _result([(today, JobStatus.INTAKE, 4)]),
+    ]
+
+    drift = await StatusCounterService(session).drift(days=7)
+
+    assert drift == {(TOTAL_BUCKET, JobStatus.COMPLETED): 1, (TOTAL_BUCKET, JobStatus.QC): -2}
+    statements = [str(call.args[0]) for call in session.execute.await_args_list]
+    assert not any("LOCK" in sql for sql in statements)
+    assert "sum(job_status_counters.job_count)" in statements[0]
+
+
+@pytest.mark.asyncio
+async def test_correction_is_added_to_shard_zero():
+    session = _session()
+
+    await StatusCounterService(session).correct({(TOTAL_BUCKET, JobStatus.QC): -2})
+
+    stmt = session.execute.await_args.args[0]
+    assert _upserted(stmt, 0) == {(TOTAL_BUCKET, JobStatus.QC): -2}
+    assert "job_status_counters.job_count + excluded.job_count" in str(
+        stmt.compile(dialect=postgresql.dialect())
+    )
+
+
+@pytest.mark.asyncio
+async def test_reconciler_recounts_on_a_snapshot_and_corrects_separately(monkeypatch):
+    sessions = []
+
+    @asynccontextmanager
+    async def factory():
+        session = _session()
+        sessions.append(session)
+        yield session
+
+    drift = {(TOTAL_BUCKET, JobStatus.QC): -2}
+    monkeypatch.setattr("veriqko.cron.counter_reconciler.async_session_factory", factory)
+    monkeypatch.setattr(StatusCounterService, "drift", AsyncMock(return_value=drift))
+
+    assert await reconcile_status_counters() == 1
+
+    snapshot, correction = sessions
+    snapshot.connection.assert_awaited_once_with(
+        execution_options={"isolation_level": "REPEATABLE READ"}
+    )
+    snapshot.commit.assert_not_awaited()
+    correction.commit.assert_awaited_once()
+    assert _upserted(correction.execute.await_args.args[0], 0) == drift
+
+
+@pytest.mark.asyncio
+async def test_dashboard_reads_counters_instead_of_scanning_jobs():
+    session = AsyncMock()
+    today = day_bucket(datetime.now(UTC))
+    session.execute.side_effect = [
+        _result([
+            (TOTAL_BUCKET, JobStatus.INTAKE, 3),
+            (TOTAL_BUCKET, JobStatus.ON_HOLD, 1),
+            (TOTAL_BUCKET, JobStatus.COMPLETED, 9),
+            (TOTAL_BUCKET, JobStatus.FAILED, 1),
+            (today, JobStatus.COMPLETED, 2),
+        ]),
+        _result([]),
+    ]
+
+    stats = await get_dashboard_stats(session=session, current_user=MagicMock())
+
+    assert stats["counts"] == {"total": 14, "completed": 9, "failed": 1, "in_progress": 3}
+    assert stats["metrics"] == {"yield_rate": 90.0}
+    assert stats["today"] == {"completed": 2}
+    assert "FROM job_status_counters" in str(session.execute.await_args_list[0].args[0])
@@ -0,0 +1,85 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import UUID
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from pydantic import ValidationError
+from sqlalchemy.dialects import postgresql
+
+import veriqko.models  # noqa: F401
+from veriqko.db.base import get_db
+from veriqko.dependencies import get_current_user
+from veriqko.jobs import schemas
+from veriqko.jobs.service import JobService
+from veriqko.main import app
+
+STEP_1 = str(UUID(int=1))
+STEP_2 = str(UUID(int=2))
+
+
+@pytest.mark.asyncio
+async def test_submit_results_is_one_upsert_statement():
+    session = AsyncMock()
+    service = JobService(session)
+
+    count = await service.submit_results(
+        "job-1",
+        [
+            schemas.TestResultBatchItem(test_step_id=STEP_1, status="pass"),
+            schemas.TestResultBatchItem(test_step_id=STEP_2, status="fail", notes="Cracked"),
+            # Re-tapped step: the last entry wins
+            schemas.TestResultBatchItem(test_step_id=STEP_1, status="skip"),
+        ],
+        "u1",
+    )
+
+    assert count == 2
+    assert session.execute.await_count == 1
+    session.commit.assert_not_awaited()
+
+    compiled = session.execute.await_args.args[0].compile(dialect=postgresql.dialect())
+    sql = str(compiled)
+    assert "ON CONFLICT ON CONSTRAINT uq_test_results_job_step DO UPDATE" in sql
+    assert "status = excluded.status" in sql
+    statuses = {v for k, v in compiled.params.items() if k.startswith("status")}
+    assert {s.value for s in statuses} == {"skip", "fail"}
+
+
+def test_batch_item_rejects_a_non_uuid_step_id():
+    with pytest.raises(ValidationError):
+        schemas.TestResultBatchItem(test_step_id="s1", status="pass")
+
+
+@pytest.fixture
+async def client():
+    session = AsyncMock()
+
+    async def override_get_db():
+        yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id="u1")
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client, session
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.parametrize(
+    ("path", "body"),
+    [
+        (f"/api/v1/jobs/{UUID(int=9)}/results/s1", {"status": "pass"}),
+        (
+            f"/api/v1/jobs/{UUID(int=9)}/results:batch",
+            {"results": [{"test_step_id": "s1", "status": "pass"}]},
+        ),
+    ],
+)
+async def test_non_uuid_step_id_is_a_422(client, path, body):
+    # Rejected before the query, which would fail with a DataError (a 500)
+    client, session = client
+
+    response = await client.post(path, json=body)
+
+    assert response.status_code == 422
+    session.execute.assert_not_awaited()
@@ -0,0 +1,82 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+import veriqko.models  # noqa: F401
+from veriqko.jobs.models import JobStatus
+from veriqko.templates.cache import StepTemplateCache
+
+
+def _session(*step_names):
+    result = MagicMock()
+    result.all.return_value = [
+        (f"id-{name}", name, None, order, True, False) for order, name in enumerate(step_names)
+    ]
+    session = AsyncMock()
+    session.execute.return_value = result
+    return session
+
+
+@pytest.mark.asyncio
+async def test_cached_steps_skip_the_database():
+    cache = StepTemplateCache(ttl_seconds=60)
+    session = _session("Screen", "Camera")
+
+    first = await cache.get(session, "dev-1", JobStatus.FUNCTIONAL)
+    second = await cache.get(session, "dev-1", JobStatus.FUNCTIONAL)
+
+    assert [s.name for s in first] == ["Screen", "Camera"]
+    assert second is first
+    assert session.execute.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_keys_are_per_device_and_station():
+    cache = StepTemplateCache(ttl_seconds=60)
+    session = _session("Screen")
+
+    await cache.get(session, "dev-1", JobStatus.FUNCTIONAL)
+    await cache.get(session, "dev-1", JobStatus.QC)
+    await cache.get(session, "dev-2", JobStatus.FUNCTIONAL)
+
+    assert session.execute.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_invalidate_forces_reload():
+    cache = StepTemplateCache(ttl_seconds=60)
+    session = _session("Screen")
+
+    await cache.get(session, "dev-1", JobStatus.FUNCTIONAL)
+    cache.invalidate()
+    await cache.get(session, "dev-1", JobStatus.FUNCTIONAL)
+
+    assert session.execute.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_load_racing_an_invalidation_is_not_stored():
+    cache = StepTemplateCache(ttl_seconds=60)
+    session = _session("Screen")
+
+    async def execute_then_edit(stmt):
+        # An admin edits templates while the read is in flight
+        cache.invalidate()
+        return session.execute.return_value
+
+    session.execute.side_effect = execute_then_edit
+    await cache.get(session, "dev-1", JobStatus.FUNCTIONAL)
+    await cache.get(session, "dev-1", JobStatus.FUNCTIONAL)
+
+    assert session.execute.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_after_ttl():
+    cache = StepTemplateCache(ttl_seconds=0)
+    session = _session("Screen")
+
+    await cache.get(session, "dev-1", JobStatus.FUNCTIONAL)
+    await cache.get(session, "dev-1", JobStatus.FUNCTIONAL)
+
+    assert session.execute.await_count == 2
@@ -0,0 +1,133 @@
+from datetime import UTC, date, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+import veriqko.models  # noqa: F401
+from veriqko.jobs.models import JobStatus
+from veriqko.stats.router import get_technician_leaderboard
+from veriqko.stats.technicians import LEADERBOARD_LIMIT, TechnicianRollupService
+
+
+def _sql(call) -> str:
+    return str(call.args[0].compile(dialect=postgresql.dialect()))
+
+
+def _session(watermark=None, touched_days=(), rows=()):
+    session = AsyncMock()
+    session.scalar.return_value = watermark
+    scalars = MagicMock()
+    scalars.all.return_value = list(touched_days)
+    session.scalars.return_value = scalars
+    result = MagicMock()
+    result.all.return_value = list(rows)
+    session.execute.return_value = result
+    return session
+
+
+def _row(user_id, name, stage, jobs, total_seconds, median_seconds):
+    return SimpleNamespace(
+        id=user_id,
+        full_name=name,
+        stage=stage,
+        jobs=jobs,
+        total_seconds=total_seconds,
+        median_seconds=median_seconds,
+    )
+
+
+@pytest.mark.asyncio
+async def test_first_refresh_rebuilds_from_all_history():
+    session = _session()
+
+    assert await TechnicianRollupService(session).refresh() is None
+
+    lock, clear, rebuild, _ = session.execute.await_args_list
+    assert "LOCK TABLE technician_stage_rollup IN EXCLUSIVE MODE" in str(lock.args[0])
+    assert _sql(clear) == "DELETE FROM technician_stage_rollup"
+    sql = _sql(rebuild)
+    assert (
+        "INSERT INTO technician_stage_rollup "
+        "(day, user_id, stage, jobs, total_seconds, median_seconds)"
+    ) in sql
+    assert "FROM job_history_archive" in sql
+    # Each stage runs from the job's previous status change
+    assert (
+        "lag(anon_2.changed_at) OVER (PARTITION BY anon_2.job_id ORDER BY anon_2.changed_at)"
+    ) in sql
+    assert "percentile_cont(" in sql
+
+
+@pytest.mark.asyncio
+async def test_refresh_rebuilds_days_with_new_history():
+    touched = [date(2026, 10, 17)]
+    session = _session(datetime(2026, 10, 17, 9, 0, tzinfo=UTC), touched)
+
+    assert await TechnicianRollupService(session).refresh() == touched
+
+    _, clear, rebuild, _ = session.execute.await_args_list
+    assert "WHERE technician_stage_rollup.day IN" in _sql(clear)
+    sql = _sql(rebuild)
+    # Whole history of the jobs that moved that day, then only that day's exits
+    assert "job_history.job_id IN (SELECT job_history.job_id" in sql
+    assert "anon_1.changed_at >=" in sql
+
+
+@pytest.mark.asyncio
+async def test_refresh_without_new_history_only_moves_the_watermark():
+    session = _session(datetime(2026, 10, 17, 9, 0, tzinfo=UTC))
+
+    assert await TechnicianRollupService(session).refresh() == []
+    assert len(session.execute.await_args_list) == 2
+
+
+@pytest.mark.asyncio
+async def test_leaderboard_credits_stages_and_ranks_by_total():
+    rows = [
+        _row("u1", "Alex", JobStatus.QC, 4, 4 * 600.0, 540.0),
+        _row("u2", "Sam", JobStatus.RESET, 3, 3 * 300.0, 300.0),
+        _row("u1", "Alex", JobStatus.INTAKE, 2, 2 * 120.0, 120.0),
+    ]
+    session = _session(rows=rows)
+
+    service = TechnicianRollupService(session)
+    board = await service.leaderboard(date(2026, 10, 1), date(2026, 10, 17))
+
+    assert [(t["name"], t["jobs_completed"]) for t in board] == [("Alex", 6), ("Sam", 3)]
+    assert board[0]["stations"] == [
+        {"name": "intake", "jobs": 2, "avg_minutes": 2.0, "median_minutes": 2.0},
+        {"name": "qc", "jobs": 4, "avg_minutes": 10.0, "median_minutes": 9.0},
+    ]
+    sql = _sql(session.execute.await_args)
+    assert "FROM technician_stage_rollup JOIN users" in sql
+    assert "job_history" not in sql
+
+
+@pytest.mark.asyncio
+async def test_leaderboard_is_limited():
+    rows = [
+        _row(f"u{i}", f"Tech {i:02d}", JobStatus.QC, 1, 60.0, 60.0)
+        for i in range(LEADERBOARD_LIMIT + 5)
+    ]
+    service = TechnicianRollupService(_session(rows=rows))
+
+    board = await service.leaderboard(date(2026, 10, 1), date(2026, 10, 1))
+
+    assert len(board) == LEADERBOARD_LIMIT
+
+
+@pytest.mark.asyncio
+async def test_endpoint_window_and_station_filter():
+    session = _session()
+
+    await get_technician_leaderboard(
+        days=7, from_=None, to=date(2026, 10, 17), station=JobStatus.QC,
+        session=session, current_user=MagicMock(),
+    )
+
+    params = session.execute.await_args.args[0].compile(dialect=postgresql.dialect()).params
+    assert date(2026, 10, 11) in params.values()
+    assert date(2026, 10, 17) in params.values()
+    assert JobStatus.QC in params.values()
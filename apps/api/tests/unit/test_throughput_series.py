@@ -0,0 +1,102 @@
+from datetime import UTC, date, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+import veriqko.models  # noqa: F401
+from veriqko.stats.router import get_throughput_series
+from veriqko.stats.throughput import (
+    parse_percentiles,
+    series_query,
+    series_window,
+    throughput_series,
+)
+
+
+def _row(bucket: datetime, completed: int, seconds: list[float]):
+    fields = {"bucket": bucket.replace(tzinfo=None), "completed": completed}
+    for name in ("intake", "reset", "functional", "qc", "total"):
+        fields[f"{name}_jobs"] = completed
+        fields[f"{name}_seconds"] = seconds
+    return SimpleNamespace(**fields)
+
+
+def _session(rows):
+    session = AsyncMock()
+    result = MagicMock()
+    result.all.return_value = rows
+    session.execute.return_value = result
+    return session
+
+
+def test_parse_percentiles():
+    assert parse_percentiles("99, 50,90,50") == [50.0, 90.0, 99.0]
+    assert parse_percentiles("99.9") == [99.9]
+    for raw in ("", "fast", "0", "100", "10,20,30,40,50,60"):
+        with pytest.raises(ValueError):
+            parse_percentiles(raw)
+
+
+def test_series_window_covers_whole_utc_days_and_caps_buckets():
+    start, end = series_window(date(2026, 10, 1), date(2026, 10, 2), "hour")
+    assert (start, end) == (datetime(2026, 10, 1, tzinfo=UTC), datetime(2026, 10, 3, tzinfo=UTC))
+
+    series_window(date(2025, 10, 1), date(2026, 9, 30), "day")
+    with pytest.raises(ValueError):
+        series_window(date(2026, 1, 1), date(2026, 3, 31), "hour")
+    with pytest.raises(ValueError):
+        series_window(date(2026, 10, 2), date(2026, 10, 1), "day")
+
+
+def test_series_query_aggregates_in_the_database():
+    start, end = series_window(date(2026, 10, 1), date(2026, 10, 1), "hour")
+    compiled = series_query("hour", start, end, [50.0, 99.0]).compile(dialect=postgresql.dialect())
+    sql = str(compiled)
+
+    assert sql.count("percentile_cont(") == 5
+    assert (
+        "WITHIN GROUP (ORDER BY EXTRACT(epoch FROM anon_1.qc_completed_at - anon_1.qc_started_at))"
+        in sql
+    )
+    assert "FROM jobs_archive" in sql
+    assert "GROUP BY date_trunc(" in sql
+    assert [0.5, 0.99] in compiled.params.values()
+
+
+@pytest.mark.asyncio
+async def test_series_fills_empty_buckets_and_converts_to_hours():
+    start, end = series_window(date(2026, 10, 1), date(2026, 10, 3), "day")
+    session = _session([_row(datetime(2026, 10, 2, tzinfo=UTC), 12, [1800.0, 7200.0])])
+
+    series = await throughput_series(session, "day", start, end, [50.0, 90.0])
+
+    assert [bucket["start"].day for bucket in series] == [1, 2, 3]
+    assert series[0]["completed"] == 0
+    assert series[0]["total"] == {"jobs": 0, "hours": {"p50": None, "p90": None}}
+    assert series[1]["completed"] == 12
+    assert series[1]["stations"][3] == {"name": "QC", "jobs": 12, "hours": {"p50": 0.5, "p90": 2.0}}
+
+
+@pytest.mark.asyncio
+async def test_endpoint_rejects_bad_percentiles():
+    with pytest.raises(HTTPException) as exc:
+        await get_throughput_series(
+            bucket="day", percentiles="50,101", days=30, from_=None, to=None,
+            session=_session([]), current_user=MagicMock(),
+        )
+    assert exc.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_endpoint_defaults_to_the_last_days():
+    response = await get_throughput_series(
+        bucket="day", percentiles="50,90,99", days=7, from_=None, to=date(2026, 10, 17),
+        session=_session([]), current_user=MagicMock(),
+    )
+
+    assert response["from"] == date(2026, 10, 11)
+    assert response["percentiles"] == [50.0, 90.0, 99.0]
+    assert len(response["series"]) == 7
@@ -0,0 +1,67 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+import veriqko.models  # noqa: F401
+from veriqko.jobs.models import Job, JobStatus
+from veriqko.jobs.service import JobService
+
+
+def _session_with_job(job: Job, evidence_exists: bool = True) -> AsyncMock:
+    session = AsyncMock()
+    session.add = MagicMock()
+    load_result = MagicMock()
+    load_result.scalar_one_or_none.return_value = job
+    session.execute.return_value = load_result
+    session.scalar.return_value = evidence_exists
+    return session
+
+
+def _statement_count(session: AsyncMock) -> int:
+    return sum(
+        getattr(session, name).await_count
+        for name in ("execute", "scalar", "scalars", "get", "refresh", "flush")
+    )
+
+
+@pytest.mark.asyncio
+async def test_transition_loads_job_once_and_probes_evidence_with_exists():
+    job = Job(id="j1", serial_number="SN1", status=JobStatus.RESET, picea_erase_confirmed=True)
+    session = _session_with_job(job)
+
+    updated, result = await JobService(session).transition("j1", "functional", "u1")
+
+    assert result.success is True
+    assert updated is job
+    assert job.status == JobStatus.FUNCTIONAL
+    assert job.reset_completed_at is not None
+    # Job load + EXISTS probe + one flush of the update and history row + counter upsert
+    assert session.execute.await_count == 2
+    assert session.scalar.await_count == 1
+    assert session.flush.await_count == 1
+    assert _statement_count(session) == 4
+
+
+@pytest.mark.asyncio
+async def test_failed_guard_does_not_write():
+    job = Job(id="j1", serial_number="SN1", status=JobStatus.RESET, picea_erase_confirmed=False)
+    session = _session_with_job(job, evidence_exists=False)
+
+    _, result = await JobService(session).transition("j1", "functional", "u1")
+
+    assert result.success is False
+    assert len(result.errors) == 2
+    assert session.flush.await_count == 0
+    assert _statement_count(session) == 2
+
+
+@pytest.mark.asyncio
+async def test_guard_reads_snapshot_without_queries():
+    job = Job(id="j1", serial_number="SN1", status=JobStatus.FUNCTIONAL)
+    session = _session_with_job(job)
+
+    _, result = await JobService(session).transition("j1", "qc", "u1")
+
+    assert result.success is True
+    assert session.scalar.await_count == 0
+    assert _statement_count(session) == 3
@@ -29,11 +29,20 @@ export interface DefectStat {
     model: string;
     test_step: string;
     count: number;
+    total: number;
+    failure_rate: number;
 }
 
 export interface TechnicianStat {
+    user_id: string;
     name: string;
     jobs_completed: number;
+    stations: Array<{
+        name: string;
+        jobs: number;
+        avg_minutes: number | null;
+        median_minutes: number | null;
+    }>;
 }
 
 export const stats = {